@@ -7,7 +7,10 @@ class Settings(BaseSettings):
     sqlite_database_url: str = "sqlite:///./fsp_chuvashia.db"
     secret_key: str = os.getenv("SESSION_SECRET", "fsp-chuvashia-secret-key-2024")
     algorithm: str = "HS256"
-    access_token_expire_minutes: int = 60 * 24 * 7
+    access_token_expire_minutes: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15"))
+    refresh_token_expire_days: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+    # Bearer token for Prometheus scrapes of /api/metrics; admins can always read it.
+    metrics_token: str = os.getenv("METRICS_TOKEN", "")
     
     telegram_api_id: str = os.getenv("TELEGRAM_API_ID", "")
     telegram_api_hash: str = os.getenv("TELEGRAM_API_HASH", "")
@@ -18,8 +21,45 @@ class Settings(BaseSettings):
     smtp_user: str = os.getenv("SMTP_USER", "")
     smtp_password: str = os.getenv("SMTP_PASSWORD", "")
     contact_email: str = "chuvashia@fsp-russia.ru"
+    # Local time of event_time values, used by the ICS feed.
+    timezone: str = os.getenv("TIMEZONE", "Europe/Moscow")
     
     upload_dir: str = "uploads/documents"
+    # Ready-made category ZIPs (services.archives), keyed by tree content hash.
+    archive_dir: str = os.getenv("ARCHIVE_DIR", "uploads/archives")
+    archive_keep: int = int(os.getenv("ARCHIVE_KEEP", "20"))
+    # Document text extraction (services.extraction): pool processes and preview images.
+    extract_workers: int = int(os.getenv("EXTRACT_WORKERS", "1"))
+    thumbnail_dir: str = os.getenv("THUMBNAIL_DIR", "uploads/thumbnails")
+    
+    slow_query_ms: float = float(os.getenv("SLOW_QUERY_MS", "100"))
+    slow_query_log_params: bool = os.getenv("SLOW_QUERY_LOG_PARAMS", "true").lower() == "true"
+    
+    # Multi-worker mode: processes share cache and invalidations through a
+    # small SQLite coordination database (services.coordination).
+    workers: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+    cache_backend: str = os.getenv("CACHE_BACKEND", "memory")
+    coordination_url: str = os.getenv("COORDINATION_URL", "sqlite:///./fsp_coordination.db")
+    invalidation_poll_ms: int = int(os.getenv("INVALIDATION_POLL_MS", "500"))
+    
+    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    # Share of successful requests written to the request log; errors are always logged.
+    log_request_sample_rate: float = float(os.getenv("LOG_REQUEST_SAMPLE_RATE", "0.01"))
+    
+    # Seconds between document integrity scrubs (services.integrity); 0 disables.
+    document_scrub_interval_s: int = int(os.getenv("DOCUMENT_SCRUB_INTERVAL_S", str(6 * 3600)))
+    # Seconds between dashboard counter recounts (services.stats); 0 disables.
+    counter_reconcile_interval_s: int = int(os.getenv("COUNTER_RECONCILE_INTERVAL_S", str(6 * 3600)))
+    
+    # Request profiler (services.profiler); switched on at runtime by an admin.
+    profile_dir: str = os.getenv("PROFILE_DIR", "profiles")
+    profile_keep: int = int(os.getenv("PROFILE_KEEP", "200"))
+    profile_interval_ms: float = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+    
+    # Live updates over SSE (services.stream), per worker.
+    stream_max_clients: int = int(os.getenv("STREAM_MAX_CLIENTS", "5000"))
+    stream_queue_size: int = int(os.getenv("STREAM_QUEUE_SIZE", "64"))
+    stream_heartbeat_s: float = float(os.getenv("STREAM_HEARTBEAT_S", "15"))
     
     class Config:
         env_file = ".env"
@@ -1,19 +1,97 @@
-from sqlalchemy import create_engine
+import logging
+import time
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import get_settings
+from .services.metrics import registry, Histogram, GaugeFunc
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
+# Handlers run their queries on the event loop, so a checkout that waits for
+# a free pooled connection blocks the very loop that would release one.
+# SQLite connections are cheap: keep a pool but never make checkout wait.
 engine = create_engine(
     settings.sqlite_database_url,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    pool_size=10,
+    max_overflow=-1
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 Base = declarative_base()
 
+db_query_duration = registry.register(Histogram(
+    "fsp_db_query_duration_seconds", "SQL statement execution time.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+))
+registry.register(GaugeFunc(
+    "fsp_db_pool_checked_out", "DB connections currently checked out of the pool.",
+    lambda: engine.pool.checkedout() if hasattr(engine.pool, "checkedout") else 0
+))
+registry.register(GaugeFunc(
+    "fsp_db_pool_size", "Configured DB connection pool size.",
+    lambda: engine.pool.size() if hasattr(engine.pool, "size") else 0
+))
+
+class QueryStats:
+    """Number of statements and total DB time for one request."""
+    __slots__ = ("count", "duration_ms")
+
+    def __init__(self):
+        self.count = 0
+        self.duration_ms = 0.0
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration_ms:.1f};desc="{self.count} queries"'
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+def start_query_stats() -> QueryStats:
+    """Begin counting queries for the current request context."""
+    stats = QueryStats()
+    _query_stats.set(stats)
+    return stats
+
+def get_query_stats() -> Optional[QueryStats]:
+    return _query_stats.get()
+
+# Start times are keyed by cursor, not stacked: a statement that fails never
+# reaches after_cursor_execute, and its entry must not be matched with the
+# next statement's end (handle_error drops it).
+
+@event.listens_for(engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", {})[id(cursor)] = time.perf_counter()
+
+@event.listens_for(engine, "handle_error")
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    cursor = getattr(exception_context.execution_context, "cursor", None)
+    if conn is not None and cursor is not None:
+        conn.info.get("query_start", {}).pop(id(cursor), None)
+
+@event.listens_for(engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("query_start", {}).pop(id(cursor), None)
+    if started is None:
+        return
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    db_query_duration.observe(elapsed_ms / 1000)
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration_ms += elapsed_ms
+    if elapsed_ms >= settings.slow_query_ms:
+        extra = {"duration_ms": round(elapsed_ms, 1), "statement": statement}
+        if settings.slow_query_log_params:
+            extra["parameters"] = repr(parameters)
+        logger.warning("Slow query", extra=extra)
+
 def get_db():
     db = SessionLocal()
     try:
@@ -22,4 +100,5 @@ def get_db():
         db.close()
 
 def init_db():
-    Base.metadata.create_all(bind=engine)
+    from .migrations import run_migrations
+    return run_migrations(engine)
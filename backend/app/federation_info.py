@@ -0,0 +1,59 @@
+FEDERATION_INFO = {
+    "full_name": "Региональная физкультурно-спортивная общественная организация «Федерация спортивного программирования по Чувашской Республике»",
+    "short_name": "РФСОО «ФСП по Чувашской Республике»",
+    "informal_names": [
+        "Федерация спортивного программирования по Чувашской Республике",
+        "ФСП по Чувашской Республике",
+        "ФСП Чувашии"
+    ],
+    "description": "Спортивное программирование – это инновационный вид спорта, где участникам необходимо реализовать качественную программу или алгоритм в условиях ограниченного времени.",
+    "disciplines": [
+        {
+            "name": "Программирование алгоритмическое",
+            "description": "Решение группы задач путем написания наиболее оптимальных программных алгоритмов в условиях ограниченного времени.",
+            "icon": "algorithm"
+        },
+        {
+            "name": "Программирование продуктовое (хакатон)",
+            "description": "Создание программных продуктов (приложений, сайтов, сервисов), отвечающих заданным требованиям и выполняющих определенные прикладные задачи.",
+            "icon": "product"
+        },
+        {
+            "name": "Программирование систем информационной безопасности",
+            "description": "Комплекс соревнований в области кибербезопасности, включающий в себя поиск и устранение системных уязвимостей, отработку кибератак и защиты от них.",
+            "icon": "security"
+        },
+        {
+            "name": "Программирование робототехники",
+            "description": "Написание кода и поведенческих алгоритмов для автономных роботов, соревнующихся по определенным правилам.",
+            "icon": "robotics"
+        },
+        {
+            "name": "Программирование БАС",
+            "description": "Написание кода для автономного полета дрона или роя дронов, а также выполнения им поставленных задач в условиях соревновательного полигона.",
+            "icon": "drone"
+        }
+    ],
+    "history": [
+        {
+            "date": "19 октября 2021",
+            "event": "Дата основания Федерации спортивного программирования России"
+        },
+        {
+            "date": "12 апреля 2022",
+            "event": "Спортивное программирование было официально признано видом спорта"
+        },
+        {
+            "date": "28 декабря 2022",
+            "event": "Создано Региональное отделение ФСП России в Чувашии"
+        },
+        {
+            "date": "03 июля 2025",
+            "event": "ФСП Чувашии получило статус юридического лица"
+        }
+    ],
+    "contacts": {
+        "telegram": "https://t.me/fspchuv",
+        "email": "chuvashia@fsp-russia.ru"
+    }
+}
@@ -0,0 +1,144 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from .database import Base
+
+# Versioned schema and data migrations. Each migration runs once, inside its
+# own transaction, and is recorded in schema_version. Workers starting at the
+# same time serialize on a database write lock (SQLite BEGIN IMMEDIATE,
+# PostgreSQL advisory lock): the loser waits, then sees the version already
+# applied and moves on.
+#
+# Migration bodies must be idempotent against databases created before this
+# runner existed, so they use checkfirst/IF NOT EXISTS style helpers.
+
+MIGRATION_LOCK_ID = 4201
+LOCK_TIMEOUT_MS = 120_000
+
+version_metadata = MetaData()
+schema_version = Table(
+    "schema_version", version_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String(200)),
+    Column("applied_at", DateTime, default=datetime.utcnow),
+)
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    apply: Callable[[Connection], None]
+
+def add_column_if_missing(conn: Connection, table_name: str, column: Column) -> None:
+    """ALTER TABLE ADD COLUMN unless the column already exists (e.g. from create_all)."""
+    existing = {c["name"] for c in inspect(conn).get_columns(table_name)}
+    if column.name not in existing:
+        column_type = column.type.compile(dialect=conn.dialect)
+        conn.execute(text(f'ALTER TABLE {table_name} ADD COLUMN "{column.name}" {column_type}'))
+
+def create_indexes(conn: Connection, table: Table, *columns: str) -> None:
+    """Create the table's declared indexes that cover only ``columns``, unless present."""
+    for index in table.indexes:
+        if set(index.columns.keys()) <= set(columns):
+            index.create(conn, checkfirst=True)
+
+def _filter_indexes(conn: Connection) -> None:
+    # A fixed list: the live metadata also declares indexes on columns that
+    # later migrations add, which do not exist yet at this point.
+    from .models.models import ContactMessage, Document, DocumentCategory, News, TeamMember
+    create_indexes(conn, News.__table__, "published_at")
+    create_indexes(conn, DocumentCategory.__table__, "parent_id")
+    create_indexes(conn, Document.__table__, "category_id")
+    create_indexes(conn, TeamMember.__table__, "category", "discipline")
+    create_indexes(conn, ContactMessage.__table__, "created_at")
+
+def _baseline(conn: Connection) -> None:
+    from .models import models  # noqa: F401 - register tables on Base.metadata
+    Base.metadata.create_all(bind=conn)
+
+def _seed(conn: Connection) -> None:
+    from .models.models import AppState
+    from .seed_data import seed_initial_data
+    # Databases seeded by the pre-migration startup hook carry this marker.
+    if conn.execute(select(AppState.key).where(AppState.key == "initial_data_seeded")).first():
+        return
+    seed_initial_data(conn)
+
+def _backfill_counters(conn: Connection) -> None:
+    from .services.stats import rebuild_counters
+    rebuild_counters(conn, commit=False)
+
+def _document_integrity_columns(conn: Connection) -> None:
+    from .models.models import Document
+    add_column_if_missing(conn, Document.__tablename__, Document.__table__.c.content_hash)
+    add_column_if_missing(conn, Document.__tablename__, Document.__table__.c.file_mtime)
+
+def _document_text_index(conn: Connection) -> None:
+    from .models.models import Document, DocumentText
+    from .services.extraction import create_search_index
+    for column in ("text_status", "page_count", "thumbnail_path"):
+        add_column_if_missing(conn, Document.__tablename__, Document.__table__.c[column])
+    DocumentText.__table__.create(conn, checkfirst=True)
+    create_indexes(conn, Document.__table__, "text_status")
+    create_search_index(conn)
+
+def _event_recurrence(conn: Connection) -> None:
+    from .models.models import Event
+    add_column_if_missing(conn, Event.__tablename__, Event.__table__.c.recurrence)
+    create_indexes(conn, Event.__table__, "recurrence")
+
+def _revoked_tokens(conn: Connection) -> None:
+    from .models.models import RevokedToken
+    RevokedToken.__table__.create(conn, checkfirst=True)
+    for index in RevokedToken.__table__.indexes:
+        index.create(conn, checkfirst=True)
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Baseline schema", _baseline),
+    Migration(2, "Seed initial content", _seed),
+    Migration(3, "Indexes for filtered and sorted columns", _filter_indexes),
+    Migration(4, "Backfill dashboard counters", _backfill_counters),
+    Migration(5, "Document content hash and mtime", _document_integrity_columns),
+    Migration(6, "Document text extraction and search index", _document_text_index),
+    Migration(7, "Event recurrence rule", _event_recurrence),
+    Migration(8, "Token revocation list", _revoked_tokens),
+]
+
+def current_version(conn: Connection) -> int:
+    return conn.execute(select(schema_version.c.version).order_by(schema_version.c.version.desc())).scalar() or 0
+
+def _lock(conn: Connection) -> None:
+    """Begin a transaction that holds the cross-process migration lock."""
+    if conn.dialect.name == "sqlite":
+        conn.exec_driver_sql(f"PRAGMA busy_timeout = {LOCK_TIMEOUT_MS}")
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+    else:
+        conn.exec_driver_sql("BEGIN")
+        if conn.dialect.name == "postgresql":
+            conn.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+
+def run_migrations(engine: Engine) -> List[int]:
+    """Apply pending migrations; returns the versions applied by this process."""
+    applied = []
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        version_metadata.create_all(bind=conn)
+        if current_version(conn) >= MIGRATIONS[-1].version:
+            return applied
+        for migration in MIGRATIONS:
+            _lock(conn)
+            try:
+                if current_version(conn) >= migration.version:
+                    conn.exec_driver_sql("COMMIT")
+                    continue
+                migration.apply(conn)
+                conn.execute(schema_version.insert().values(
+                    version=migration.version, description=migration.description
+                ))
+                conn.exec_driver_sql("COMMIT")
+            except BaseException:
+                conn.exec_driver_sql("ROLLBACK")
+                raise
+            applied.append(migration.version)
+    return applied
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Date
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Date, Float, LargeBinary
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..database import Base
@@ -11,6 +11,15 @@ class Admin(Base):
     password_hash = Column(String(255))
     created_at = Column(DateTime, default=datetime.utcnow)
 
+class RevokedToken(Base):
+    """Token or session IDs that are refused until they would have expired anyway."""
+    __tablename__ = "revoked_tokens"
+    
+    id = Column(Integer, primary_key=True)
+    jti = Column(String(64), unique=True)
+    expires_at = Column(DateTime, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
 class News(Base):
     __tablename__ = "news"
     
@@ -19,7 +28,7 @@ class News(Base):
     content = Column(Text)
     image_url = Column(String(1000), nullable=True)
     telegram_id = Column(String(100), nullable=True, unique=True)
-    published_at = Column(DateTime, default=datetime.utcnow)
+    published_at = Column(DateTime, default=datetime.utcnow, index=True)
     is_visible = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
@@ -29,10 +38,12 @@ class Event(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(500))
     description = Column(Text, nullable=True)
-    event_date = Column(Date)
+    event_date = Column(Date, index=True)
     event_time = Column(String(10), nullable=True)
     location = Column(String(500), nullable=True)
     event_type = Column(String(100), nullable=True)
+    # iCalendar RRULE subset (services.recurrence); event_date is the first occurrence.
+    recurrence = Column(String(200), nullable=True, index=True)
     is_visible = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
@@ -41,7 +52,7 @@ class DocumentCategory(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(200))
-    parent_id = Column(Integer, ForeignKey("document_categories.id"), nullable=True)
+    parent_id = Column(Integer, ForeignKey("document_categories.id"), nullable=True, index=True)
     order = Column(Integer, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
     
@@ -56,13 +67,33 @@ class Document(Base):
     filename = Column(String(500))
     file_path = Column(String(1000))
     file_size = Column(Integer, nullable=True)
-    category_id = Column(Integer, ForeignKey("document_categories.id"))
+    # File integrity index (services.integrity): SHA-256 and mtime of the file
+    # as last verified. NULL hash = not verified or file missing.
+    content_hash = Column(String(64), nullable=True)
+    file_mtime = Column(Float, nullable=True)
+    category_id = Column(Integer, ForeignKey("document_categories.id"), index=True)
     order = Column(Integer, default=0)
     is_visible = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Text extraction (services.extraction): NULL status = not processed yet,
+    # otherwise "done", "unsupported" or "failed".
+    text_status = Column(String(20), nullable=True, index=True)
+    page_count = Column(Integer, nullable=True)
+    thumbnail_path = Column(String(1000), nullable=True)
     
     category = relationship("DocumentCategory", back_populates="documents")
 
+class DocumentText(Base):
+    """Extracted document text, zlib-compressed; also the source of the search index rows."""
+    __tablename__ = "document_texts"
+    
+    document_id = Column(Integer, ForeignKey("documents.id"), primary_key=True)
+    content = Column(LargeBinary)
+    # Title and file hash as indexed, to detect when the index row is stale.
+    title = Column(String(500))
+    source_hash = Column(String(64), nullable=True)
+    extracted_at = Column(DateTime, default=datetime.utcnow)
+
 class TeamMember(Base):
     __tablename__ = "team_members"
     
@@ -70,8 +101,8 @@ class TeamMember(Base):
     full_name = Column(String(300))
     position = Column(String(200), nullable=True)
     city = Column(String(200), nullable=True)
-    category = Column(String(100))
-    discipline = Column(String(200), nullable=True)
+    category = Column(String(100), index=True)
+    discipline = Column(String(200), nullable=True, index=True)
     photo_url = Column(String(1000), nullable=True)
     order = Column(Integer, default=0)
     is_visible = Column(Boolean, default=True)
@@ -98,4 +129,29 @@ class ContactMessage(Base):
     subject = Column(String(500), nullable=True)
     message = Column(Text)
     is_read = Column(Boolean, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+class ContentCounter(Base):
+    __tablename__ = "content_counters"
+    
+    entity = Column(String(50), primary_key=True)
+    total = Column(Integer, default=0)
+    hidden = Column(Integer, default=0)
+    unread = Column(Integer, default=0)
+
+class ActivityLog(Base):
+    __tablename__ = "activity_log"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    entity = Column(String(50))
+    entity_id = Column(Integer, nullable=True)
+    action = Column(String(50))
+    title = Column(String(500), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+class AppState(Base):
+    __tablename__ = "app_state"
+    
+    key = Column(String(100), primary_key=True)
+    value = Column(String(500), nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,76 @@
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from ..database import get_db
+from ..models.models import Admin
+from ..schemas import AdminStatsResponse, DocumentScrubReport, ProfilerSettings, ProfilerStatus, ProfileInfo
+from ..services.stats import get_stats
+from ..services.profiler import profiler
+from ..services import integrity
+from ..utils.auth import get_current_admin
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+@router.get("/stats", response_model=AdminStatsResponse)
+async def get_admin_stats(
+    db: Session = Depends(get_db),
+    admin: Admin = Depends(get_current_admin)
+):
+    return get_stats(db)
+
+last_scrub: Optional[integrity.ScrubReport] = None
+
+def run_document_scrub(repair: bool = False) -> integrity.ScrubReport:
+    global last_scrub
+    last_scrub = integrity.scrub(repair=repair)
+    return last_scrub
+
+@router.get("/documents/scrub", response_model=Optional[DocumentScrubReport])
+async def get_last_document_scrub(admin: Admin = Depends(get_current_admin)):
+    return last_scrub
+
+@router.post("/documents/scrub", response_model=DocumentScrubReport)
+async def scrub_documents(repair: bool = False, admin: Admin = Depends(get_current_admin)):
+    """Reconcile uploads with the document index; ``repair`` removes orphans and accepts changed files."""
+    return await asyncio.to_thread(run_document_scrub, repair)
+
+def _profiler_status() -> ProfilerStatus:
+    return ProfilerStatus(
+        enabled=profiler.enabled,
+        sample_rate=profiler.sample_rate,
+        interval_ms=profiler.interval * 1000,
+        stored=len(profiler.list_profiles())
+    )
+
+@router.get("/profiler", response_model=ProfilerStatus)
+async def get_profiler(admin: Admin = Depends(get_current_admin)):
+    await asyncio.to_thread(profiler.refresh)
+    return await asyncio.to_thread(_profiler_status)
+
+@router.put("/profiler", response_model=ProfilerStatus)
+async def update_profiler(
+    profiler_settings: ProfilerSettings,
+    admin: Admin = Depends(get_current_admin)
+):
+    await asyncio.to_thread(profiler.configure, profiler_settings.enabled, profiler_settings.sample_rate)
+    return await asyncio.to_thread(_profiler_status)
+
+@router.get("/profiles", response_model=List[ProfileInfo])
+async def get_profiles(admin: Admin = Depends(get_current_admin)):
+    return await asyncio.to_thread(profiler.list_profiles)
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(profile_id: str, admin: Admin = Depends(get_current_admin)):
+    folded = await asyncio.to_thread(profiler.read_folded, profile_id)
+    if folded is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(folded, headers={
+        "Content-Disposition": f'attachment; filename="{profile_id}.folded"'
+    })
+
+@router.delete("/profiles")
+async def delete_profiles(admin: Admin = Depends(get_current_admin)):
+    deleted = await asyncio.to_thread(profiler.clear)
+    return {"message": f"Deleted {deleted} profiles"}
@@ -1,10 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from datetime import timedelta
+import time
 from ..database import get_db
 from ..models.models import Admin
-from ..schemas import AdminLogin, Token, AdminCreate
-from ..utils.auth import verify_password, get_password_hash, create_access_token, get_current_admin
+from ..schemas import AdminLogin, Token, AdminCreate, RefreshRequest
+from ..utils.auth import (
+    verify_password, get_password_hash, create_token_pair, verify_token,
+    get_current_admin, get_token_payload, REFRESH
+)
+from ..services import crud
+from ..services.revocation import revocations
 from ..config import get_settings
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -20,11 +25,7 @@ async def login(login_data: AdminLogin, db: Session = Depends(get_db)):
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    access_token = create_access_token(
-        data={"sub": admin.username},
-        expires_delta=timedelta(minutes=settings.access_token_expire_minutes)
-    )
-    return {"access_token": access_token, "token_type": "bearer"}
+    return create_token_pair(admin.username)
 
 @router.post("/register", response_model=Token)
 async def register(admin_data: AdminCreate, db: Session = Depends(get_db)):
@@ -42,16 +43,34 @@ async def register(admin_data: AdminCreate, db: Session = Depends(get_db)):
             detail="Admin already exists. Contact existing admin."
         )
     
-    admin = Admin(
-        username=admin_data.username,
-        password_hash=get_password_hash(admin_data.password)
-    )
-    db.add(admin)
-    db.commit()
-    db.refresh(admin)
+    admin = crud.create(db, Admin, {
+        "username": admin_data.username,
+        "password_hash": get_password_hash(admin_data.password),
+    })
     
-    access_token = create_access_token(data={"sub": admin.username})
-    return {"access_token": access_token, "token_type": "bearer"}
+    return create_token_pair(admin.username)
+
+@router.post("/refresh", response_model=Token)
+async def refresh(data: RefreshRequest, db: Session = Depends(get_db)):
+    payload = verify_token(data.refresh_token, token_type=REFRESH)
+    admin = payload and db.query(Admin).filter(Admin.username == payload.get("sub")).first()
+    # Rotation: each refresh token works once. The denylist insert is the
+    # gate, so of two concurrent refreshes (in any worker) only one succeeds.
+    if not admin or not revocations.claim(db, payload["jti"], payload["exp"]):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return create_token_pair(admin.username, sid=payload.get("sid"))
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(payload: dict = Depends(get_token_payload), db: Session = Depends(get_db)):
+    """End the session: its access token and every refresh token issued from the same login."""
+    entries = {payload["jti"]: payload["exp"]}
+    if payload.get("sid"):
+        entries[payload["sid"]] = time.time() + settings.refresh_token_expire_days * 86400
+    revocations.revoke(db, entries)
 
 @router.get("/me")
 async def get_current_admin_info(admin: Admin = Depends(get_current_admin)):
@@ -1,23 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
 from sqlalchemy.orm import Session
-from typing import List
-import aiosmtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from typing import List, Literal, Optional
+from datetime import date
+import logging
+import time
 from ..database import get_db
 from ..models.models import ContactMessage, Admin
-from ..schemas import ContactMessageCreate, ContactMessageResponse
+from ..schemas import ContactMessageCreate, ContactMessageResponse, BatchRequest, BatchResponse
+from ..services import crud
+from ..services.batch import apply_batch
+from ..services.export import date_filters, export_response
+from ..services.metrics import email_queue_depth, email_send_duration, email_sent
 from ..utils.auth import get_current_admin
 from ..config import get_settings
 
 router = APIRouter(prefix="/contact", tags=["contact"])
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 async def send_email_notification(message: ContactMessage):
+    try:
+        await _send_email_notification(message)
+    finally:
+        email_queue_depth.dec()
+
+async def _send_email_notification(message: ContactMessage):
     if not settings.smtp_user or not settings.smtp_password:
-        print("SMTP not configured, skipping email notification")
+        logger.info("SMTP not configured, skipping email notification")
+        email_sent.labels("skipped").inc()
         return
     
+    import aiosmtplib
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+    
     try:
         msg = MIMEMultipart()
         msg['From'] = settings.smtp_user
@@ -36,6 +52,7 @@ Email: {message.email}
         """
         msg.attach(MIMEText(body, 'plain', 'utf-8'))
         
+        started = time.perf_counter()
         await aiosmtplib.send(
             msg,
             hostname=settings.smtp_host,
@@ -44,9 +61,12 @@ Email: {message.email}
             password=settings.smtp_password,
             start_tls=True
         )
-        print(f"Email notification sent for message from {message.email}")
-    except Exception as e:
-        print(f"Failed to send email notification: {e}")
+        email_send_duration.observe(time.perf_counter() - started)
+        email_sent.labels("sent").inc()
+        logger.info("Email notification sent", extra={"contact_message_id": message.id})
+    except Exception:
+        email_sent.labels("failed").inc()
+        logger.exception("Failed to send email notification", extra={"contact_message_id": message.id})
 
 @router.post("", response_model=ContactMessageResponse)
 async def send_contact_message(
@@ -54,11 +74,9 @@ async def send_contact_message(
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
-    message = ContactMessage(**message_data.model_dump())
-    db.add(message)
-    db.commit()
-    db.refresh(message)
+    message = crud.create(db, ContactMessage, message_data.model_dump())
     
+    email_queue_depth.inc()
     background_tasks.add_task(send_email_notification, message)
     
     return message
@@ -78,18 +96,30 @@ async def get_contact_messages(
     messages = query.order_by(ContactMessage.created_at.desc()).offset(skip).limit(limit).all()
     return messages
 
+@router.get("/export")
+async def export_contact_messages(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    unread_only: bool = False,
+    admin: Admin = Depends(get_current_admin)
+):
+    filters = date_filters(ContactMessage.created_at, date_from, date_to)
+    if unread_only:
+        filters.append(ContactMessage.is_read == False)
+    return export_response(
+        [getattr(ContactMessage, column.key) for column in ContactMessage.__table__.columns],
+        filters, ContactMessage.created_at.desc(), format, "contact-messages"
+    )
+
 @router.put("/{message_id}/read")
 async def mark_message_read(
     message_id: int,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    message = db.query(ContactMessage).filter(ContactMessage.id == message_id).first()
-    if not message:
+    if crud.update_by_id(db, ContactMessage, message_id, {"is_read": True}) is None:
         raise HTTPException(status_code=404, detail="Message not found")
-    
-    message.is_read = True
-    db.commit()
     return {"message": "Message marked as read"}
 
 @router.delete("/{message_id}")
@@ -98,10 +128,15 @@ async def delete_contact_message(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    message = db.query(ContactMessage).filter(ContactMessage.id == message_id).first()
-    if not message:
+    if crud.delete_by_id(db, ContactMessage, message_id) is None:
         raise HTTPException(status_code=404, detail="Message not found")
-    
-    db.delete(message)
-    db.commit()
     return {"message": "Message deleted successfully"}
+
+@router.post("/batch", response_model=BatchResponse)
+async def batch_contact_messages(
+    batch: BatchRequest,
+    db: Session = Depends(get_db),
+    admin: Admin = Depends(get_current_admin)
+):
+    response, _ = apply_batch(db, ContactMessage, batch.operations)
+    return response
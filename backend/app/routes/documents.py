@@ -1,15 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, UploadFile, File, Form
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import os
-import aiofiles
+import uuid
+from urllib.parse import quote
 from ..database import get_db
 from ..models.models import Document, DocumentCategory, Admin
 from ..schemas import (
     DocumentCategoryCreate, DocumentCategoryUpdate, DocumentCategoryResponse,
-    DocumentResponse
+    DocumentResponse, DocumentUpdate, BatchRequest, BatchResponse,
+    BulkUploadResponse, UploadProgressResponse, DocumentSearchResult
 )
+from ..services import archives, crud, extraction, files, projections
+from ..services.uploads import upload_progress, is_archive, stage_archive, stage_file, StagedFile
+from ..services.batch import apply_batch
 from ..utils.auth import get_current_admin
 from ..config import get_settings
 
@@ -18,10 +24,25 @@ settings = get_settings()
 
 @router.get("/categories", response_model=List[DocumentCategoryResponse])
 async def get_categories(db: Session = Depends(get_db)):
-    categories = db.query(DocumentCategory).filter(
-        DocumentCategory.parent_id == None
-    ).order_by(DocumentCategory.order).all()
-    return categories
+    """The category tree with visible documents: one query plus the documents projection."""
+    groups = (await projections.documents.aview()).groups
+    nodes = {
+        category.id: DocumentCategoryResponse(
+            id=category.id, name=category.name, parent_id=category.parent_id, order=category.order,
+            created_at=category.created_at, documents=groups.get(category.id, [])
+        )
+        for category in db.execute(select(
+            DocumentCategory.id, DocumentCategory.name, DocumentCategory.parent_id,
+            DocumentCategory.order, DocumentCategory.created_at
+        ).order_by(DocumentCategory.order, DocumentCategory.id))
+    }
+    roots = []
+    for node in nodes.values():
+        if node.parent_id is None:
+            roots.append(node)
+        elif node.parent_id in nodes:
+            nodes[node.parent_id].children.append(node)
+    return roots
 
 @router.get("/categories/{category_id}", response_model=DocumentCategoryResponse)
 async def get_category(category_id: int, db: Session = Depends(get_db)):
@@ -30,17 +51,33 @@ async def get_category(category_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Category not found")
     return category
 
+@router.get("/categories/{category_id}/archive")
+async def download_category_archive(category_id: int, request: Request, db: Session = Depends(get_db)):
+    """ZIP of the category and its subcategories, folders mirroring the tree."""
+    manifest = await archives.get_manifest(db, category_id)
+    if manifest is None:
+        raise HTTPException(status_code=404, detail="Category not found")
+
+    etag = f'"{manifest.tree_hash}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    filename = f"{manifest.name}.zip"
+    path = archives.artifact_path(manifest)
+    if await files.exists(path):
+        return FileResponse(path, filename=filename, media_type="application/zip", headers={"ETag": etag})
+    return StreamingResponse(
+        archives.stream_archive(manifest),
+        media_type="application/zip",
+        headers={"ETag": etag, "Content-Disposition": f"attachment; filename*=utf-8''{quote(filename)}"},
+    )
+
 @router.post("/categories", response_model=DocumentCategoryResponse)
 async def create_category(
     category_data: DocumentCategoryCreate,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    category = DocumentCategory(**category_data.model_dump())
-    db.add(category)
-    db.commit()
-    db.refresh(category)
-    return category
+    return crud.create(db, DocumentCategory, category_data.model_dump())
 
 @router.put("/categories/{category_id}", response_model=DocumentCategoryResponse)
 async def update_category(
@@ -49,16 +86,9 @@ async def update_category(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    category = db.query(DocumentCategory).filter(DocumentCategory.id == category_id).first()
+    category = crud.update_by_id(db, DocumentCategory, category_id, category_data.model_dump(exclude_unset=True))
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
-    
-    update_data = category_data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(category, key, value)
-    
-    db.commit()
-    db.refresh(category)
     return category
 
 @router.delete("/categories/{category_id}")
@@ -67,18 +97,16 @@ async def delete_category(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    category = db.query(DocumentCategory).filter(DocumentCategory.id == category_id).first()
-    if not category:
-        raise HTTPException(status_code=404, detail="Category not found")
-    
-    if category.documents or category.children:
+    has_documents = db.query(Document.id).filter(Document.category_id == category_id).first()
+    has_children = db.query(DocumentCategory.id).filter(DocumentCategory.parent_id == category_id).first()
+    if has_documents or has_children:
         raise HTTPException(
             status_code=400,
             detail="Cannot delete category with documents or subcategories"
         )
     
-    db.delete(category)
-    db.commit()
+    if crud.delete_by_id(db, DocumentCategory, category_id) is None:
+        raise HTTPException(status_code=404, detail="Category not found")
     return {"message": "Category deleted successfully"}
 
 @router.get("", response_model=List[DocumentResponse])
@@ -87,14 +115,26 @@ async def get_documents(
     include_hidden: bool = False,
     db: Session = Depends(get_db)
 ):
+    if not include_hidden:
+        view = await projections.documents.aview()
+        return view.response(view.groups.get(category_id, []) if category_id else view.rows)
+    
     query = db.query(Document)
     if category_id:
         query = query.filter(Document.category_id == category_id)
-    if not include_hidden:
-        query = query.filter(Document.is_visible == True)
-    
-    documents = query.order_by(Document.order).all()
-    return documents
+    return query.order_by(Document.order).all()
+
+@router.get("/search", response_model=List[DocumentSearchResult])
+async def search_documents(
+    q: str = Query(..., min_length=2, max_length=200),
+    limit: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_db)
+):
+    """Full-text search over titles and extracted PDF/DOCX text."""
+    return [
+        DocumentSearchResult.model_validate(document).model_copy(update={"snippet": snippet})
+        for document, snippet in extraction.search(db, q, limit)
+    ]
 
 @router.post("", response_model=DocumentResponse)
 async def upload_document(
@@ -105,33 +145,140 @@ async def upload_document(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    category = db.query(DocumentCategory).filter(DocumentCategory.id == category_id).first()
-    if not category:
+    if not db.query(DocumentCategory.id).filter(DocumentCategory.id == category_id).first():
         raise HTTPException(status_code=404, detail="Category not found")
     
-    os.makedirs(settings.upload_dir, exist_ok=True)
+    await files.makedirs(settings.upload_dir)
     
-    import uuid
     file_ext = os.path.splitext(file.filename)[1]
     unique_filename = f"{uuid.uuid4()}{file_ext}"
     file_path = os.path.join(settings.upload_dir, unique_filename)
     
-    content = await file.read()
-    async with aiofiles.open(file_path, 'wb') as out_file:
-        await out_file.write(content)
+    stored = await files.save(file.file, file_path)
+    try:
+        return crud.create(db, Document, {
+            "title": title,
+            "filename": file.filename,
+            "file_path": file_path,
+            "file_size": stored.size,
+            "content_hash": stored.content_hash,
+            "file_mtime": stored.mtime,
+            "category_id": category_id,
+            "order": order,
+        })
+    except Exception:
+        files.cleanup.submit([file_path])
+        raise
+
+def _resolve_categories(db: Session, root_id: int, staged: List[StagedFile]) -> Tuple[Dict[tuple, int], int]:
+    """Map every folder path in ``staged`` to a category below ``root_id``, creating missing ones."""
+    ids: Dict[tuple, int] = {(): root_id}
+    children: Dict[int, Dict[str, int]] = {}
+    created = 0
+    for folders in sorted({s.folders for s in staged}):
+        for depth in range(1, len(folders) + 1):
+            path = folders[:depth]
+            if path in ids:
+                continue
+            parent_id = ids[path[:-1]]
+            if parent_id not in children:
+                children[parent_id] = {
+                    name: category_id for category_id, name in db.query(DocumentCategory.id, DocumentCategory.name)
+                    .filter(DocumentCategory.parent_id == parent_id)
+                }
+            existing = children[parent_id].get(path[-1])
+            if existing is None:
+                existing = crud.create(db, DocumentCategory, {
+                    "name": path[-1], "parent_id": parent_id, "order": len(children[parent_id])
+                }, commit=False).id
+                children[parent_id][path[-1]] = existing
+                created += 1
+            ids[path] = existing
+    return ids, created
+
+@router.post("/bulk", response_model=BulkUploadResponse)
+async def bulk_upload_documents(
+    uploads: List[UploadFile] = File(...),
+    category_id: int = Form(...),
+    upload_id: Optional[str] = Form(None),
+    db: Session = Depends(get_db),
+    admin: Admin = Depends(get_current_admin)
+):
+    """Upload several files and/or ZIP archives into ``category_id`` in one transaction.
+
+    Archive folders become subcategories (reused when a category with the same
+    name already exists at that level). Poll ``GET /documents/uploads/{upload_id}``
+    for progress while the files are being stored.
+    """
+    if not db.query(DocumentCategory.id).filter(DocumentCategory.id == category_id).first():
+        raise HTTPException(status_code=404, detail="Category not found")
     
-    document = Document(
-        title=title,
-        filename=file.filename,
-        file_path=file_path,
-        file_size=len(content),
-        category_id=category_id,
-        order=order
+    await files.makedirs(settings.upload_dir)
+    progress = upload_progress.start(upload_id)
+    staged: List[StagedFile] = []
+    skipped: List[str] = []
+    try:
+        for upload in uploads:
+            if is_archive(upload.filename, upload.content_type):
+                skipped += await files.run_in_pool(stage_archive, upload.file, settings.upload_dir, progress, staged)
+            else:
+                progress.files_total += 1
+                staged.append(await files.run_in_pool(
+                    stage_file, upload.file, upload.filename, settings.upload_dir, progress
+                ))
+        
+        category_ids, created_categories = _resolve_categories(db, category_id, staged)
+        next_order = dict(
+            db.query(Document.category_id, func.max(Document.order))
+            .filter(Document.category_id.in_(set(category_ids.values())))
+            .group_by(Document.category_id).all()
+        )
+        rows = []
+        for entry in staged:
+            target = category_ids[entry.folders]
+            order = next_order.get(target)
+            next_order[target] = order = 0 if order is None else order + 1
+            rows.append({
+                "title": os.path.splitext(entry.filename)[0],
+                "filename": entry.filename,
+                "file_path": entry.path,
+                "file_size": entry.stored.size,
+                "content_hash": entry.stored.content_hash,
+                "file_mtime": entry.stored.mtime,
+                "category_id": target,
+                "order": order,
+            })
+        documents = crud.create_many(db, Document, rows)
+    except Exception as e:
+        db.rollback()
+        files.cleanup.submit(entry.path for entry in staged)
+        progress.status, progress.detail = "failed", str(e)
+        if isinstance(e, ValueError):
+            raise HTTPException(status_code=400, detail=str(e))
+        raise
+    
+    progress.status = "done"
+    return BulkUploadResponse(
+        upload_id=progress.upload_id, documents=documents,
+        created_categories=created_categories, skipped=skipped
     )
-    db.add(document)
-    db.commit()
-    db.refresh(document)
-    return document
+
+@router.get("/uploads/{upload_id}", response_model=UploadProgressResponse)
+async def get_upload_progress(upload_id: str, admin: Admin = Depends(get_current_admin)):
+    progress = upload_progress.get(upload_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return progress
+
+@router.post("/batch", response_model=BatchResponse)
+async def batch_documents(
+    batch: BatchRequest,
+    db: Session = Depends(get_db),
+    admin: Admin = Depends(get_current_admin)
+):
+    response, deleted = apply_batch(db, Document, batch.operations, DocumentUpdate, returning=(Document.file_path,))
+    files.cleanup.submit(document.file_path for document in deleted)
+    return response
 
 @router.get("/{document_id}/download")
 async def download_document(document_id: int, db: Session = Depends(get_db)):
@@ -139,28 +286,38 @@ async def download_document(document_id: int, db: Session = Depends(get_db)):
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    if not os.path.exists(document.file_path):
+    # A verified hash does not mean the file is still there: it may have been
+    # removed out of band since the last scrub. One stat both checks that and
+    # feeds FileResponse, which would otherwise stat the file again.
+    try:
+        stat_result = await files.stat(document.file_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="File not found")
     
     return FileResponse(
         document.file_path,
         filename=document.filename,
-        media_type='application/octet-stream'
+        media_type='application/octet-stream',
+        stat_result=stat_result
     )
 
+@router.get("/{document_id}/thumbnail")
+async def get_document_thumbnail(document_id: int, db: Session = Depends(get_db)):
+    thumbnail_path = db.query(Document.thumbnail_path).filter(Document.id == document_id).scalar()
+    if not thumbnail_path or not await files.exists(thumbnail_path):
+        raise HTTPException(status_code=404, detail="Thumbnail not found")
+    return FileResponse(thumbnail_path)
+
 @router.delete("/{document_id}")
 async def delete_document(
     document_id: int,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    document = db.query(Document).filter(Document.id == document_id).first()
-    if not document:
+    deleted = crud.delete_by_id(db, Document, document_id, Document.file_path, commit=False)
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    if os.path.exists(document.file_path):
-        os.remove(document.file_path)
-    
-    db.delete(document)
+    files.remove_after_commit(db, deleted.file_path)
     db.commit()
     return {"message": "Document deleted successfully"}
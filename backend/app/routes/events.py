@@ -1,14 +1,46 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 from datetime import date
 from ..database import get_db
 from ..models.models import Event, Admin
-from ..schemas import EventCreate, EventUpdate, EventResponse
+from ..schemas import EventCreate, EventUpdate, EventResponse, CalendarResponse, BatchRequest, BatchResponse
+from ..services import crud, projections, recurrence
+from ..services.cache import cache
+from ..services.ics import ics_feed
+from ..services.batch import apply_batch
 from ..utils.auth import get_current_admin
 
 router = APIRouter(prefix="/events", tags=["events"])
 
+def date_range(year: int, month: Optional[int] = None) -> Tuple[date, date]:
+    """Half-open [start, end) range for a month or a whole year."""
+    if month is None:
+        return date(year, 1, 1), date(year + 1, 1, 1)
+    if month == 12:
+        return date(year, 12, 1), date(year + 1, 1, 1)
+    return date(year, month, 1), date(year, month + 1, 1)
+
+def single_in(view: projections.View, start: date, end: date) -> List[EventResponse]:
+    """Visible one-off events in [start, end), by date."""
+    return [event for event in view.between((start,), (end,)) if not event.recurrence]
+
+def expand(events: Iterable[EventResponse], start: date, end: date) -> List[Tuple[EventResponse, date]]:
+    """Occurrences in [start, end) of recurring ``events``, expanded from their rules."""
+    return [
+        (event, day)
+        for event in events
+        for day in recurrence.in_window(event.recurrence, event.event_date, start, end)
+    ]
+
+def occurrences_in(view: projections.View, start: date, end: date) -> List[Tuple[EventResponse, date]]:
+    """Occurrences of visible recurring events in [start, end)."""
+    return expand((event for event in view.between((date.min,), (end,)) if event.recurrence), start, end)
+
+def as_occurrence(event: EventResponse, day: date) -> EventResponse:
+    return event if event.event_date == day else event.model_copy(update={"event_date": day})
+
 @router.get("", response_model=List[EventResponse])
 async def get_events(
     skip: int = 0,
@@ -18,34 +50,97 @@ async def get_events(
     year: Optional[int] = None,
     db: Session = Depends(get_db)
 ):
-    query = db.query(Event)
-    if not include_hidden:
-        query = query.filter(Event.is_visible == True)
-    
-    if month and year:
-        from sqlalchemy import extract
-        query = query.filter(
-            extract('month', Event.event_date) == month,
-            extract('year', Event.event_date) == year
-        )
+    """Events as stored; with ``year`` (and ``month``), every occurrence in that period.
+
+    Public listings come from the events projection; ``include_hidden``
+    (admin) reads the table.
+    """
+    if not year:
+        if include_hidden:
+            return db.query(Event).order_by(Event.event_date.asc()).offset(skip).limit(limit).all()
+        view = await projections.events.aview()
+        return view.response(view.rows[skip:skip + limit])
     
-    events = query.order_by(Event.event_date.asc()).offset(skip).limit(limit).all()
-    return events
+    start, end = date_range(year, month)
+    if include_hidden:
+        single = [
+            EventResponse.model_validate(event) for event in db.query(Event).filter(
+                Event.recurrence.is_(None), Event.event_date >= start, Event.event_date < end
+            ).order_by(Event.event_date.asc()).limit(skip + limit)
+        ]
+        occurrences = expand([
+            EventResponse.model_validate(event) for event in db.query(Event).filter(
+                Event.recurrence.isnot(None), Event.event_date < end
+            )
+        ], start, end)
+    else:
+        view = await projections.events.aview()
+        single = single_in(view, start, end)[:skip + limit]
+        occurrences = occurrences_in(view, start, end)
+    events = [(event, event.event_date) for event in single] + occurrences
+    events.sort(key=lambda pair: (pair[1], pair[0].id))
+    return [as_occurrence(event, day) for event, day in events[skip:skip + limit]]
+
+def upcoming_occurrences(view: projections.View, limit: int) -> List[EventResponse]:
+    """The next ``limit`` occurrences from today, one-off and recurring events merged."""
+    today = date.today()
+    single = single_in(view, today, date.max)[:limit]
+    recurring = [event for event in view.rows if event.recurrence]
+    events = recurrence.upcoming(
+        [(event, event.event_date, event.recurrence) for event in single + recurring], today, limit
+    )
+    return [as_occurrence(event, day) for event, day in events]
 
 @router.get("/upcoming", response_model=List[EventResponse])
-async def get_upcoming_events(
-    limit: int = 5,
-    db: Session = Depends(get_db)
+async def get_upcoming_events(limit: int = 5):
+    return upcoming_occurrences(await projections.events.aview(), limit)
+
+@router.get("/calendar", response_model=CalendarResponse)
+async def get_events_calendar(
+    year: int = Query(..., ge=1900, le=2100),
+    month: Optional[int] = Query(None, ge=1, le=12),
 ):
-    today = date.today()
-    events = db.query(Event).filter(
-        Event.is_visible == True,
-        Event.event_date >= today
-    ).order_by(Event.event_date.asc()).limit(limit).all()
-    return events
+    key = ("events:calendar", year, month)
+    calendar = await cache.aget(key)
+    if calendar is not None:
+        return calendar
+    
+    start, end = date_range(year, month)
+    view = await projections.events.aview()
+    rows = [(event.event_date, event.event_type) for event in single_in(view, start, end)]
+    rows += [(day, event.event_type) for event, day in occurrences_in(view, start, end)]
+    
+    days = {}
+    for event_date, event_type in sorted(rows, key=lambda row: row[0]):
+        day = days.setdefault(event_date, {"date": event_date, "count": 0, "event_types": []})
+        day["count"] += 1
+        if event_type and event_type not in day["event_types"]:
+            day["event_types"].append(event_type)
+    
+    calendar = CalendarResponse(year=year, month=month, days=list(days.values()))
+    await cache.aset(key, calendar, tags=[Event.__tablename__])
+    return calendar
+
+@router.get(".ics", response_class=Response)
+async def get_events_ics(request: Request):
+    """iCalendar subscription feed (served as /api/events.ics); answers 304 when unchanged.
+
+    A matching ETag is answered from memory; a rebuild runs in the threadpool.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    etag = ics_feed.etag
+    if etag is None or if_none_match != etag:
+        body, etag = await asyncio.to_thread(ics_feed.get)
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=300"}
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="text/calendar; charset=utf-8", headers=headers)
 
 @router.get("/{event_id}", response_model=EventResponse)
 async def get_event(event_id: int, db: Session = Depends(get_db)):
+    view = await projections.events.aview()
+    if event_id in view.by_id:
+        return view.item_response(view.by_id[event_id])
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
@@ -57,10 +152,7 @@ async def create_event(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    event = Event(**event_data.model_dump())
-    db.add(event)
-    db.commit()
-    db.refresh(event)
+    event = crud.create(db, Event, event_data.model_dump())
     return event
 
 @router.put("/{event_id}", response_model=EventResponse)
@@ -70,16 +162,9 @@ async def update_event(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = crud.update_by_id(db, Event, event_id, event_data.model_dump(exclude_unset=True))
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    
-    update_data = event_data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(event, key, value)
-    
-    db.commit()
-    db.refresh(event)
     return event
 
 @router.delete("/{event_id}")
@@ -88,10 +173,15 @@ async def delete_event(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
+    if crud.delete_by_id(db, Event, event_id) is None:
         raise HTTPException(status_code=404, detail="Event not found")
-    
-    db.delete(event)
-    db.commit()
     return {"message": "Event deleted successfully"}
+
+@router.post("/batch", response_model=BatchResponse)
+async def batch_events(
+    batch: BatchRequest,
+    db: Session = Depends(get_db),
+    admin: Admin = Depends(get_current_admin)
+):
+    response, _ = apply_batch(db, Event, batch.operations, EventUpdate)
+    return response
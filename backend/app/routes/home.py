@@ -0,0 +1,41 @@
+import json
+from datetime import date
+from fastapi import APIRouter, Response
+from ..federation_info import FEDERATION_INFO
+from ..models.models import Event, News
+from ..services import projections
+from ..services.cache import cache
+from .events import upcoming_occurrences
+
+router = APIRouter(tags=["home"])
+
+HOME_EVENTS_LIMIT = 3
+HOME_NEWS_LIMIT = 4
+
+@router.get("/info")
+async def get_federation_info():
+    return FEDERATION_INFO
+
+async def build_home_payload() -> bytes:
+    events = upcoming_occurrences(await projections.events.aview(), HOME_EVENTS_LIMIT)
+    news = (await projections.news.aview()).rows[:HOME_NEWS_LIMIT]
+    payload = {
+        "info": FEDERATION_INFO,
+        "upcoming_events": [e.model_dump(mode="json") for e in events],
+        "latest_news": [n.model_dump(mode="json") for n in news],
+    }
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+@router.get("/home")
+async def get_home():
+    """Everything the home page needs in one pre-serialized, cached response.
+
+    The cache entry is dropped when news or events change; the upcoming
+    events window also moves with the date, so the key includes today.
+    """
+    key = ("home", date.today())
+    body = await cache.aget(key)
+    if body is None:
+        body = await build_home_payload()
+        await cache.aset(key, body, tags=[News.__tablename__, Event.__tablename__, "info"])
+    return Response(content=body, media_type="application/json")
@@ -3,7 +3,9 @@ from sqlalchemy.orm import Session
 from typing import List
 from ..database import get_db
 from ..models.models import LeadershipMember, Admin
-from ..schemas import LeadershipMemberCreate, LeadershipMemberUpdate, LeadershipMemberResponse
+from ..schemas import LeadershipMemberCreate, LeadershipMemberUpdate, LeadershipMemberResponse, BatchRequest, BatchResponse
+from ..services import crud, projections
+from ..services.batch import apply_batch
 from ..utils.auth import get_current_admin
 
 router = APIRouter(prefix="/leadership", tags=["leadership"])
@@ -13,15 +15,16 @@ async def get_leadership_members(
     include_hidden: bool = False,
     db: Session = Depends(get_db)
 ):
-    query = db.query(LeadershipMember)
     if not include_hidden:
-        query = query.filter(LeadershipMember.is_visible == True)
-    
-    members = query.order_by(LeadershipMember.order).all()
-    return members
+        view = await projections.leadership.aview()
+        return view.response(view.rows)
+    return db.query(LeadershipMember).order_by(LeadershipMember.order).all()
 
 @router.get("/{member_id}", response_model=LeadershipMemberResponse)
 async def get_leadership_member(member_id: int, db: Session = Depends(get_db)):
+    view = await projections.leadership.aview()
+    if member_id in view.by_id:
+        return view.item_response(view.by_id[member_id])
     member = db.query(LeadershipMember).filter(LeadershipMember.id == member_id).first()
     if not member:
         raise HTTPException(status_code=404, detail="Leadership member not found")
@@ -33,10 +36,7 @@ async def create_leadership_member(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    member = LeadershipMember(**member_data.model_dump())
-    db.add(member)
-    db.commit()
-    db.refresh(member)
+    member = crud.create(db, LeadershipMember, member_data.model_dump())
     return member
 
 @router.put("/{member_id}", response_model=LeadershipMemberResponse)
@@ -46,16 +46,9 @@ async def update_leadership_member(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    member = db.query(LeadershipMember).filter(LeadershipMember.id == member_id).first()
+    member = crud.update_by_id(db, LeadershipMember, member_id, member_data.model_dump(exclude_unset=True))
     if not member:
         raise HTTPException(status_code=404, detail="Leadership member not found")
-    
-    update_data = member_data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(member, key, value)
-    
-    db.commit()
-    db.refresh(member)
     return member
 
 @router.delete("/{member_id}")
@@ -64,10 +57,15 @@ async def delete_leadership_member(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    member = db.query(LeadershipMember).filter(LeadershipMember.id == member_id).first()
-    if not member:
+    if crud.delete_by_id(db, LeadershipMember, member_id) is None:
         raise HTTPException(status_code=404, detail="Leadership member not found")
-    
-    db.delete(member)
-    db.commit()
     return {"message": "Leadership member deleted successfully"}
+
+@router.post("/batch", response_model=BatchResponse)
+async def batch_leadership_members(
+    batch: BatchRequest,
+    db: Session = Depends(get_db),
+    admin: Admin = Depends(get_current_admin)
+):
+    response, _ = apply_batch(db, LeadershipMember, batch.operations, LeadershipMemberUpdate)
+    return response
@@ -1,28 +1,52 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Literal, Optional
+from datetime import date
 from ..database import get_db
 from ..models.models import News, Admin
-from ..schemas import NewsCreate, NewsUpdate, NewsResponse
+from ..schemas import NewsCreate, NewsUpdate, NewsResponse, BatchRequest, BatchResponse
+from ..services import crud, projections
+from ..services.batch import apply_batch
+from ..services.export import date_filters, export_response
 from ..utils.auth import get_current_admin
 
 router = APIRouter(prefix="/news", tags=["news"])
 
+NEWS_PAGE_SIZE = 20
+
 @router.get("", response_model=List[NewsResponse])
 async def get_news(
     skip: int = 0,
-    limit: int = 20,
+    limit: int = NEWS_PAGE_SIZE,
     include_hidden: bool = False,
     db: Session = Depends(get_db)
 ):
-    query = db.query(News)
     if not include_hidden:
-        query = query.filter(News.is_visible == True)
-    news = query.order_by(News.published_at.desc()).offset(skip).limit(limit).all()
-    return news
+        view = await projections.news.aview()
+        return view.response(view.rows[skip:skip + limit])
+    return db.query(News).order_by(News.published_at.desc()).offset(skip).limit(limit).all()
+
+@router.get("/export")
+async def export_news(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    include_hidden: bool = True,
+    admin: Admin = Depends(get_current_admin)
+):
+    filters = date_filters(News.published_at, date_from, date_to)
+    if not include_hidden:
+        filters.append(News.is_visible == True)
+    return export_response(
+        [getattr(News, column.key) for column in News.__table__.columns],
+        filters, News.published_at.desc(), format, "news"
+    )
 
 @router.get("/{news_id}", response_model=NewsResponse)
 async def get_news_item(news_id: int, db: Session = Depends(get_db)):
+    view = await projections.news.aview()
+    if news_id in view.by_id:
+        return view.item_response(view.by_id[news_id])
     news = db.query(News).filter(News.id == news_id).first()
     if not news:
         raise HTTPException(status_code=404, detail="News not found")
@@ -34,10 +58,7 @@ async def create_news(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    news = News(**news_data.model_dump())
-    db.add(news)
-    db.commit()
-    db.refresh(news)
+    news = crud.create(db, News, news_data.model_dump())
     return news
 
 @router.put("/{news_id}", response_model=NewsResponse)
@@ -47,16 +68,9 @@ async def update_news(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    news = db.query(News).filter(News.id == news_id).first()
+    news = crud.update_by_id(db, News, news_id, news_data.model_dump(exclude_unset=True))
     if not news:
         raise HTTPException(status_code=404, detail="News not found")
-    
-    update_data = news_data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(news, key, value)
-    
-    db.commit()
-    db.refresh(news)
     return news
 
 @router.delete("/{news_id}")
@@ -65,10 +79,15 @@ async def delete_news(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    news = db.query(News).filter(News.id == news_id).first()
-    if not news:
+    if crud.delete_by_id(db, News, news_id) is None:
         raise HTTPException(status_code=404, detail="News not found")
-    
-    db.delete(news)
-    db.commit()
     return {"message": "News deleted successfully"}
+
+@router.post("/batch", response_model=BatchResponse)
+async def batch_news(
+    batch: BatchRequest,
+    db: Session = Depends(get_db),
+    admin: Admin = Depends(get_current_admin)
+):
+    response, _ = apply_batch(db, News, batch.operations, NewsUpdate)
+    return response
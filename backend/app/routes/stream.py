@@ -0,0 +1,16 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from ..services.stream import broker
+
+router = APIRouter(tags=["stream"])
+
+@router.get("/stream")
+async def stream_updates():
+    """Server-sent events: ``news`` and ``events`` messages with the action and row ids that changed."""
+    if broker.full:
+        raise HTTPException(status_code=503, detail="Too many live connections")
+    return StreamingResponse(
+        broker.listen(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -3,7 +3,12 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..database import get_db
 from ..models.models import TeamMember, Admin
-from ..schemas import TeamMemberCreate, TeamMemberUpdate, TeamMemberResponse
+from ..schemas import (
+    TeamMemberCreate, TeamMemberUpdate, TeamMemberResponse, TeamGroupedResponse, BatchRequest, BatchResponse
+)
+from ..services import crud, projections
+from ..services.cache import cache
+from ..services.batch import apply_batch
 from ..utils.auth import get_current_admin
 
 router = APIRouter(prefix="/team", tags=["team"])
@@ -15,19 +20,81 @@ async def get_team_members(
     include_hidden: bool = False,
     db: Session = Depends(get_db)
 ):
-    query = db.query(TeamMember)
     if not include_hidden:
-        query = query.filter(TeamMember.is_visible == True)
+        view = await projections.team.aview()
+        return view.response([
+            m for m in view.rows
+            if (not category or m.category == category) and (not discipline or m.discipline == discipline)
+        ])
+    
+    query = db.query(TeamMember)
     if category:
         query = query.filter(TeamMember.category == category)
     if discipline:
         query = query.filter(TeamMember.discipline == discipline)
-    
-    members = query.order_by(TeamMember.order).all()
-    return members
+    return query.order_by(TeamMember.order).all()
+
+FACETS = ("category", "discipline", "city")
+
+def _facets(members: List[TeamMemberResponse]) -> dict:
+    facets = {}
+    for field in FACETS:
+        counts = {}
+        for member in members:
+            value = getattr(member, field)
+            counts[value] = counts.get(value, 0) + 1
+        facets[field] = [
+            {"value": value, "count": count}
+            for value, count in sorted(counts.items(), key=lambda item: (-item[1], item[0] or ""))
+        ]
+    return facets
+
+def _grouped(members, facets) -> TeamGroupedResponse:
+    groups = {}
+    for member in members:
+        group = groups.setdefault((member.category, member.discipline), {
+            "category": member.category, "discipline": member.discipline, "count": 0, "members": []
+        })
+        group["count"] += 1
+        group["members"].append(member)
+    return TeamGroupedResponse(total=len(members), groups=list(groups.values()), facets=facets)
+
+@router.get("/grouped", response_model=TeamGroupedResponse)
+async def get_team_grouped(
+    category: Optional[str] = None,
+    discipline: Optional[str] = None,
+    city: Optional[str] = None,
+):
+    """Visible members grouped by category and discipline, with facet counts.
+
+    Facets always describe the whole visible roster; the filters only narrow
+    the groups. Groups appear in the order of their first member. Only the
+    unfiltered response is cached: filter values come from the client, so
+    caching per combination would let the cache grow without bound.
+    """
+    key = ("team:grouped",)
+    grouped = await cache.aget(key)
+    if grouped is None:
+        roster = (await projections.team.aview()).rows
+        grouped = _grouped(roster, _facets(roster))
+        await cache.aset(key, grouped, tags=[TeamMember.__tablename__])
+    if category is None and discipline is None and city is None:
+        return grouped
+
+    roster = (await projections.team.aview()).rows
+    members = [
+        m for m in roster
+        if (category is None or m.category == category)
+        and (discipline is None or m.discipline == discipline)
+        and (city is None or m.city == city)
+    ]
+    return _grouped(members, grouped.facets)
 
 @router.get("/{member_id}", response_model=TeamMemberResponse)
 async def get_team_member(member_id: int, db: Session = Depends(get_db)):
+    view = await projections.team.aview()
+    if member_id in view.by_id:
+        return view.item_response(view.by_id[member_id])
     member = db.query(TeamMember).filter(TeamMember.id == member_id).first()
     if not member:
         raise HTTPException(status_code=404, detail="Team member not found")
@@ -39,10 +106,7 @@ async def create_team_member(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    member = TeamMember(**member_data.model_dump())
-    db.add(member)
-    db.commit()
-    db.refresh(member)
+    member = crud.create(db, TeamMember, member_data.model_dump())
     return member
 
 @router.put("/{member_id}", response_model=TeamMemberResponse)
@@ -52,16 +116,9 @@ async def update_team_member(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    member = db.query(TeamMember).filter(TeamMember.id == member_id).first()
+    member = crud.update_by_id(db, TeamMember, member_id, member_data.model_dump(exclude_unset=True))
     if not member:
         raise HTTPException(status_code=404, detail="Team member not found")
-    
-    update_data = member_data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(member, key, value)
-    
-    db.commit()
-    db.refresh(member)
     return member
 
 @router.delete("/{member_id}")
@@ -70,10 +127,15 @@ async def delete_team_member(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    member = db.query(TeamMember).filter(TeamMember.id == member_id).first()
-    if not member:
+    if crud.delete_by_id(db, TeamMember, member_id) is None:
         raise HTTPException(status_code=404, detail="Team member not found")
-    
-    db.delete(member)
-    db.commit()
     return {"message": "Team member deleted successfully"}
+
+@router.post("/batch", response_model=BatchResponse)
+async def batch_team_members(
+    batch: BatchRequest,
+    db: Session = Depends(get_db),
+    admin: Admin = Depends(get_current_admin)
+):
+    response, _ = apply_batch(db, TeamMember, batch.operations, TeamMemberUpdate)
+    return response
@@ -1,6 +1,8 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional, List
+from pydantic import BaseModel, EmailStr, Field, field_validator
+from typing import Optional, List, Literal, Dict, Any
 from datetime import datetime, date
+from .services.recurrence import normalize as normalize_recurrence
+from .services.uploads import MAX_ARCHIVE_ENTRIES
 
 class AdminLogin(BaseModel):
     username: str
@@ -9,6 +11,11 @@ class AdminLogin(BaseModel):
 class Token(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: Optional[str] = None
+    expires_in: Optional[int] = None
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
 
 class AdminCreate(BaseModel):
     username: str
@@ -45,10 +52,11 @@ class EventBase(BaseModel):
     event_time: Optional[str] = None
     location: Optional[str] = None
     event_type: Optional[str] = None
+    recurrence: Optional[str] = None
     is_visible: bool = True
 
 class EventCreate(EventBase):
-    pass
+    _normalize_recurrence = field_validator("recurrence")(normalize_recurrence)
 
 class EventUpdate(BaseModel):
     title: Optional[str] = None
@@ -57,7 +65,10 @@ class EventUpdate(BaseModel):
     event_time: Optional[str] = None
     location: Optional[str] = None
     event_type: Optional[str] = None
+    recurrence: Optional[str] = None
     is_visible: Optional[bool] = None
+    
+    _normalize_recurrence = field_validator("recurrence")(normalize_recurrence)
 
 class EventResponse(EventBase):
     id: int
@@ -66,6 +77,16 @@ class EventResponse(EventBase):
     class Config:
         from_attributes = True
 
+class CalendarDay(BaseModel):
+    date: date
+    count: int
+    event_types: List[str] = []
+
+class CalendarResponse(BaseModel):
+    year: int
+    month: Optional[int] = None
+    days: List[CalendarDay] = []
+
 class DocumentCategoryBase(BaseModel):
     name: str
     parent_id: Optional[int] = None
@@ -85,16 +106,28 @@ class DocumentBase(BaseModel):
     order: int = 0
     is_visible: bool = True
 
+class DocumentUpdate(BaseModel):
+    title: Optional[str] = None
+    category_id: Optional[int] = None
+    order: Optional[int] = None
+    is_visible: Optional[bool] = None
+
 class DocumentResponse(DocumentBase):
     id: int
     filename: str
     file_path: str
     file_size: Optional[int] = None
     created_at: datetime
+    text_status: Optional[str] = None
+    page_count: Optional[int] = None
+    thumbnail_path: Optional[str] = None
     
     class Config:
         from_attributes = True
 
+class DocumentSearchResult(DocumentResponse):
+    snippet: Optional[str] = None
+
 class DocumentCategoryResponse(DocumentCategoryBase):
     id: int
     created_at: datetime
@@ -104,6 +137,23 @@ class DocumentCategoryResponse(DocumentCategoryBase):
     class Config:
         from_attributes = True
 
+class BulkUploadResponse(BaseModel):
+    upload_id: str
+    documents: List[DocumentResponse]
+    created_categories: int
+    skipped: List[str] = []
+
+class UploadProgressResponse(BaseModel):
+    upload_id: str
+    status: Literal["processing", "done", "failed"]
+    files_total: int
+    files_done: int
+    bytes_written: int
+    detail: Optional[str] = None
+    
+    class Config:
+        from_attributes = True
+
 class TeamMemberBase(BaseModel):
     full_name: str
     position: Optional[str] = None
@@ -134,6 +184,21 @@ class TeamMemberResponse(TeamMemberBase):
     class Config:
         from_attributes = True
 
+class TeamGroup(BaseModel):
+    category: str
+    discipline: Optional[str] = None
+    count: int
+    members: List[TeamMemberResponse]
+
+class FacetCount(BaseModel):
+    value: Optional[str] = None
+    count: int
+
+class TeamGroupedResponse(BaseModel):
+    total: int
+    groups: List[TeamGroup]
+    facets: Dict[str, List[FacetCount]]
+
 class LeadershipMemberBase(BaseModel):
     full_name: str
     position: str
@@ -173,3 +238,80 @@ class ContactMessageResponse(ContactMessageCreate):
     
     class Config:
         from_attributes = True
+
+class BatchOperation(BaseModel):
+    id: int
+    action: Literal["update", "show", "hide", "reorder", "read", "unread", "delete"]
+    data: Optional[Dict[str, Any]] = None
+    order: Optional[int] = None
+
+class BatchRequest(BaseModel):
+    # Same cap as files per bulk upload: one request, one bounded transaction.
+    operations: List[BatchOperation] = Field(..., max_length=MAX_ARCHIVE_ENTRIES)
+
+class BatchItemResult(BaseModel):
+    id: int
+    action: str
+    status: Literal["ok", "not_found", "invalid"]
+    detail: Optional[str] = None
+
+class BatchResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BatchItemResult]
+
+class ContentCounterResponse(BaseModel):
+    total: int
+    visible: int
+    hidden: int
+    unread: int
+
+class ActivityLogResponse(BaseModel):
+    id: int
+    entity: str
+    entity_id: Optional[int] = None
+    action: str
+    title: Optional[str] = None
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+class AdminStatsResponse(BaseModel):
+    counters: Dict[str, ContentCounterResponse]
+    recent_activity: List[ActivityLogResponse]
+
+class DocumentScrubReport(BaseModel):
+    repair: bool
+    started_at: datetime
+    duration_ms: float
+    scanned_files: int
+    indexed: int
+    orphans: List[str]
+    orphan_count: int
+    removed_orphans: int
+    missing: List[int]
+    missing_count: int
+    mismatched: List[int]
+    mismatch_count: int
+    repaired: int
+    
+    class Config:
+        from_attributes = True
+
+class ProfilerSettings(BaseModel):
+    enabled: bool
+    sample_rate: float = Field(0.0, ge=0, le=1)
+
+class ProfilerStatus(ProfilerSettings):
+    interval_ms: float
+    stored: int
+
+class ProfileInfo(BaseModel):
+    id: str
+    method: str
+    path: str
+    status_code: int
+    duration_ms: float
+    samples: int
+    created_at: datetime
@@ -1,198 +1,216 @@
-from sqlalchemy.orm import Session
+from datetime import date
+from sqlalchemy import exists, insert, select
+from sqlalchemy.engine import Connection
 from .models.models import LeadershipMember, TeamMember, DocumentCategory, Document, Event
-from datetime import datetime, date
 
-def seed_initial_data(db: Session):
-    if db.query(LeadershipMember).count() == 0:
-        leadership_data = [
-            LeadershipMember(
-                full_name="Общее собрание членов",
-                position="Высший орган управления",
-                description="Высший орган управления РФСОО «ФСП по Чувашской Республике»",
-                order=1
-            ),
-            LeadershipMember(
-                full_name="Набиев Александр Эльдарович",
-                position="Президент РФСОО «ФСП по Чувашской Республике»",
-                description="Руководит деятельностью Федерации спортивного программирования по Чувашской Республике",
-                order=2
-            ),
-            LeadershipMember(
-                full_name="Спиридонов Михаил Юрьевич",
-                position="Первый Вице-президент",
-                description="Заместитель президента федерации",
-                order=3
-            ),
-            LeadershipMember(
-                full_name="Иванова Анна Алексеевна",
-                position="Член Федерации",
-                order=4,
-                is_visible=False
-            ),
-            LeadershipMember(
-                full_name="Константинов Михаил Романович",
-                position="Член Федерации",
-                order=5,
-                is_visible=False
-            ),
-            LeadershipMember(
-                full_name="Алексеев Юрий Витальевич",
-                position="Член Федерации",
-                order=6,
-                is_visible=False
-            ),
-        ]
-        db.add_all(leadership_data)
-    
-    if db.query(TeamMember).count() == 0:
-        team_data = [
-            TeamMember(
-                full_name="Иванов Константин Владиславович",
-                city="Новочебоксарск",
-                category="Основной состав",
-                discipline="Продуктовое программирование",
-                position="Юниор",
-                order=1
-            ),
-            TeamMember(
-                full_name="Антонов Юрий Владимирович",
-                city="Чебоксары",
-                category="Основной состав",
-                discipline="Продуктовое программирование",
-                position="Юниор",
-                order=2
-            ),
-            TeamMember(
-                full_name="Христофоров Иван Александрович",
-                city="Чебоксары",
-                category="Основной состав",
-                discipline="Продуктовое программирование",
-                position="Юниор",
-                order=3
-            ),
-            TeamMember(
-                full_name="Фадеев Тимур Александрович",
-                city="Чебоксары",
-                category="Основной состав",
-                discipline="Продуктовое программирование",
-                position="Юниор",
-                order=4
-            ),
-            TeamMember(
-                full_name="Лапин Аллен Джеймсович",
-                city="Новочебоксарск",
-                category="Основной состав",
-                discipline="Продуктовое программирование",
-                position="Юниор",
-                order=5
-            ),
-        ]
-        db.add_all(team_data)
-    
-    if db.query(DocumentCategory).count() == 0:
-        cat1 = DocumentCategory(
-            name="Учредительные документы",
-            order=1
-        )
-        cat2 = DocumentCategory(
-            name="Нормативные документы",
-            order=2
-        )
-        db.add_all([cat1, cat2])
-        db.flush()
-        
-        docs = [
-            Document(
-                title="Устав РФСОО «ФСП по Чувашской Республике»",
-                filename="ustav_fsp_chuvashia.pdf",
-                file_path="uploads/documents/ustav_fsp_chuvashia.pdf",
-                file_size=1024000,
-                category_id=cat1.id,
-                order=1
-            ),
-            Document(
-                title="Свидетельство о регистрации",
-                filename="svidetelstvo_registracii.pdf",
-                file_path="uploads/documents/svidetelstvo_registracii.pdf",
-                file_size=512000,
-                category_id=cat1.id,
-                order=2
-            ),
-            Document(
-                title="Положение о членстве",
-                filename="polozhenie_o_chlenstve.pdf",
-                file_path="uploads/documents/polozhenie_o_chlenstve.pdf",
-                file_size=768000,
-                category_id=cat2.id,
-                order=1
-            ),
-            Document(
-                title="Регламент проведения соревнований",
-                filename="reglament_sorevnovaniy.pdf",
-                file_path="uploads/documents/reglament_sorevnovaniy.pdf",
-                file_size=1536000,
-                category_id=cat2.id,
-                order=2
-            ),
-            Document(
-                title="Положение о сборной команде",
-                filename="polozhenie_sbornaya.pdf",
-                file_path="uploads/documents/polozhenie_sbornaya.pdf",
-                file_size=640000,
-                category_id=cat2.id,
-                order=3
-            ),
-        ]
-        db.add_all(docs)
-    
-    if db.query(Event).count() == 0:
-        events_data = [
-            Event(
-                title="Региональный этап Всероссийской олимпиады по спортивному программированию",
-                description="Отборочный этап для определения участников финала Всероссийской олимпиады. Дисциплина: алгоритмическое программирование.",
-                event_date=date(2025, 12, 7),
-                event_time="10:00",
-                location="ЧГУ им. И.Н. Ульянова, г. Чебоксары",
-                event_type="Соревнование",
-                is_visible=True
-            ),
-            Event(
-                title="Хакатон «Цифровая Чувашия 2025»",
-                description="48-часовой хакатон по разработке цифровых решений для региона. Призовой фонд 500 000 рублей.",
-                event_date=date(2025, 12, 14),
-                event_time="09:00",
-                location="IT-парк «Цифровая Долина», г. Чебоксары",
-                event_type="Хакатон",
-                is_visible=True
-            ),
-            Event(
-                title="Мастер-класс по подготовке к соревнованиям",
-                description="Занятие для юных программистов по алгоритмам и структурам данных. Ведущий - призёр ICPC.",
-                event_date=date(2025, 12, 15),
-                event_time="14:00",
-                location="Онлайн (Zoom)",
-                event_type="Мастер-класс",
-                is_visible=True
-            ),
-            Event(
-                title="Чемпионат Чувашии по продуктовому программированию",
-                description="Командное соревнование по созданию IT-продуктов. Победители представят регион на всероссийских соревнованиях.",
-                event_date=date(2025, 12, 21),
-                event_time="10:00",
-                location="Технопарк «Инноград», г. Чебоксары",
-                event_type="Чемпионат",
-                is_visible=True
-            ),
-            Event(
-                title="Новогодний контест для начинающих",
-                description="Праздничное соревнование для начинающих программистов. Простые задачи, призы и подарки!",
-                event_date=date(2025, 12, 28),
-                event_time="12:00",
-                location="Онлайн",
-                event_type="Контест",
-                is_visible=True
-            ),
-        ]
-        db.add_all(events_data)
+# Initial site content, applied once by the seed migration (app.migrations)
+# with one bulk INSERT per table. Tables that already hold rows are left alone.
+
+LEADERSHIP = [
+    dict(
+        full_name="Общее собрание членов",
+        position="Высший орган управления",
+        description="Высший орган управления РФСОО «ФСП по Чувашской Республике»",
+        order=1
+    ),
+    dict(
+        full_name="Набиев Александр Эльдарович",
+        position="Президент РФСОО «ФСП по Чувашской Республике»",
+        description="Руководит деятельностью Федерации спортивного программирования по Чувашской Республике",
+        order=2
+    ),
+    dict(
+        full_name="Спиридонов Михаил Юрьевич",
+        position="Первый Вице-президент",
+        description="Заместитель президента федерации",
+        order=3
+    ),
+    dict(
+        full_name="Иванова Анна Алексеевна",
+        position="Член Федерации",
+        order=4,
+        is_visible=False
+    ),
+    dict(
+        full_name="Константинов Михаил Романович",
+        position="Член Федерации",
+        order=5,
+        is_visible=False
+    ),
+    dict(
+        full_name="Алексеев Юрий Витальевич",
+        position="Член Федерации",
+        order=6,
+        is_visible=False
+    ),
+]
+
+TEAM = [
+    dict(
+        full_name="Иванов Константин Владиславович",
+        city="Новочебоксарск",
+        category="Основной состав",
+        discipline="Продуктовое программирование",
+        position="Юниор",
+        order=1
+    ),
+    dict(
+        full_name="Антонов Юрий Владимирович",
+        city="Чебоксары",
+        category="Основной состав",
+        discipline="Продуктовое программирование",
+        position="Юниор",
+        order=2
+    ),
+    dict(
+        full_name="Христофоров Иван Александрович",
+        city="Чебоксары",
+        category="Основной состав",
+        discipline="Продуктовое программирование",
+        position="Юниор",
+        order=3
+    ),
+    dict(
+        full_name="Фадеев Тимур Александрович",
+        city="Чебоксары",
+        category="Основной состав",
+        discipline="Продуктовое программирование",
+        position="Юниор",
+        order=4
+    ),
+    dict(
+        full_name="Лапин Аллен Джеймсович",
+        city="Новочебоксарск",
+        category="Основной состав",
+        discipline="Продуктовое программирование",
+        position="Юниор",
+        order=5
+    ),
+]
+
+DOCUMENT_CATEGORIES = [
+    dict(name="Учредительные документы", order=1),
+    dict(name="Нормативные документы", order=2),
+]
+
+# ``category`` refers to DOCUMENT_CATEGORIES by name.
+DOCUMENTS = [
+    dict(
+        title="Устав РФСОО «ФСП по Чувашской Республике»",
+        filename="ustav_fsp_chuvashia.pdf",
+        file_path="uploads/documents/ustav_fsp_chuvashia.pdf",
+        file_size=1024000,
+        category="Учредительные документы",
+        order=1
+    ),
+    dict(
+        title="Свидетельство о регистрации",
+        filename="svidetelstvo_registracii.pdf",
+        file_path="uploads/documents/svidetelstvo_registracii.pdf",
+        file_size=512000,
+        category="Учредительные документы",
+        order=2
+    ),
+    dict(
+        title="Положение о членстве",
+        filename="polozhenie_o_chlenstve.pdf",
+        file_path="uploads/documents/polozhenie_o_chlenstve.pdf",
+        file_size=768000,
+        category="Нормативные документы",
+        order=1
+    ),
+    dict(
+        title="Регламент проведения соревнований",
+        filename="reglament_sorevnovaniy.pdf",
+        file_path="uploads/documents/reglament_sorevnovaniy.pdf",
+        file_size=1536000,
+        category="Нормативные документы",
+        order=2
+    ),
+    dict(
+        title="Положение о сборной команде",
+        filename="polozhenie_sbornaya.pdf",
+        file_path="uploads/documents/polozhenie_sbornaya.pdf",
+        file_size=640000,
+        category="Нормативные документы",
+        order=3
+    ),
+]
+
+EVENTS = [
+    dict(
+        title="Региональный этап Всероссийской олимпиады по спортивному программированию",
+        description="Отборочный этап для определения участников финала Всероссийской олимпиады. Дисциплина: алгоритмическое программирование.",
+        event_date=date(2025, 12, 7),
+        event_time="10:00",
+        location="ЧГУ им. И.Н. Ульянова, г. Чебоксары",
+        event_type="Соревнование",
+        is_visible=True
+    ),
+    dict(
+        title="Хакатон «Цифровая Чувашия 2025»",
+        description="48-часовой хакатон по разработке цифровых решений для региона. Призовой фонд 500 000 рублей.",
+        event_date=date(2025, 12, 14),
+        event_time="09:00",
+        location="IT-парк «Цифровая Долина», г. Чебоксары",
+        event_type="Хакатон",
+        is_visible=True
+    ),
+    dict(
+        title="Мастер-класс по подготовке к соревнованиям",
+        description="Занятие для юных программистов по алгоритмам и структурам данных. Ведущий - призёр ICPC.",
+        event_date=date(2025, 12, 15),
+        event_time="14:00",
+        location="Онлайн (Zoom)",
+        event_type="Мастер-класс",
+        is_visible=True
+    ),
+    dict(
+        title="Чемпионат Чувашии по продуктовому программированию",
+        description="Командное соревнование по созданию IT-продуктов. Победители представят регион на всероссийских соревнованиях.",
+        event_date=date(2025, 12, 21),
+        event_time="10:00",
+        location="Технопарк «Инноград», г. Чебоксары",
+        event_type="Чемпионат",
+        is_visible=True
+    ),
+    dict(
+        title="Новогодний контест для начинающих",
+        description="Праздничное соревнование для начинающих программистов. Простые задачи, призы и подарки!",
+        event_date=date(2025, 12, 28),
+        event_time="12:00",
+        location="Онлайн",
+        event_type="Контест",
+        is_visible=True
+    ),
+]
+
+def _rows(model, rows: list) -> list:
+    """Give every row the same keys, as executemany INSERTs require."""
+    keys = set().union(*rows)
+    defaults = {}
+    for key in keys:
+        default = model.__table__.columns[key].default
+        defaults[key] = default.arg if default is not None and default.is_scalar else None
+    return [{**defaults, **row} for row in rows]
+
+def _is_empty(conn: Connection, model) -> bool:
+    return not conn.execute(select(exists().where(model.id.isnot(None)))).scalar()
+
+def seed_initial_data(conn: Connection) -> None:
+    for model, rows in ((LeadershipMember, LEADERSHIP), (TeamMember, TEAM), (Event, EVENTS)):
+        if _is_empty(conn, model):
+            conn.execute(insert(model), _rows(model, rows))
     
-    db.commit()
+    if _is_empty(conn, DocumentCategory):
+        category_ids = {
+            row.name: row.id
+            for row in conn.execute(
+                insert(DocumentCategory).returning(DocumentCategory.id, DocumentCategory.name),
+                DOCUMENT_CATEGORIES
+            )
+        }
+        conn.execute(insert(Document), _rows(Document, [
+            {**{k: v for k, v in doc.items() if k != "category"}, "category_id": category_ids[doc["category"]]}
+            for doc in DOCUMENTS
+        ]))
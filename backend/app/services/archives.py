@@ -0,0 +1,179 @@
+import hashlib
+import logging
+import os
+import uuid
+import zipfile
+from typing import Iterator, List, NamedTuple, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from ..config import get_settings
+from ..models.models import Document, DocumentCategory
+from .cache import cache
+from .files import COPY_CHUNK_SIZE
+
+# ZIP archives of a whole document category subtree. The manifest (entries
+# plus a hash over their names and content hashes) is cached until documents
+# or categories change; the archive itself is generated on the fly and
+# streamed, while a copy is written to ARCHIVE_DIR under the tree hash so the
+# next request for the same tree is served as a ready file.
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Formats that are already compressed gain nothing from deflate.
+STORED_EXTENSIONS = {
+    ".pdf", ".zip", ".rar", ".7z", ".gz", ".bz2", ".xz",
+    ".docx", ".xlsx", ".pptx", ".odt", ".ods", ".odp",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".mp3", ".mp4", ".avi", ".mov",
+}
+
+class ArchiveEntry(NamedTuple):
+    arcname: str
+    file_path: str
+    file_size: Optional[int]
+    fingerprint: str
+
+class Manifest(NamedTuple):
+    name: str
+    tree_hash: str
+    entries: List[ArchiveEntry]
+
+def _safe(name: str) -> str:
+    return (name or "").replace("/", "_").replace("\\", "_").strip() or "_"
+
+def build_manifest(db: Session, category_id: int) -> Optional[Manifest]:
+    """Entries for the category and all its descendants; None if it does not exist."""
+    tree = select(DocumentCategory.id, DocumentCategory.name, DocumentCategory.parent_id) \
+        .where(DocumentCategory.id == category_id).cte("tree", recursive=True)
+    tree = tree.union_all(
+        select(DocumentCategory.id, DocumentCategory.name, DocumentCategory.parent_id)
+        .join(tree, DocumentCategory.parent_id == tree.c.id)
+    )
+    categories = {row.id: row for row in db.execute(select(tree))}
+    if category_id not in categories:
+        return None
+
+    def folder(cid: int) -> str:
+        parts = []
+        while cid is not None and cid in categories:
+            parts.append(_safe(categories[cid].name))
+            cid = None if cid == category_id else categories[cid].parent_id
+        return "/".join(reversed(parts))
+
+    documents = db.execute(
+        select(Document.category_id, Document.filename, Document.file_path, Document.file_size,
+               Document.content_hash, Document.file_mtime)
+        .where(Document.category_id.in_(categories), Document.is_visible == True)
+        .order_by(Document.category_id, Document.order, Document.id)
+    ).all()
+
+    entries = []
+    used = set()
+    folders = {}
+    for doc in documents:
+        if doc.category_id not in folders:
+            folders[doc.category_id] = folder(doc.category_id)
+        stem, ext = os.path.splitext(_safe(doc.filename))
+        arcname = f"{folders[doc.category_id]}/{stem}{ext}"
+        n = 1
+        while arcname in used:
+            n += 1
+            arcname = f"{folders[doc.category_id]}/{stem} ({n}){ext}"
+        used.add(arcname)
+        fingerprint = doc.content_hash or f"{doc.file_size}:{doc.file_mtime}"
+        entries.append(ArchiveEntry(arcname, doc.file_path, doc.file_size, fingerprint))
+
+    digest = hashlib.sha256()
+    for entry in entries:
+        digest.update(f"{entry.arcname}\0{entry.fingerprint}\n".encode("utf-8"))
+    return Manifest(_safe(categories[category_id].name), digest.hexdigest(), entries)
+
+async def get_manifest(db: Session, category_id: int) -> Optional[Manifest]:
+    key = ("documents:archive", category_id)
+    manifest = await cache.aget(key)
+    if manifest is None:
+        manifest = build_manifest(db, category_id)
+        if manifest is not None:
+            await cache.aset(key, manifest, tags=[Document.__tablename__, DocumentCategory.__tablename__])
+    return manifest
+
+def artifact_path(manifest: Manifest) -> str:
+    return os.path.join(settings.archive_dir, f"{manifest.tree_hash}.zip")
+
+class _Sink:
+    """Unseekable file object for ZipFile: buffers output and tees it to disk."""
+
+    def __init__(self, copy_path: str):
+        self._chunks: List[bytes] = []
+        self._copy = open(copy_path, "wb")
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._copy.write(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+    def close_copy(self) -> None:
+        self._copy.close()
+
+def stream_archive(manifest: Manifest) -> Iterator[bytes]:
+    """Yield the ZIP in chunks; keeps it as an artifact if every file was included.
+
+    A blocking generator: StreamingResponse iterates it on a worker thread.
+    """
+    os.makedirs(settings.archive_dir, exist_ok=True)
+    final_path = artifact_path(manifest)
+    temp_path = f"{final_path}.{uuid.uuid4().hex}.tmp"
+    sink = _Sink(temp_path)
+    # Only a fully sent archive with every file in it becomes the artifact;
+    # a client disconnect closes the generator at a yield and skips this.
+    complete = False
+    skipped = 0
+    try:
+        with zipfile.ZipFile(sink, "w") as archive:
+            for entry in manifest.entries:
+                try:
+                    source = open(entry.file_path, "rb")
+                except OSError as e:
+                    logger.warning("Archive skipped %s: %s", entry.file_path, e)
+                    skipped += 1
+                    continue
+                with source:
+                    info = zipfile.ZipInfo.from_file(entry.file_path, entry.arcname)
+                    stored = os.path.splitext(entry.arcname)[1].lower() in STORED_EXTENSIONS
+                    info.compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+                    with archive.open(info, "w", force_zip64=info.file_size > zipfile.ZIP64_LIMIT) as dest:
+                        for chunk in iter(lambda: source.read(COPY_CHUNK_SIZE), b""):
+                            dest.write(chunk)
+                            data = sink.drain()
+                            if data:
+                                yield data
+        yield sink.drain()
+        complete = not skipped
+    finally:
+        sink.close_copy()
+        if complete:
+            os.replace(temp_path, final_path)
+            _prune()
+        else:
+            os.remove(temp_path)
+
+def _prune() -> None:
+    """Keep only the newest ``archive_keep`` artifacts."""
+    try:
+        artifacts = [e for e in os.scandir(settings.archive_dir) if e.name.endswith(".zip")]
+    except OSError:
+        return
+    artifacts.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    for entry in artifacts[settings.archive_keep:]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
@@ -0,0 +1,81 @@
+from typing import Any, List, Optional, Tuple, Type
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.orm import Session
+from ..schemas import BatchOperation, BatchItemResult, BatchResponse
+from . import crud
+
+FLAG_ACTIONS = {
+    "show": ("is_visible", True),
+    "hide": ("is_visible", False),
+    "read": ("is_read", True),
+    "unread": ("is_read", False),
+}
+
+def _changes_for(model, op: BatchOperation, update_schema: Optional[Type[BaseModel]]) -> dict:
+    columns = model.__table__.columns
+    if op.action == "update":
+        if update_schema is None:
+            raise ValueError("Update is not supported for this resource")
+        if not op.data:
+            raise ValueError("Update requires data")
+        return update_schema.model_validate(op.data).model_dump(exclude_unset=True)
+    if op.action == "reorder":
+        if "order" not in columns:
+            raise ValueError("Reorder is not supported for this resource")
+        if op.order is None:
+            raise ValueError("Reorder requires order")
+        return {"order": op.order}
+    field, value = FLAG_ACTIONS[op.action]
+    if field not in columns:
+        raise ValueError(f"Action '{op.action}' is not supported for this resource")
+    return {field: value}
+
+def apply_batch(
+    db: Session,
+    model,
+    operations: List[BatchOperation],
+    update_schema: Optional[Type[BaseModel]] = None,
+    returning: Tuple[Any, ...] = ()
+) -> Tuple[BatchResponse, list]:
+    """Apply operations to rows of ``model`` and commit once.
+
+    Each operation is a single UPDATE ... RETURNING or DELETE by primary key.
+    Invalid or missing items are reported per item and skipped; they do not
+    abort the rest of the batch. Returns the response and the deleted rows
+    (id plus ``returning`` columns), so callers can clean up after commit.
+    """
+    results = []
+    deleted = []
+
+    for op in operations:
+        if op.action == "delete":
+            row = crud.delete_by_id(db, model, op.id, *returning, commit=False)
+            if row is None:
+                results.append(BatchItemResult(id=op.id, action=op.action, status="not_found"))
+                continue
+            deleted.append(row)
+            results.append(BatchItemResult(id=op.id, action=op.action, status="ok"))
+            continue
+
+        try:
+            changes = _changes_for(model, op, update_schema)
+        except ValidationError as e:
+            results.append(BatchItemResult(
+                id=op.id, action=op.action, status="invalid",
+                detail="; ".join(err["msg"] for err in e.errors())
+            ))
+            continue
+        except ValueError as e:
+            results.append(BatchItemResult(id=op.id, action=op.action, status="invalid", detail=str(e)))
+            continue
+
+        if crud.update_by_id(db, model, op.id, changes, commit=False) is None:
+            results.append(BatchItemResult(id=op.id, action=op.action, status="not_found"))
+            continue
+        results.append(BatchItemResult(id=op.id, action=op.action, status="ok"))
+
+    db.commit()
+
+    succeeded = sum(1 for result in results if result.status == "ok")
+    response = BatchResponse(succeeded=succeeded, failed=len(results) - succeeded, results=results)
+    return response, deleted
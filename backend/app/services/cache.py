@@ -0,0 +1,115 @@
+import asyncio
+from typing import Any, Callable, Dict, Hashable, Iterable, Set
+from ..config import get_settings
+from . import changes
+from .metrics import registry, Counter, GaugeFunc
+
+cache_lookups = registry.register(Counter(
+    "fsp_cache_lookups_total", "Tagged cache lookups by result.", ("result",)
+))
+_cache_hits = cache_lookups.labels("hit")
+_cache_misses = cache_lookups.labels("miss")
+
+
+class MemoryBackend:
+    """Per-process storage: a dict of entries plus a tag -> keys index."""
+
+    blocking = False
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Any] = {}
+        self._tags: Dict[str, Set[Hashable]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self._entries.get(key, default)
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[str] = ()) -> None:
+        self._entries[key] = value
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+    def invalidate(self, *tags: str) -> None:
+        for tag in tags:
+            for key in self._tags.pop(tag, ()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TaggedCache:
+    """Cache whose entries live until one of their tags is invalidated.
+
+    Entries are tagged with table names (e.g. ``"events"``) and dropped when a
+    transaction touching that table commits, so read endpoints can cache
+    computed payloads without a TTL. Storage is per process by default; with
+    ``CACHE_BACKEND=shared`` all workers use one store in the coordination
+    database (values must then be picklable).
+    """
+
+    def __init__(self, backend=None):
+        self._backend = backend if backend is not None else MemoryBackend()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self._backend.get(key, _MISSING)
+        if value is _MISSING:
+            _cache_misses.inc()
+            return default
+        _cache_hits.inc()
+        return value
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[str] = ()) -> None:
+        self._backend.set(key, value, tags)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any], tags: Iterable[str] = ()) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value, tags)
+        return value
+
+    # Async variants for request handlers: a backend that does I/O is used
+    # from the threadpool so it never stalls the event loop.
+
+    async def aget(self, key: Hashable, default: Any = None) -> Any:
+        if self._backend.blocking:
+            return await asyncio.to_thread(self.get, key, default)
+        return self.get(key, default)
+
+    async def aset(self, key: Hashable, value: Any, tags: Iterable[str] = ()) -> None:
+        if self._backend.blocking:
+            await asyncio.to_thread(self.set, key, value, tuple(tags))
+        else:
+            self.set(key, value, tags)
+
+    def invalidate(self, *tags: str) -> None:
+        self._backend.invalidate(*tags)
+
+    def clear(self) -> None:
+        self._backend.clear()
+
+    def __len__(self) -> int:
+        return len(self._backend)
+
+
+_MISSING = object()
+
+def _backend():
+    if get_settings().cache_backend == "shared":
+        from .coordination import coordinator, SharedCacheBackend
+        return SharedCacheBackend(coordinator)
+    return MemoryBackend()
+
+cache = TaggedCache(_backend())
+changes.subscribe(lambda changed: cache.invalidate(*changed))
+
+def _hit_ratio() -> float:
+    total = _cache_hits.value + _cache_misses.value
+    return _cache_hits.value / total if total else 0.0
+
+registry.register(GaugeFunc("fsp_cache_hit_ratio", "Share of tagged cache lookups served from cache.", _hit_ratio))
+registry.register(GaugeFunc("fsp_cache_entries", "Entries currently held in the tagged cache.", lambda: len(cache)))
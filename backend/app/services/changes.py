@@ -0,0 +1,60 @@
+import logging
+from typing import Callable, Dict, Iterable, List
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from ..database import SessionLocal
+
+# Writes record which rows they touched on the session; once the transaction
+# commits, subscribers (cache invalidation and friends) are told what changed.
+# A rollback simply discards the record. Local subscribers only hear about
+# commits made in this process (used to broadcast them to other workers,
+# see services.coordination).
+
+logger = logging.getLogger(__name__)
+
+Changes = Dict[str, Dict[int, str]]
+
+_subscribers: List[Callable[[Changes], None]] = []
+_local_subscribers: List[Callable[[Changes], None]] = []
+
+def subscribe(callback: Callable[[Changes], None], first: bool = False) -> None:
+    """``first`` runs the callback ahead of existing ones, for state others read from."""
+    if first:
+        _subscribers.insert(0, callback)
+    else:
+        _subscribers.append(callback)
+
+def subscribe_local(callback: Callable[[Changes], None]) -> None:
+    _local_subscribers.append(callback)
+
+def mark_changed(db: Session, model, ids: Iterable[int] = (), action: str = "updated") -> None:
+    """Record a pending change to ``model`` rows; ids may be empty for table-wide changes."""
+    table = db.info.setdefault("changes", {}).setdefault(model.__tablename__, {})
+    for obj_id in ids:
+        table[obj_id] = action
+
+def publish(changes: Changes, local: bool = True) -> None:
+    """Notify subscribers; ``local=False`` for changes replayed from another worker."""
+    # Runs after the commit: a failing subscriber must neither turn a
+    # successful write into an error nor keep the others from hearing of it.
+    for callback in _subscribers:
+        try:
+            callback(changes)
+        except Exception:
+            logger.exception("Change subscriber error")
+    if local:
+        for callback in _local_subscribers:
+            try:
+                callback(changes)
+            except Exception:
+                logger.exception("Change broadcast error")
+
+@event.listens_for(SessionLocal, "after_commit")
+def _after_commit(session: Session) -> None:
+    changes = session.info.pop("changes", None)
+    if changes:
+        publish(changes)
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop("changes", None)
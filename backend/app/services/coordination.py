@@ -0,0 +1,193 @@
+import asyncio
+import json
+import logging
+import os
+import pickle
+import socket
+import threading
+import time
+import uuid
+from typing import Any, Hashable, Iterable
+from sqlalchemy import (
+    Column, Float, Integer, LargeBinary, MetaData, String, Table, Text,
+    create_engine, delete, event, func, insert, select, update
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from ..config import get_settings
+from . import changes
+
+# Coordination between worker processes of one deployment, through a small
+# SQLite file shared by all workers (separate from the content database so
+# it never competes with content writes):
+#
+# - invalidation broadcast: committed changes are appended to a log that
+#   every other worker polls and replays into its local subscribers
+#   (cache, snapshots, ...);
+# - leases: time-limited leadership, so background jobs run in one worker;
+# - SharedCacheBackend: an optional cross-worker store for TaggedCache.
+#
+# Only SQLite URLs are supported. In single-worker mode (the default) none of
+# this touches the disk: the worker is its own leader and there is nobody to
+# broadcast to.
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+metadata = MetaData()
+invalidations = Table(
+    "invalidations", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("origin", String(100)),
+    Column("changes", Text),
+    Column("created_at", Float),
+)
+leases = Table(
+    "leases", metadata,
+    Column("name", String(100), primary_key=True),
+    Column("holder", String(100)),
+    Column("expires_at", Float),
+)
+cache_entries = Table(
+    "cache_entries", metadata,
+    Column("key", String(500), primary_key=True),
+    Column("value", LargeBinary),
+)
+cache_tags = Table(
+    "cache_tags", metadata,
+    Column("tag", String(100), primary_key=True),
+    Column("key", String(500), primary_key=True),
+)
+
+INVALIDATION_RETENTION_S = 3600
+
+class Coordinator:
+    def __init__(self, url: str, multi_worker: bool):
+        self.multi_worker = multi_worker
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._engine = None
+        self._url = url
+        self._last_seen = 0
+        self._lock = threading.Lock()
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            with self._lock:
+                if self._engine is None:
+                    engine = create_engine(self._url, connect_args={"check_same_thread": False, "timeout": 30})
+                    event.listen(engine, "connect", _enable_wal)
+                    metadata.create_all(engine)
+                    with engine.connect() as conn:
+                        self._last_seen = conn.execute(select(func.max(invalidations.c.id))).scalar() or 0
+                    self._engine = engine
+        return self._engine
+
+    # Invalidation broadcast
+
+    def broadcast(self, changed: changes.Changes) -> None:
+        if not self.multi_worker:
+            return
+        payload = json.dumps({table: {str(k): v for k, v in ids.items()} for table, ids in changed.items()})
+        with self.engine.begin() as conn:
+            conn.execute(insert(invalidations).values(origin=self.worker_id, changes=payload, created_at=time.time()))
+
+    def poll_invalidations(self) -> int:
+        """Replay changes committed by other workers; returns how many were applied."""
+        with self.engine.begin() as conn:
+            rows = conn.execute(
+                select(invalidations.c.id, invalidations.c.origin, invalidations.c.changes)
+                .where(invalidations.c.id > self._last_seen).order_by(invalidations.c.id)
+            ).all()
+            if rows and rows[-1].id // 100 != self._last_seen // 100:
+                conn.execute(delete(invalidations).where(invalidations.c.created_at < time.time() - INVALIDATION_RETENTION_S))
+        applied = 0
+        for row in rows:
+            self._last_seen = row.id
+            if row.origin == self.worker_id:
+                continue
+            changed = {table: {int(k): v for k, v in ids.items()} for table, ids in json.loads(row.changes).items()}
+            changes.publish(changed, local=False)
+            applied += 1
+        return applied
+
+    async def run_invalidation_listener(self) -> None:
+        interval = settings.invalidation_poll_ms / 1000
+        while True:
+            try:
+                await asyncio.to_thread(self.poll_invalidations)
+            except Exception as e:
+                logger.warning("Invalidation poll error: %s", e)
+            await asyncio.sleep(interval)
+
+    # Leader election
+
+    def try_acquire_lease(self, name: str, ttl: float) -> bool:
+        """Take or renew the named lease; True if this worker holds it now."""
+        if not self.multi_worker:
+            return True
+        now = time.time()
+        stmt = sqlite_insert(leases).values(name=name, holder=self.worker_id, expires_at=now + ttl)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[leases.c.name],
+            set_={"holder": stmt.excluded.holder, "expires_at": stmt.excluded.expires_at},
+            where=(leases.c.holder == self.worker_id) | (leases.c.expires_at < now)
+        )
+        with self.engine.begin() as conn:
+            conn.execute(stmt)
+            holder = conn.execute(select(leases.c.holder).where(leases.c.name == name)).scalar()
+        return holder == self.worker_id
+
+    def release_lease(self, name: str) -> None:
+        if not self.multi_worker:
+            return
+        with self.engine.begin() as conn:
+            conn.execute(update(leases).where(
+                leases.c.name == name, leases.c.holder == self.worker_id
+            ).values(expires_at=0))
+
+class SharedCacheBackend:
+    """TaggedCache storage in the coordination database, shared by all workers."""
+
+    blocking = True
+
+    def __init__(self, coordinator: Coordinator):
+        self._coordinator = coordinator
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._coordinator.engine.connect() as conn:
+            value = conn.execute(select(cache_entries.c.value).where(cache_entries.c.key == repr(key))).scalar()
+        return default if value is None else pickle.loads(value)
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[str] = ()) -> None:
+        key = repr(key)
+        data = pickle.dumps(value)
+        with self._coordinator.engine.begin() as conn:
+            conn.execute(sqlite_insert(cache_entries).values(key=key, value=data).on_conflict_do_update(
+                index_elements=[cache_entries.c.key], set_={"value": data}
+            ))
+            for tag in tags:
+                conn.execute(sqlite_insert(cache_tags).values(tag=tag, key=key).on_conflict_do_nothing())
+
+    def invalidate(self, *tags: str) -> None:
+        with self._coordinator.engine.begin() as conn:
+            keys = select(cache_tags.c.key).where(cache_tags.c.tag.in_(tags))
+            conn.execute(delete(cache_entries).where(cache_entries.c.key.in_(keys)))
+            conn.execute(delete(cache_tags).where(cache_tags.c.key.in_(keys.scalar_subquery())))
+
+    def clear(self) -> None:
+        with self._coordinator.engine.begin() as conn:
+            conn.execute(delete(cache_entries))
+            conn.execute(delete(cache_tags))
+
+    def __len__(self) -> int:
+        with self._coordinator.engine.connect() as conn:
+            return conn.execute(select(func.count()).select_from(cache_entries)).scalar()
+
+def _enable_wal(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+coordinator = Coordinator(settings.coordination_url, settings.workers > 1)
+changes.subscribe_local(coordinator.broadcast)
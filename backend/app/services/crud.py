@@ -0,0 +1,66 @@
+from typing import Any, List, Optional
+from sqlalchemy import insert, update, delete
+from sqlalchemy.orm import Session
+from . import changes, stats
+
+# Every statement here is a single round trip: INSERT/UPDATE ... RETURNING hands
+# back the finished row and DELETE goes straight to the primary key, so handlers
+# never need a follow-up SELECT or db.refresh(). Sessions are created with
+# expire_on_commit=False, so returned objects stay readable after the commit.
+# Writes to content tables also maintain the dashboard counters (services.stats)
+# inside the same transaction and are recorded for post-commit subscribers
+# (services.changes).
+
+def create(db: Session, model, data: dict, commit: bool = True):
+    obj = db.execute(insert(model).values(**data).returning(model)).scalar_one()
+    if stats.is_counted(model):
+        stats.on_create(db, model, obj)
+    changes.mark_changed(db, model, [obj.id], "created")
+    if commit:
+        db.commit()
+    return obj
+
+def create_many(db: Session, model, rows: List[dict], commit: bool = True) -> list:
+    """Insert all rows with one executemany INSERT ... RETURNING; rows must share keys."""
+    if not rows:
+        return []
+    objs = db.scalars(insert(model).returning(model), rows).all()
+    if stats.is_counted(model):
+        stats.on_create_many(db, model, objs)
+    changes.mark_changed(db, model, [obj.id for obj in objs], "created")
+    if commit:
+        db.commit()
+    return objs
+
+def update_by_id(db: Session, model, obj_id: int, data: dict, commit: bool = True):
+    """Returns the updated row, or None if no row has this id."""
+    if not data:
+        return db.get(model, obj_id)
+    if stats.is_counted(model):
+        stats.before_update(db, model, obj_id, data)
+    obj = db.execute(
+        update(model).where(model.id == obj_id).values(**data).returning(model)
+    ).scalar_one_or_none()
+    if obj is not None:
+        if stats.is_counted(model):
+            stats.on_update(db, model, obj)
+        changes.mark_changed(db, model, [obj.id], "updated")
+    if commit:
+        db.commit()
+    return obj
+
+def delete_by_id(db: Session, model, obj_id: int, *returning: Any, commit: bool = True) -> Optional[Any]:
+    """Returns the deleted row's id plus any extra ``returning`` columns, or None."""
+    counted = stats.is_counted(model)
+    if counted:
+        returning += stats.tracked_columns(model)
+    row = db.execute(
+        delete(model).where(model.id == obj_id).returning(model.id, *returning)
+    ).first()
+    if row is not None:
+        if counted:
+            stats.on_delete(db, model, row)
+        changes.mark_changed(db, model, [row.id], "deleted")
+    if commit:
+        db.commit()
+    return row
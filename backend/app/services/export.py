@@ -0,0 +1,65 @@
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta
+from typing import Iterator, List, Optional
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from ..database import SessionLocal
+
+EXPORT_BATCH_SIZE = 500
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+def date_filters(column, date_from: Optional[date], date_to: Optional[date]) -> list:
+    """Inclusive date bounds as a half-open range on a datetime column."""
+    filters = []
+    if date_from:
+        filters.append(column >= datetime.combine(date_from, datetime.min.time()))
+    if date_to:
+        filters.append(column < datetime.combine(date_to + timedelta(days=1), datetime.min.time()))
+    return filters
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+def _iter_rows(columns: list, filters: list, order_by, fmt: str) -> Iterator[str]:
+    # The generator owns its session: it outlives the request handler and the
+    # get_db dependency. Selecting plain columns with yield_per streams rows from
+    # a server-side cursor in fixed-size batches without filling the identity map.
+    db = SessionLocal()
+    try:
+        stmt = select(*columns).where(*filters).order_by(order_by).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        result = db.execute(stmt)
+        names = list(result.keys())
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(names)
+            for batch in result.partitions():
+                writer.writerows(batch)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            if buffer.tell():
+                yield buffer.getvalue()
+        else:
+            for batch in result.partitions():
+                yield "".join(
+                    json.dumps(dict(zip(names, row)), ensure_ascii=False, default=_json_default) + "\n"
+                    for row in batch
+                )
+    finally:
+        db.close()
+
+def export_response(columns: List, filters: list, order_by, fmt: str, name: str) -> StreamingResponse:
+    filename = f"{name}-{date.today():%Y%m%d}.{fmt}"
+    return StreamingResponse(
+        _iter_rows(columns, filters, order_by, fmt),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -0,0 +1,268 @@
+import asyncio
+import glob
+import logging
+import multiprocessing
+import os
+import re
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from ..config import get_settings
+from ..database import SessionLocal
+from ..models.models import Document, DocumentText
+from . import changes
+from .coordination import coordinator
+from .log import bind_request_id, request_id
+from .text_extract import Extracted, extract, supported
+
+# Document text pipeline. Committed document changes (changes.subscribe_local,
+# so each commit is handled once, by the worker that made it) are queued:
+# new files are extracted in a process pool (services.text_extract), the text
+# is stored zlib-compressed in document_texts and indexed in an FTS5 table.
+# Title edits only refresh the index row; a changed file hash re-extracts.
+#
+# The FTS table is contentless (content=''), so the index holds no copy of
+# the text; deleting a row from it needs the indexed values, which come from
+# document_texts. Rows of deleted documents are dropped by the pipeline, and
+# search joins against documents so a stale row can never surface.
+#
+# On startup the lease holder reconciles the tables, catching up on anything
+# committed while no pipeline was running (e.g. documents created before
+# this existed) and retrying "unsupported" documents once a library for
+# their type has been installed.
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "document_fts"
+RECONCILE_LEASE = "document_extraction"
+RECONCILE_LEASE_TTL_S = 600
+COMPRESS_LEVEL = 6
+SNIPPET_CHARS = 80
+MAX_QUERY_TERMS = 8
+
+def create_search_index(conn: Connection) -> None:
+    conn.execute(text(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        "title, content, content='', tokenize='unicode61 remove_diacritics 2')"
+    ))
+
+def compress(value: str) -> bytes:
+    return zlib.compress(value.encode("utf-8"), COMPRESS_LEVEL)
+
+def decompress(value: Optional[bytes]) -> str:
+    return zlib.decompress(value).decode("utf-8") if value else ""
+
+def _index(db: Session, document_id: int, title: str, content: str) -> None:
+    db.execute(text(f"INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (:id, :title, :content)"),
+               {"id": document_id, "title": title or "", "content": content})
+
+def _unindex(db: Session, row: DocumentText) -> None:
+    db.execute(text(
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content) VALUES ('delete', :id, :title, :content)"
+    ), {"id": row.document_id, "title": row.title or "", "content": decompress(row.content)})
+
+def _thumbnail_base(document_id: int) -> str:
+    return os.path.join(settings.thumbnail_dir, str(document_id))
+
+def _remove_thumbnails(document_id: int, keep: Optional[str] = None) -> None:
+    for path in glob.glob(_thumbnail_base(document_id) + ".*"):
+        if path != keep:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning("Could not remove thumbnail %s: %s", path, e)
+
+def prepare(document_id: int, action: str) -> Optional[Tuple[str, str]]:
+    """(file_path, filename) if the document needs extracting; refreshes a stale title in place."""
+    db = SessionLocal()
+    try:
+        document = db.get(Document, document_id)
+        if document is None:
+            return None
+        row = db.get(DocumentText, document_id)
+        if (action == "created" or row is None or document.text_status is None
+                or row.source_hash != document.content_hash):
+            os.makedirs(settings.thumbnail_dir, exist_ok=True)
+            return document.file_path, document.filename
+        if row.title != document.title:
+            _unindex(db, row)
+            _index(db, document_id, document.title, decompress(row.content))
+            row.title = document.title
+            db.commit()
+        return None
+    finally:
+        db.close()
+
+def store(document_id: int, result: Extracted) -> None:
+    db = SessionLocal()
+    try:
+        document = db.get(Document, document_id)
+        if document is None:
+            _remove_thumbnails(document_id)
+            return
+        row = db.get(DocumentText, document_id)
+        if row is None:
+            row = DocumentText(document_id=document_id)
+            db.add(row)
+        else:
+            _unindex(db, row)
+        row.content = compress(result.text)
+        row.title = document.title
+        row.source_hash = document.content_hash
+        _index(db, document_id, document.title, result.text)
+        document.text_status = result.status
+        document.page_count = result.page_count
+        document.thumbnail_path = result.thumbnail_path
+        changes.mark_changed(db, Document, [document_id], "updated")
+        db.commit()
+    finally:
+        db.close()
+    _remove_thumbnails(document_id, keep=result.thumbnail_path)
+
+def remove(document_id: int) -> None:
+    db = SessionLocal()
+    try:
+        row = db.get(DocumentText, document_id)
+        if row is not None and db.get(Document, document_id) is None:
+            _unindex(db, row)
+            db.delete(row)
+            db.commit()
+    finally:
+        db.close()
+    _remove_thumbnails(document_id)
+
+def reconcile() -> Dict[int, str]:
+    """Work the change feed missed: unprocessed, stale, newly supported and deleted documents."""
+    db = SessionLocal()
+    try:
+        work: Dict[int, str] = {}
+        rows = db.execute(
+            select(Document.id, Document.text_status, Document.title, Document.content_hash,
+                   Document.filename, Document.file_path,
+                   DocumentText.title.label("indexed_title"), DocumentText.source_hash)
+            .outerjoin(DocumentText, DocumentText.document_id == Document.id)
+        )
+        for row in rows:
+            if row.text_status is None:
+                work[row.id] = "created"
+            elif row.text_status == "unsupported" and supported(row.filename or row.file_path or ""):
+                work[row.id] = "created"
+            elif row.indexed_title != row.title or row.source_hash != row.content_hash:
+                work[row.id] = "updated"
+        orphans = db.scalars(
+            select(DocumentText.document_id).outerjoin(Document, Document.id == DocumentText.document_id)
+            .where(Document.id.is_(None))
+        )
+        work.update((document_id, "deleted") for document_id in orphans)
+        return work
+    finally:
+        db.close()
+
+class ExtractionPipeline:
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def on_changes(self, changed: changes.Changes) -> None:
+        """Queue committed document changes; called from whichever thread committed."""
+        documents = changed.get(Document.__tablename__)
+        if documents and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, dict(documents))
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # spawn, not fork: this process runs threads (logging, file I/O) whose
+        # locks a forked child could inherit mid-acquire.
+        return ProcessPoolExecutor(
+            max_workers=settings.extract_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    async def run(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._executor = self._new_executor()
+        slots = asyncio.Semaphore(settings.extract_workers)
+        try:
+            if await asyncio.to_thread(coordinator.try_acquire_lease, RECONCILE_LEASE, RECONCILE_LEASE_TTL_S):
+                work = await asyncio.to_thread(reconcile)
+                if work:
+                    logger.info("Document text backlog queued", extra={"documents": len(work)})
+                    self._queue.put_nowait(work)
+        except Exception:
+            logger.exception("Document text reconcile error")
+        try:
+            while True:
+                batch = await self._queue.get()
+                for document_id, action in batch.items():
+                    await slots.acquire()
+                    task = asyncio.create_task(self._process(document_id, action))
+                    task.add_done_callback(lambda _: slots.release())
+        finally:
+            self._loop = None
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _process(self, document_id: int, action: str) -> None:
+        token = bind_request_id(f"extract-{document_id}")
+        try:
+            if action == "deleted":
+                await asyncio.to_thread(remove, document_id)
+                return
+            source = await asyncio.to_thread(prepare, document_id, action)
+            if source is None:
+                return
+            executor = self._executor
+            try:
+                result = await self._loop.run_in_executor(
+                    executor, extract, source[0], source[1], _thumbnail_base(document_id)
+                )
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool) and self._executor is executor:
+                    # A child died (e.g. a crash inside a PDF library); start a fresh pool.
+                    self._executor = self._new_executor()
+                    executor.shutdown(wait=False)
+                logger.warning("Text extraction failed", extra={"document_id": document_id, "error": repr(e)})
+                result = Extracted("failed", detail=repr(e))
+            await asyncio.to_thread(store, document_id, result)
+        except Exception:
+            logger.exception("Document text pipeline error", extra={"document_id": document_id})
+        finally:
+            request_id.reset(token)
+
+pipeline = ExtractionPipeline()
+changes.subscribe_local(pipeline.on_changes)
+
+def _terms(query: str) -> List[str]:
+    return re.findall(r"\w+", query.lower())[:MAX_QUERY_TERMS]
+
+def _snippet(content: str, terms: List[str]) -> Optional[str]:
+    if not content:
+        return None
+    lowered = content.lower()
+    found = [pos for pos in (lowered.find(term) for term in terms) if pos >= 0]
+    start = max(min(found) - SNIPPET_CHARS, 0) if found else 0
+    snippet = " ".join(content[start:start + SNIPPET_CHARS * 3].split())
+    return ("…" if start else "") + snippet + ("…" if start + SNIPPET_CHARS * 3 < len(content) else "")
+
+def search(db: Session, query: str, limit: int) -> List[Tuple[Document, Optional[str]]]:
+    """Visible documents matching every word of ``query`` (as prefixes), best first."""
+    terms = _terms(query)
+    if not terms:
+        return []
+    match = " ".join(f'"{term}"*' for term in terms)
+    ids = db.scalars(text(
+        f"SELECT documents.id FROM {FTS_TABLE} JOIN documents ON documents.id = {FTS_TABLE}.rowid "
+        f"WHERE {FTS_TABLE} MATCH :match AND documents.is_visible = 1 "
+        f"ORDER BY bm25({FTS_TABLE}, 4.0, 1.0) LIMIT :limit"
+    ), {"match": match, "limit": limit}).all()
+    if not ids:
+        return []
+    documents = {d.id: d for d in db.scalars(select(Document).where(Document.id.in_(ids)))}
+    contents = dict(db.execute(
+        select(DocumentText.document_id, DocumentText.content).where(DocumentText.document_id.in_(ids))
+    ).all())
+    return [(documents[i], _snippet(decompress(contents.get(i)), terms)) for i in ids if i in documents]
@@ -0,0 +1,123 @@
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, Iterable, NamedTuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from ..database import SessionLocal
+from .metrics import registry, GaugeFunc
+
+# Document file I/O off the event loop. Every filesystem call runs on a small
+# dedicated thread pool, wrapped in coroutines for the handlers.
+#
+# Deleting a file is tied to the transaction that deletes its row:
+# remove_after_commit() records the path on the session and the file is only
+# removed once the commit succeeded (a rollback keeps it). Removal failures
+# go to a cleanup queue that is retried in the background; anything still
+# left after MAX_ATTEMPTS is picked up by the integrity scrubber as an
+# orphan.
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="files")
+
+COPY_CHUNK_SIZE = 1024 * 1024
+RETRY_INTERVAL_S = 30
+MAX_ATTEMPTS = 10
+
+class StoredFile(NamedTuple):
+    size: int
+    content_hash: str
+    mtime: float
+
+async def run_in_pool(fn, *args):
+    """Run a blocking filesystem function on the file I/O pool."""
+    return await asyncio.get_running_loop().run_in_executor(_executor, fn, *args)
+
+async def makedirs(path: str) -> None:
+    await run_in_pool(lambda: os.makedirs(path, exist_ok=True))
+
+async def exists(path: str) -> bool:
+    return await run_in_pool(os.path.exists, path)
+
+async def stat(path: str) -> os.stat_result:
+    """os.stat on the I/O pool; raises FileNotFoundError like os.stat."""
+    return await run_in_pool(os.stat, path)
+
+def save_blocking(source: BinaryIO, path: str) -> StoredFile:
+    """Copy ``source`` to ``path``; for code already running on a worker thread."""
+    digest = hashlib.sha256()
+    size = 0
+    source.seek(0)
+    with open(path, "wb") as out:
+        for chunk in iter(lambda: source.read(COPY_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            out.write(chunk)
+            size += len(chunk)
+    return StoredFile(size, digest.hexdigest(), os.stat(path).st_mtime)
+
+async def save(source: BinaryIO, path: str) -> StoredFile:
+    """Copy ``source`` to ``path`` in chunks, hashing it on the way."""
+    return await run_in_pool(save_blocking, source, path)
+
+class CleanupQueue:
+    def __init__(self):
+        self._pending: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, paths: Iterable[str]) -> None:
+        """Remove files in the background; safe to call from any thread."""
+        for path in paths:
+            _executor.submit(self._attempt, path)
+
+    def _attempt(self, path: str) -> bool:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            with self._lock:
+                attempts = self._pending.get(path, 0) + 1
+                if attempts >= MAX_ATTEMPTS:
+                    self._pending.pop(path, None)
+                    logger.error("Giving up removing %s after %d attempts: %s", path, attempts, e)
+                else:
+                    self._pending[path] = attempts
+                    logger.warning("Could not remove %s (attempt %d): %s", path, attempts, e)
+            return False
+        with self._lock:
+            self._pending.pop(path, None)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def run_retries(self) -> None:
+        while True:
+            await asyncio.sleep(RETRY_INTERVAL_S)
+            with self._lock:
+                paths = list(self._pending)
+            for path in paths:
+                await run_in_pool(self._attempt, path)
+
+cleanup = CleanupQueue()
+
+registry.register(GaugeFunc(
+    "fsp_file_cleanup_pending", "Files whose removal failed and is waiting for a retry.", lambda: len(cleanup)
+))
+
+def remove_after_commit(db: Session, *paths: str) -> None:
+    db.info.setdefault("files_to_remove", []).extend(paths)
+
+@event.listens_for(SessionLocal, "after_commit")
+def _after_commit(session: Session) -> None:
+    paths = session.info.pop("files_to_remove", None)
+    if paths:
+        cleanup.submit(paths)
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop("files_to_remove", None)
@@ -0,0 +1,146 @@
+import hashlib
+import re
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+from ..config import get_settings
+from ..database import SessionLocal
+from ..models.models import Event
+from . import changes, recurrence
+
+# iCalendar feed of public events (/api/events.ics). The feed body and its
+# ETag are built once and kept until an event changes; each event's VEVENT
+# text is cached separately, so a change re-renders only the affected events
+# and the rebuild is a join. Change notifications include those replayed from
+# other workers (changes.subscribe), so every worker's copy stays current.
+# Recurring events carry their RRULE and calendar apps expand them.
+
+settings = get_settings()
+
+PRODID = "-//FSP Chuvashia//Events//RU"
+UID_DOMAIN = "fsp-chuvashia"
+# Past one-off events older than this are left out of the feed.
+HISTORY_DAYS = 365
+_TIME = re.compile(r"^\s*(\d{1,2})[:.](\d{2})")
+
+def _escape(value: str) -> str:
+    return (value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+def _fold(line: str) -> str:
+    """Split a content line into 75-octet pieces (RFC 5545 3.1) without breaking UTF-8 sequences."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    pieces, current, size = [], "", 0
+    for char in line:
+        width = len(char.encode("utf-8"))
+        if size + width > (75 if not pieces else 74):
+            pieces.append(current)
+            current, size = "", 0
+        current += char
+        size += width
+    pieces.append(current)
+    return "\r\n ".join(pieces)
+
+def _timezone_block() -> List[str]:
+    """VTIMEZONE with the zone's current offset; enough for zones without DST such as Europe/Moscow."""
+    offset = datetime.now(ZoneInfo(settings.timezone)).utcoffset() or timedelta(0)
+    minutes = int(offset.total_seconds()) // 60
+    sign = "+" if minutes >= 0 else "-"
+    value = f"{sign}{abs(minutes) // 60:02d}{abs(minutes) % 60:02d}"
+    return [
+        "BEGIN:VTIMEZONE", f"TZID:{settings.timezone}",
+        "BEGIN:STANDARD", "DTSTART:19700101T000000",
+        f"TZOFFSETFROM:{value}", f"TZOFFSETTO:{value}",
+        "END:STANDARD", "END:VTIMEZONE",
+    ]
+
+def render_event(event: Event) -> str:
+    created = event.created_at or datetime.utcnow()
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:event-{event.id}@{UID_DOMAIN}",
+        f"DTSTAMP:{created:%Y%m%dT%H%M%SZ}",
+    ]
+    time_match = _TIME.match(event.event_time or "")
+    timed = bool(time_match) and int(time_match.group(1)) < 24 and int(time_match.group(2)) < 60
+    if timed:
+        lines.append(f"DTSTART;TZID={settings.timezone}:{event.event_date:%Y%m%d}T"
+                     f"{int(time_match.group(1)):02d}{time_match.group(2)}00")
+    else:
+        lines.append(f"DTSTART;VALUE=DATE:{event.event_date:%Y%m%d}")
+        lines.append(f"DTEND;VALUE=DATE:{event.event_date + timedelta(days=1):%Y%m%d}")
+    if event.recurrence:
+        rule = recurrence.parse(event.recurrence)
+        lines.append(f"RRULE:{rule.ical(ZoneInfo(settings.timezone) if timed else None)}")
+    lines.append(f"SUMMARY:{_escape(event.title or '')}")
+    if event.description:
+        lines.append(f"DESCRIPTION:{_escape(event.description)}")
+    if event.location:
+        lines.append(f"LOCATION:{_escape(event.location)}")
+    if event.event_type:
+        lines.append(f"CATEGORIES:{_escape(event.event_type)}")
+    lines.append("END:VEVENT")
+    return "".join(_fold(line) + "\r\n" for line in lines)
+
+class IcsFeed:
+    def __init__(self):
+        self._vevents: Dict[int, str] = {}
+        self._body: Optional[bytes] = None
+        self._etag: Optional[str] = None
+        self._built_on: Optional[date] = None
+        self._lock = threading.Lock()
+
+    def on_changes(self, changed: changes.Changes) -> None:
+        if Event.__tablename__ not in changed:
+            return
+        with self._lock:
+            ids = changed[Event.__tablename__]
+            if ids:
+                for event_id in ids:
+                    self._vevents.pop(event_id, None)
+            else:
+                self._vevents.clear()
+            self._body = None
+
+    @property
+    def etag(self) -> Optional[str]:
+        """ETag of the current body, or None if it needs a rebuild."""
+        return self._etag if self._body is not None and self._built_on == date.today() else None
+
+    def get(self) -> Tuple[bytes, str]:
+        """Body and ETag, rebuilt first if stale (blocking: run it in the threadpool)."""
+        with self._lock:
+            if self.etag is None:
+                with SessionLocal() as db:
+                    self._build(db)
+            return self._body, self._etag
+
+    def _build(self, db: Session) -> None:
+        today = date.today()
+        ids = db.scalars(
+            select(Event.id).where(
+                Event.is_visible == True,
+                or_(Event.event_date >= today - timedelta(days=HISTORY_DAYS), Event.recurrence.isnot(None))
+            ).order_by(Event.event_date, Event.id)
+        ).all()
+        missing = [event_id for event_id in ids if event_id not in self._vevents]
+        if missing:
+            for event in db.scalars(select(Event).where(Event.id.in_(missing))):
+                self._vevents[event.id] = render_event(event)
+        self._vevents = {event_id: self._vevents[event_id] for event_id in ids if event_id in self._vevents}
+
+        head = ["BEGIN:VCALENDAR", "VERSION:2.0", f"PRODID:{PRODID}", "CALSCALE:GREGORIAN",
+                "METHOD:PUBLISH", "X-WR-CALNAME:ФСП Чувашии", f"X-WR-TIMEZONE:{settings.timezone}"]
+        head += _timezone_block()
+        body = "".join(line + "\r\n" for line in head) + "".join(self._vevents.values()) + "END:VCALENDAR\r\n"
+        self._body = body.encode("utf-8")
+        self._etag = f'"{hashlib.sha256(self._body).hexdigest()[:32]}"'
+        self._built_on = today
+
+ics_feed = IcsFeed()
+changes.subscribe(ics_feed.on_changes)
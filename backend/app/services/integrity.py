@@ -0,0 +1,151 @@
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import select, update
+from ..config import get_settings
+from ..database import SessionLocal
+from ..models.models import Document
+from . import changes
+
+# File integrity index for uploaded documents. Every document row stores the
+# SHA-256 and mtime of its file as last verified; the download path trusts a
+# row that has a hash and skips the filesystem check. The scrubber walks the
+# upload directory with os.scandir in batches and reconciles it with the
+# index:
+#
+# - files without a row are orphans (removed with ``repair`` once they are
+#   older than ORPHAN_GRACE_S, so in-flight uploads are never touched);
+# - rows whose file is gone are "missing": their hash is cleared so downloads
+#   check the filesystem again and answer 404;
+# - files whose size or mtime changed are re-hashed; a different hash is a
+#   mismatch, and ``repair`` accepts the file on disk as the new content.
+#
+# Rows never verified (hash NULL, e.g. created before the index existed) are
+# hashed on the first pass.
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+SCAN_BATCH_SIZE = 500
+HASH_CHUNK_SIZE = 1024 * 1024
+ORPHAN_GRACE_S = 600
+REPORT_SAMPLE = 100
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _key(path: str) -> str:
+    return os.path.normcase(os.path.normpath(path))
+
+@dataclass
+class ScrubReport:
+    repair: bool
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    duration_ms: float = 0.0
+    scanned_files: int = 0
+    indexed: int = 0
+    orphans: List[str] = field(default_factory=list)
+    orphan_count: int = 0
+    removed_orphans: int = 0
+    missing: List[int] = field(default_factory=list)
+    missing_count: int = 0
+    mismatched: List[int] = field(default_factory=list)
+    mismatch_count: int = 0
+    repaired: int = 0
+
+    def _sample(self, items: list, item) -> None:
+        if len(items) < REPORT_SAMPLE:
+            items.append(item)
+
+def _scan(directory: str) -> Iterator[List[Tuple[str, os.stat_result]]]:
+    if not os.path.isdir(directory):
+        return
+    batch = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                batch.append((entry.path, entry.stat(follow_symlinks=False)))
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    yield batch
+                    batch = []
+    if batch:
+        yield batch
+
+def scrub(repair: bool = False, directory: Optional[str] = None) -> ScrubReport:
+    """Reconcile the upload directory with the document index (blocking)."""
+    directory = directory or settings.upload_dir
+    report = ScrubReport(repair=repair)
+    started = time.perf_counter()
+    seen = set()
+    db = SessionLocal()
+    try:
+        for batch in _scan(directory):
+            report.scanned_files += len(batch)
+            by_key: Dict[str, Tuple[str, os.stat_result]] = {_key(path): (path, st) for path, st in batch}
+            seen.update(by_key)
+            rows = db.execute(
+                select(Document.id, Document.file_path, Document.file_size, Document.content_hash, Document.file_mtime)
+                .where(Document.file_path.in_([path for path, _ in batch]))
+            ).all()
+            matched = set()
+            for row in rows:
+                key = _key(row.file_path)
+                matched.add(key)
+                path, st = by_key[key]
+                if row.content_hash is not None and row.file_mtime == st.st_mtime and row.file_size == st.st_size:
+                    continue
+                digest = file_hash(path)
+                values = {"content_hash": digest, "file_mtime": st.st_mtime, "file_size": st.st_size}
+                if row.content_hash is None:
+                    report.indexed += 1
+                elif digest == row.content_hash:
+                    values.pop("file_size")
+                else:
+                    report.mismatch_count += 1
+                    report._sample(report.mismatched, row.id)
+                    if not repair:
+                        continue
+                    report.repaired += 1
+                db.execute(update(Document).where(Document.id == row.id).values(**values))
+                changes.mark_changed(db, Document, [row.id], "updated")
+            db.commit()
+
+            for key, (path, st) in by_key.items():
+                if key in matched:
+                    continue
+                report.orphan_count += 1
+                report._sample(report.orphans, path)
+                if repair and time.time() - st.st_mtime > ORPHAN_GRACE_S:
+                    try:
+                        os.remove(path)
+                        report.removed_orphans += 1
+                    except OSError as e:
+                        logger.warning("Could not remove orphan %s: %s", path, e)
+
+        missing_ids = [
+            row.id for row in db.execute(select(Document.id, Document.file_path)).yield_per(SCAN_BATCH_SIZE)
+            if _key(row.file_path) not in seen
+        ]
+        report.missing_count = len(missing_ids)
+        report.missing = missing_ids[:REPORT_SAMPLE]
+        for start in range(0, len(missing_ids), SCAN_BATCH_SIZE):
+            ids = missing_ids[start:start + SCAN_BATCH_SIZE]
+            result = db.execute(
+                update(Document).where(Document.id.in_(ids), Document.content_hash.isnot(None))
+                .values(content_hash=None, file_mtime=None)
+            )
+            if result.rowcount:
+                changes.mark_changed(db, Document, ids, "updated")
+        db.commit()
+    finally:
+        db.close()
+    report.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+    return report
@@ -0,0 +1,106 @@
+import atexit
+import json
+import logging
+import queue
+import random
+import re
+import sys
+import uuid
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+from ..config import get_settings
+
+# Structured logging. Records are put on an in-process queue as copies with
+# the message merged (so later changes to the arguments cannot leak in) and
+# a listener thread encodes them as one JSON object per line and writes them
+# to stdout, so logging never blocks the event loop on I/O. Every record carries the current request ID,
+# taken from a context variable that the request middleware sets and that
+# follows the request into DB hooks, to_thread calls and background tasks;
+# scheduled jobs bind their own ID per run.
+
+settings = get_settings()
+
+request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+REQUEST_ID_HEADER = "X-Request-ID"
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,64}$")
+
+# LogRecord attributes that are not user-supplied ``extra`` fields.
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+def new_request_id(incoming: Optional[str] = None) -> str:
+    """The client's request ID if it looks sane, otherwise a fresh one."""
+    if incoming and _VALID_REQUEST_ID.match(incoming):
+        return incoming
+    return uuid.uuid4().hex
+
+def bind_request_id(value: Optional[str] = None) -> Token:
+    return request_id.set(value or uuid.uuid4().hex)
+
+def sampled(rate: float) -> bool:
+    """Decide up front whether a hot-path log call is worth making at all."""
+    return rate >= 1 or random.random() < rate
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["request_id"] = record.request_id
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class _MessageFormatter(logging.Formatter):
+    """Just the merged message; the traceback travels separately in exc_text."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return record.getMessage()
+
+class _ContextQueueHandler(QueueHandler):
+    """Queues a merged copy of the record tagged with the caller's request ID."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.setFormatter(_MessageFormatter())
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = self.formatter.formatException(record.exc_info)
+        # The base class drops exc_info and exc_text from the copy it queues.
+        record = super().prepare(record)
+        record.exc_text = exc_text
+        record.request_id = request_id.get()
+        return record
+
+_listener: Optional[QueueListener] = None
+
+def setup_logging() -> None:
+    """Route the root logger through the queue; safe to call more than once."""
+    global _listener
+    if _listener is not None:
+        return
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter())
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_ContextQueueHandler(log_queue))
+    root.setLevel(settings.log_level.upper())
@@ -0,0 +1,197 @@
+import bisect
+import threading
+from typing import Callable, Dict, List, Sequence, Tuple
+
+# Metrics are plain Python numbers updated in place. Updates come from the
+# event loop and from threadpool work (DB timings of projection reloads,
+# to_thread jobs), so each value has its own lock; the metric's lock guards
+# creating a new label child, which happens once per label combination.
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _format_labels(labelnames: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default = self._new_child()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _samples(self) -> List[str]:
+        if not self.labelnames:
+            return self._child_samples((), self._default)
+        lines = []
+        for key, child in list(self._children.items()):
+            lines.extend(self._child_samples(key, child))
+        return lines
+
+    def _child_samples(self, key, child) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}"]
+
+    def render(self) -> str:
+        header = f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.type_name}\n"
+        return header + "".join(line + "\n" for line in self._samples())
+
+class _Value:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1):
+        self._default.inc(amount)
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+    def dec(self, amount: float = 1):
+        self._default.dec(amount)
+
+    def set(self, value: float):
+        self._default.set(value)
+
+class GaugeFunc(_Metric):
+    """Gauge whose value is read from a callback at scrape time."""
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, func: Callable[[], float]):
+        self._func = func
+        super().__init__(name, documentation)
+
+    def _new_child(self):
+        return None
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name} {_format_value(self._func())}"]
+
+class _HistogramValue:
+    __slots__ = ("upper_bounds", "counts", "sum", "_lock")
+
+    def __init__(self, upper_bounds):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * len(upper_bounds)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, amount: float):
+        index = bisect.bisect_left(self.upper_bounds, amount)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += amount
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        with self._lock:
+            return list(self.counts), self.sum
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets=DEFAULT_BUCKETS):
+        self.upper_bounds = tuple(sorted(buckets)) + (float("inf"),)
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramValue(self.upper_bounds)
+
+    def observe(self, amount: float):
+        self._default.observe(amount)
+
+    def _child_samples(self, key, child) -> List[str]:
+        lines = []
+        cumulative = 0
+        counts, total = child.snapshot()
+        for bound, count in zip(self.upper_bounds, counts):
+            cumulative += count
+            labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "".join(metric.render() for metric in self._metrics)
+
+registry = Registry()
+
+http_request_duration = registry.register(Histogram(
+    "fsp_http_request_duration_seconds", "HTTP request latency by route.", ("method", "route", "status")
+))
+http_requests_in_flight = registry.register(Gauge(
+    "fsp_http_requests_in_flight", "HTTP requests currently being served."
+))
+telegram_sync_duration = registry.register(Histogram(
+    "fsp_telegram_sync_duration_seconds", "Duration of Telegram news synchronization.",
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60)
+))
+telegram_sync_runs = registry.register(Counter(
+    "fsp_telegram_sync_runs_total", "Telegram synchronization runs by outcome.", ("outcome",)
+))
+telegram_posts_ingested = registry.register(Counter(
+    "fsp_telegram_posts_ingested_total", "News items created from Telegram posts."
+))
+email_queue_depth = registry.register(Gauge(
+    "fsp_contact_email_queue_depth", "Contact email notifications waiting to be sent."
+))
+email_send_duration = registry.register(Histogram(
+    "fsp_contact_email_send_duration_seconds", "Contact email SMTP send latency.",
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+))
+email_sent = registry.register(Counter(
+    "fsp_contact_emails_total", "Contact email notifications by outcome.", ("outcome",)
+))
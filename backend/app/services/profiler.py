@@ -0,0 +1,223 @@
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy import select
+from ..config import get_settings
+from ..database import SessionLocal
+from ..models.models import AppState
+from . import changes
+
+# Statistical profiler for individual requests. While profiling is switched
+# on (by an admin, see routes.admin), a sampled fraction of requests - plus
+# any request carrying the debug header - is profiled: a background thread
+# snapshots the stack of the thread serving the request every few
+# milliseconds. Stacks are written in the folded format ("a;b;c 12") that
+# flamegraph.pl and speedscope read, one file per request, in a directory
+# that keeps only the newest ``profile_keep`` profiles.
+#
+# Handlers share the event loop thread, so samples can include other
+# requests running concurrently; with low sampling rates this is rare.
+#
+# The on/off switch and sample rate live in app_state so every worker
+# follows the same setting: changing it marks app_state changed and other
+# workers reload it when the change reaches them. The per-request check
+# only reads the cached setting; a stale one is reloaded in a background
+# thread, so no request waits on the database for it.
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+DEBUG_HEADER = "x-debug-profile"
+STATE_KEY = "profiler"
+
+class _Session:
+    __slots__ = ("id", "thread_id", "stacks", "started")
+
+    def __init__(self, thread_id: int):
+        self.id = f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}"
+        self.thread_id = thread_id
+        self.stacks: Counter = Counter()
+        self.started = time.perf_counter()
+
+class Profiler:
+    def __init__(self, directory: str, keep: int, interval_ms: float):
+        self.directory = directory
+        self.keep = keep
+        self.interval = interval_ms / 1000
+        self.enabled = False
+        self.sample_rate = 0.0
+        self._stale = True
+        self._reloading = False
+        self._active: Dict[str, _Session] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    # Settings
+
+    def configure(self, enabled: bool, sample_rate: float) -> None:
+        """Persist the switch for all workers; takes effect here immediately."""
+        value = json.dumps({"enabled": enabled, "sample_rate": sample_rate})
+        db = SessionLocal()
+        try:
+            db.merge(AppState(key=STATE_KEY, value=value, updated_at=datetime.utcnow()))
+            changes.mark_changed(db, AppState)
+            db.commit()
+        finally:
+            db.close()
+        self.enabled, self.sample_rate, self._stale = enabled, sample_rate, False
+
+    def _load(self) -> None:
+        # Cleared first: a change arriving while reading marks it stale again.
+        self._stale = False
+        db = SessionLocal()
+        try:
+            value = db.execute(select(AppState.value).where(AppState.key == STATE_KEY)).scalar()
+        except Exception:
+            self._stale = True
+            raise
+        finally:
+            db.close()
+        state = json.loads(value) if value else {}
+        self.enabled = state.get("enabled", False)
+        self.sample_rate = state.get("sample_rate", 0.0)
+
+    def on_changes(self, changed: changes.Changes) -> None:
+        if AppState.__tablename__ in changed:
+            self._stale = True
+
+    def refresh(self) -> None:
+        """Reload a stale setting now (blocking)."""
+        if self._stale:
+            self._load()
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._reloading:
+                return
+            self._reloading = True
+        threading.Thread(target=self._background_load, name="profiler-settings", daemon=True).start()
+
+    def _background_load(self) -> None:
+        try:
+            self._load()
+        except Exception:
+            logger.exception("Failed to load profiler settings")
+        finally:
+            self._reloading = False
+
+    def should_profile(self, headers) -> bool:
+        """Per-request check against the cached setting; never blocks."""
+        if self._stale:
+            self._refresh_in_background()
+        if not self.enabled:
+            return False
+        return headers.get(DEBUG_HEADER) == "1" or random.random() < self.sample_rate
+
+    # Sampling
+
+    def start(self) -> _Session:
+        session = _Session(threading.get_ident())
+        with self._lock:
+            self._active[session.id] = session
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._sample_loop, name="profiler", daemon=True)
+                self._thread.start()
+        return session
+
+    def stop(self, session: _Session, method: str, path: str, status_code: int) -> dict:
+        with self._lock:
+            self._active.pop(session.id, None)
+        info = {
+            "id": session.id,
+            "method": method,
+            "path": path,
+            "status_code": status_code,
+            "duration_ms": round((time.perf_counter() - session.started) * 1000, 1),
+            "samples": sum(session.stacks.values()),
+            "created_at": datetime.utcnow().isoformat(),
+        }
+        self._store(info, session.stacks)
+        return info
+
+    def _sample_loop(self) -> None:
+        own_id = threading.get_ident()
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self._active:
+                    self._thread = None
+                    return
+                sessions = list(self._active.values())
+            frames = sys._current_frames()
+            for session in sessions:
+                frame = frames.get(session.thread_id)
+                if frame is not None and session.thread_id != own_id:
+                    session.stacks[_fold(frame)] += 1
+
+    # Storage
+
+    def _store(self, info: dict, stacks: Counter) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, info["id"])
+        with open(base + ".folded", "w", encoding="utf-8") as f:
+            f.writelines(f"{stack} {count}\n" for stack, count in stacks.most_common())
+        with open(base + ".json", "w", encoding="utf-8") as f:
+            json.dump(info, f)
+        stored = sorted(name[:-5] for name in os.listdir(self.directory) if name.endswith(".json"))
+        for profile_id in stored[:-self.keep]:
+            self._remove(profile_id)
+
+    def _remove(self, profile_id: str) -> None:
+        for ext in (".json", ".folded"):
+            try:
+                os.remove(os.path.join(self.directory, profile_id + ext))
+            except FileNotFoundError:
+                pass
+
+    def list_profiles(self) -> List[dict]:
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for name in sorted(os.listdir(self.directory), reverse=True):
+            if name.endswith(".json"):
+                try:
+                    with open(os.path.join(self.directory, name), encoding="utf-8") as f:
+                        profiles.append(json.load(f))
+                except (OSError, ValueError):
+                    continue
+        return profiles
+
+    def read_folded(self, profile_id: str) -> Optional[str]:
+        if os.path.basename(profile_id) != profile_id:
+            return None
+        try:
+            with open(os.path.join(self.directory, profile_id + ".folded"), encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def clear(self) -> int:
+        profiles = self.list_profiles()
+        for info in profiles:
+            self._remove(info["id"])
+        return len(profiles)
+
+def _fold(frame) -> str:
+    """Root-to-leaf ``module:function`` names joined with semicolons."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+profiler = Profiler(settings.profile_dir, settings.profile_keep, settings.profile_interval_ms)
+changes.subscribe(profiler.on_changes)
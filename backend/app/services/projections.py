@@ -0,0 +1,271 @@
+import asyncio
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Set, Type
+from fastapi import Response
+from pydantic import BaseModel
+from sqlalchemy import select
+from ..database import SessionLocal
+from ..models.models import News, Event, TeamMember, LeadershipMember, Document
+from ..schemas import NewsResponse, EventResponse, TeamMemberResponse, LeadershipMemberResponse, DocumentResponse
+from . import changes
+
+# Public read models. Each projection keeps the visible rows of one table in
+# memory as response models, together with their JSON encoding, so public
+# GETs slice a ready list instead of querying and re-serializing rows.
+#
+# A committed change (admin handlers, batch, Telegram sync, and commits
+# replayed from other workers) only marks the touched ids; the next read
+# reloads just those rows (in the threadpool for request handlers) and
+# publishes a new immutable View. The reload is incremental: changed rows
+# are bisected out of and into the sorted key list, only the groups they
+# touch are rebuilt, and the id lookups are copied on write (see _Layered).
+# Table-wide changes (no ids) reload everything. Projections subscribe ahead
+# of the tagged cache, so payloads cached from them are never rebuilt from a
+# stale view.
+
+# Once a view's overlay holds more than this share of its base, the two are
+# merged into a new base.
+COMPACT_RATIO = 8
+COMPACT_MIN = 64
+
+class _Lowest:
+    """Sorts before any value; stands in for NULL sort-key columns (as SQL orders NULLs first)."""
+
+    __slots__ = ()
+
+    def __lt__(self, other):
+        return other is not self
+
+    def __gt__(self, other):
+        return False
+
+    def __le__(self, other):
+        return True
+
+    def __ge__(self, other):
+        return other is self
+
+    def __eq__(self, other):
+        return other is self
+
+    def __hash__(self):
+        return 0
+
+    def __repr__(self):
+        return "LOWEST"
+
+LOWEST = _Lowest()
+
+_MISSING = object()
+_DELETED = object()
+
+class _Layered:
+    """Read-only id -> value map: a base shared between views plus a small overlay.
+
+    A change copies only the overlay (deletions are tombstones); once the
+    overlay grows past a fraction of the base, both are merged into a new base.
+    """
+
+    __slots__ = ("base", "overlay")
+
+    def __init__(self, base: Dict[int, Any], overlay: Optional[Dict[int, Any]] = None):
+        self.base = base
+        self.overlay = overlay or {}
+
+    def __contains__(self, key) -> bool:
+        value = self.overlay.get(key, _MISSING)
+        return key in self.base if value is _MISSING else value is not _DELETED
+
+    def __getitem__(self, key):
+        value = self.overlay.get(key, _MISSING)
+        if value is _MISSING:
+            return self.base[key]
+        if value is _DELETED:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def updated(self, changes: Dict[int, Any]) -> "_Layered":
+        overlay = {**self.overlay, **changes}
+        if len(overlay) <= max(COMPACT_MIN, len(self.base) // COMPACT_RATIO):
+            return _Layered(self.base, overlay)
+        base = {**self.base, **overlay}
+        return _Layered({key: value for key, value in base.items() if value is not _DELETED})
+
+class View:
+    """Immutable snapshot of a projection: rows in display order plus lookups."""
+
+    __slots__ = ("rows", "keys", "by_id", "groups", "_encoded")
+
+    def __init__(self, rows: List[BaseModel], keys: List[tuple], by_id: _Layered,
+                 groups: Dict[Any, List[BaseModel]], encoded: _Layered):
+        self.rows = rows
+        self.keys = keys
+        self.by_id = by_id
+        self.groups = groups
+        self._encoded = encoded
+
+    def between(self, low: tuple, high: Optional[tuple] = None) -> List[BaseModel]:
+        """Rows whose sort key is in [low, high); for ascending projections."""
+        start = bisect_left(self.keys, low)
+        end = bisect_left(self.keys, high) if high is not None else len(self.keys)
+        return self.rows[start:end]
+
+    def encode(self, rows: List[BaseModel]) -> bytes:
+        base, overlay = self._encoded.base, self._encoded.overlay
+        if not overlay:
+            return b"[" + b",".join(base[row.id] for row in rows) + b"]"
+        return b"[" + b",".join(overlay.get(row.id) or base[row.id] for row in rows) + b"]"
+
+    def response(self, rows: List[BaseModel]) -> Response:
+        return Response(content=self.encode(rows), media_type="application/json")
+
+    def item_response(self, row: BaseModel) -> Response:
+        return Response(content=self._encoded[row.id], media_type="application/json")
+
+class Projection:
+    def __init__(self, model, schema: Type[BaseModel], key: Callable[[BaseModel], tuple],
+                 reverse: bool = False, group_by: Optional[str] = None):
+        self.model = model
+        self.schema = schema
+        self._key = key
+        self._reverse = reverse
+        self._group_by = group_by
+        # State of the last published view, only touched by the reloader
+        # (under _reload_lock): rows and keys in ascending key order, never
+        # mutated once published - a reload edits copies.
+        self._keys: List[tuple] = []
+        self._sorted: List[BaseModel] = []
+        self._by_id = _Layered({})
+        self._encoded = _Layered({})
+        self._groups: Dict[Any, List[BaseModel]] = {}
+        # Change bookkeeping, under _lock; it is never held across I/O, so the
+        # commit hook (on_changes) does not wait for a reload.
+        self._loaded = False
+        self._pending: Set[int] = set()
+        self._version = 0
+        self._view: Optional[View] = None
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+
+    def on_changes(self, changed: changes.Changes) -> None:
+        ids = changed.get(self.model.__tablename__)
+        if ids is None:
+            return
+        with self._lock:
+            if ids:
+                self._pending.update(ids)
+            else:
+                self._loaded = False
+            self._version += 1
+            self._view = None
+
+    def view(self) -> View:
+        """Current view; reloads changed rows first (blocking, one reloader at a time)."""
+        view = self._view
+        if view is not None:
+            return view
+        with self._reload_lock:
+            return self._view or self._reload()
+
+    async def aview(self) -> View:
+        """view() for request handlers: a reload runs in the threadpool."""
+        view = self._view
+        if view is not None:
+            return view
+        return await asyncio.to_thread(self.view)
+
+    def _sort_key(self, row: BaseModel) -> tuple:
+        return tuple(LOWEST if value is None else value for value in self._key(row))
+
+    def _reload(self) -> View:
+        with self._lock:
+            full = not self._loaded
+            self._loaded = True
+            pending, self._pending = self._pending, set()
+            version = self._version
+        try:
+            query = select(self.model).where(self.model.is_visible == True)
+            if not full:
+                query = query.where(self.model.id.in_(pending))
+            loaded = []
+            if full or pending:
+                with SessionLocal() as db:
+                    loaded = [self.schema.model_validate(obj) for obj in db.scalars(query)]
+        except Exception:
+            with self._lock:
+                self._loaded = self._loaded and not full
+                self._pending |= pending
+            raise
+
+        encoded = {row.id: row.model_dump_json().encode("utf-8") for row in loaded}
+        if full:
+            ordered = sorted(loaded, key=self._sort_key)
+            self._keys = [self._sort_key(row) for row in ordered]
+            self._sorted = ordered
+            self._by_id = _Layered({row.id: row for row in loaded})
+            self._encoded = _Layered(encoded)
+            self._groups = self._group(self._display(ordered), None)
+        else:
+            keys, ordered = list(self._keys), list(self._sorted)
+            touched = set()
+            for row_id in pending:
+                old = self._by_id.get(row_id)
+                if old is not None:
+                    index = bisect_left(keys, self._sort_key(old))
+                    del keys[index], ordered[index]
+                    touched.add(self._group_key(old))
+            for row in loaded:
+                key = self._sort_key(row)
+                index = bisect_left(keys, key)
+                keys.insert(index, key)
+                ordered.insert(index, row)
+                touched.add(self._group_key(row))
+            self._keys, self._sorted = keys, ordered
+            removed = dict.fromkeys(pending, _DELETED)
+            self._by_id = self._by_id.updated({**removed, **{row.id: row for row in loaded}})
+            self._encoded = self._encoded.updated({**removed, **encoded})
+            self._groups = self._group(self._display(ordered), touched)
+
+        rows = self._display(self._sorted)
+        view = View(rows, self._display(self._keys), self._by_id, self._groups, self._encoded)
+        with self._lock:
+            # A change that committed while rows were read stays pending and
+            # the view is not published, so the next read reloads it.
+            if self._version == version:
+                self._view = view
+        return view
+
+    def _display(self, ascending: list) -> list:
+        return ascending[::-1] if self._reverse else ascending
+
+    def _group_key(self, row: BaseModel) -> Any:
+        return getattr(row, self._group_by) if self._group_by else None
+
+    def _group(self, rows: List[BaseModel], touched: Optional[Set[Any]]) -> Dict[Any, List[BaseModel]]:
+        """Groups of ``rows``; with ``touched``, only those groups are rebuilt, the rest are shared."""
+        if not self._group_by:
+            return {}
+        groups = {} if touched is None else {
+            value: members for value, members in self._groups.items() if value not in touched
+        }
+        for row in rows:
+            value = getattr(row, self._group_by)
+            if touched is None or value in touched:
+                groups.setdefault(value, []).append(row)
+        return groups
+
+news = Projection(News, NewsResponse, lambda row: (row.published_at, row.id), reverse=True)
+events = Projection(Event, EventResponse, lambda row: (row.event_date, row.id))
+team = Projection(TeamMember, TeamMemberResponse, lambda row: (row.order, row.id))
+leadership = Projection(LeadershipMember, LeadershipMemberResponse, lambda row: (row.order, row.id))
+documents = Projection(Document, DocumentResponse, lambda row: (row.order, row.id), group_by="category_id")
+
+for _projection in (news, events, team, leadership, documents):
+    changes.subscribe(_projection.on_changes, first=True)
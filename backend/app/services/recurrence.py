@@ -0,0 +1,176 @@
+import calendar
+import heapq
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from functools import lru_cache
+from itertools import islice, takewhile
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# Recurring events. An event's ``recurrence`` holds an iCalendar RRULE
+# subset: FREQ=DAILY|WEEKLY|MONTHLY|YEARLY with INTERVAL, BYDAY (weekly
+# only), and at most one of COUNT and UNTIL. The row's event_date is the first
+# occurrence. Occurrences are never stored; they are generated lazily for the
+# window a request asks for, jumping straight to the window start where the
+# rule allows it. The same string goes into the ICS feed unchanged, so
+# calendar apps expand it themselves.
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+MAX_COUNT = 1000
+MAX_INTERVAL = 1000
+
+@dataclass(frozen=True)
+class Rule:
+    freq: str
+    interval: int = 1
+    byday: Tuple[int, ...] = ()
+    count: Optional[int] = None
+    until: Optional[date] = None
+
+    def __str__(self) -> str:
+        return self.ical()
+
+    def ical(self, tz: Optional[tzinfo] = None) -> str:
+        """RRULE value. With ``tz`` (for a DTSTART with a time) UNTIL is written
+        as a UTC DATE-TIME at the end of that day in ``tz``, as RFC 5545 requires
+        UNTIL to match DTSTART's value type."""
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.byday:
+            parts.append("BYDAY=" + ",".join(WEEKDAYS[day] for day in self.byday))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None and tz is None:
+            parts.append(f"UNTIL={self.until:%Y%m%d}")
+        elif self.until is not None:
+            end = datetime.combine(self.until, time(23, 59, 59), tzinfo=tz).astimezone(timezone.utc)
+            parts.append(f"UNTIL={end:%Y%m%dT%H%M%SZ}")
+        return ";".join(parts)
+
+def _int(name: str, value: str, upper: int) -> int:
+    if not value.isdigit() or not 1 <= int(value) <= upper:
+        raise ValueError(f"{name} must be a number from 1 to {upper}")
+    return int(value)
+
+@lru_cache(maxsize=1024)
+def parse(value: str) -> Rule:
+    """Parse an RRULE string (with or without the ``RRULE:`` prefix); raises ValueError."""
+    value = value.strip()
+    if value.upper().startswith("RRULE:"):
+        value = value[6:]
+    fields = {}
+    for part in filter(None, value.split(";")):
+        name, sep, field_value = part.partition("=")
+        if not sep:
+            raise ValueError(f"Malformed recurrence part '{part}'")
+        fields[name.strip().upper()] = field_value.strip().upper()
+
+    freq = fields.pop("FREQ", None)
+    if freq not in FREQUENCIES:
+        raise ValueError(f"FREQ must be one of {', '.join(FREQUENCIES)}")
+    interval = _int("INTERVAL", fields.pop("INTERVAL"), MAX_INTERVAL) if "INTERVAL" in fields else 1
+    byday: Tuple[int, ...] = ()
+    if "BYDAY" in fields:
+        if freq != "WEEKLY":
+            raise ValueError("BYDAY is only supported with FREQ=WEEKLY")
+        days = fields.pop("BYDAY").split(",")
+        if not all(day in WEEKDAYS for day in days):
+            raise ValueError(f"BYDAY values must be among {', '.join(WEEKDAYS)}")
+        byday = tuple(sorted({WEEKDAYS.index(day) for day in days}))
+    count = _int("COUNT", fields.pop("COUNT"), MAX_COUNT) if "COUNT" in fields else None
+    until = None
+    if "UNTIL" in fields:
+        try:
+            until = datetime.strptime(fields.pop("UNTIL")[:8], "%Y%m%d").date()
+        except ValueError:
+            raise ValueError("UNTIL must be a date as YYYYMMDD")
+    if count is not None and until is not None:
+        raise ValueError("Use either COUNT or UNTIL, not both")
+    if fields:
+        raise ValueError(f"Unsupported recurrence parts: {', '.join(sorted(fields))}")
+    return Rule(freq, interval, byday, count, until)
+
+def normalize(value: Optional[str]) -> Optional[str]:
+    """Canonical form of a rule for storage; empty means not recurring."""
+    if value is None or not value.strip():
+        return None
+    return str(parse(value))
+
+def _add_months(start: date, months: int) -> Optional[date]:
+    """Same day of month ``months`` later; None if that month is too short (RFC 5545 skips it)."""
+    year, month = divmod(start.month - 1 + months, 12)
+    year += start.year
+    if year > date.max.year or start.day > calendar.monthrange(year, month + 1)[1]:
+        return None
+    return date(year, month + 1, start.day)
+
+def _candidates(rule: Rule, start: date, first_period: int) -> Iterator[date]:
+    period = first_period
+    while True:
+        try:
+            if rule.freq == "DAILY":
+                yield start + timedelta(days=period * rule.interval)
+            elif rule.freq == "WEEKLY":
+                week = start - timedelta(days=start.weekday()) + timedelta(weeks=period * rule.interval)
+                for day in rule.byday or (start.weekday(),):
+                    candidate = week + timedelta(days=day)
+                    if candidate >= start:
+                        yield candidate
+            else:
+                months = period * rule.interval * (12 if rule.freq == "YEARLY" else 1)
+                candidate = _add_months(start, months)
+                if candidate is not None:
+                    yield candidate
+                elif start.year + months // 12 > date.max.year:
+                    return
+        except OverflowError:
+            return
+        period += 1
+
+def _first_period(rule: Rule, start: date, after: date) -> int:
+    """A period index at or before the one containing ``after``."""
+    if after <= start:
+        return 0
+    if rule.freq == "DAILY":
+        return (after - start).days // rule.interval
+    if rule.freq == "WEEKLY":
+        week = start - timedelta(days=start.weekday())
+        return (after - week).days // (7 * rule.interval)
+    months = (after.year - start.year) * 12 + after.month - start.month
+    return max(months // (rule.interval * (12 if rule.freq == "YEARLY" else 1)) - 1, 0)
+
+def occurrences(rule: Rule, start: date, after: Optional[date] = None) -> Iterator[date]:
+    """Occurrence dates of ``rule`` from ``start`` on (only those >= ``after``), lazily, in order."""
+    after = after or start
+    if rule.count is not None:
+        # COUNT numbers occurrences from the start, so no jumping ahead.
+        dates = islice(_candidates(rule, start, 0), rule.count)
+    else:
+        dates = _candidates(rule, start, _first_period(rule, start, after))
+    if rule.until is not None:
+        dates = takewhile(lambda d: d <= rule.until, dates)
+    return (d for d in dates if d >= after)
+
+def in_window(value: str, start: date, window_start: date, window_end: date) -> List[date]:
+    """Occurrences in the half-open window [window_start, window_end)."""
+    return list(takewhile(lambda d: d < window_end, occurrences(parse(value), start, window_start)))
+
+def upcoming(items: Iterable[Tuple[object, date, Optional[str]]], today: date, limit: int) -> List[Tuple[object, date]]:
+    """The next ``limit`` (item, date) pairs from (item, start, rule) triples.
+
+    Each recurring item becomes a lazy stream of its future dates; the streams
+    are merged so only ``limit`` occurrences are ever generated per item.
+    """
+    def stream(item, start: date, rule: str) -> Iterator[Tuple[date, object]]:
+        for d in occurrences(parse(rule), start, today):
+            yield d, item
+
+    streams = []
+    for item, start, rule in items:
+        if rule:
+            streams.append(stream(item, start, rule))
+        elif start >= today:
+            streams.append(iter([(start, item)]))
+    merged = heapq.merge(*streams, key=lambda pair: pair[0])
+    return [(item, d) for d, item in islice(merged, limit)]
@@ -0,0 +1,110 @@
+import heapq
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from ..database import SessionLocal
+from ..models.models import RevokedToken
+from . import changes
+from .metrics import registry, GaugeFunc
+
+# Denylist of revoked token IDs (access/refresh ``jti``) and session IDs
+# (``sid``, shared by every token issued from one login). Entries only need
+# to live until the token would have expired on its own, so the set stays as
+# small as the number of recent logouts.
+#
+# The table is the source of truth; every worker mirrors it in a dict for
+# O(1) checks, loaded on first use and kept current through the change feed
+# (revocations made by other workers arrive within INVALIDATION_POLL_MS).
+# Expired entries are evicted from a min-heap as checks happen, and purged
+# from the table when new entries are written.
+
+class RevocationStore:
+    def __init__(self):
+        self._expiry: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def _add(self, jti: str, expires_at: float) -> None:
+        if expires_at > self._expiry.get(jti, 0):
+            self._expiry[jti] = expires_at
+            heapq.heappush(self._heap, (expires_at, jti))
+
+    def _evict(self, now: float) -> None:
+        while self._heap and self._heap[0][0] <= now:
+            expires_at, jti = heapq.heappop(self._heap)
+            if self._expiry.get(jti) == expires_at:
+                del self._expiry[jti]
+
+    def _load(self, db: Optional[Session] = None, ids: Optional[List[int]] = None) -> None:
+        own = db is None
+        db = db or SessionLocal()
+        try:
+            query = select(RevokedToken.jti, RevokedToken.expires_at).where(RevokedToken.expires_at > datetime.utcnow())
+            if ids is not None:
+                query = query.where(RevokedToken.id.in_(ids))
+            rows = db.execute(query).all()
+        finally:
+            if own:
+                db.close()
+        with self._lock:
+            for jti, expires_at in rows:
+                self._add(jti, _epoch(expires_at))
+
+    def is_revoked(self, *ids: Optional[str]) -> bool:
+        if not self._loaded:
+            self._load()
+            self._loaded = True
+        with self._lock:
+            self._evict(time.time())
+            return any(jti in self._expiry for jti in ids if jti)
+
+    def revoke(self, db: Session, entries: Dict[str, float]) -> int:
+        """Deny each ID until its expiry (epoch seconds); commits.
+
+        Returns how many were newly revoked: IDs already in the table are
+        skipped by the unique ``jti``, so the insert itself decides who wins
+        when several requests (or workers) revoke the same ID at once.
+        """
+        now = datetime.utcnow()
+        db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+        rows = [
+            {"jti": jti, "expires_at": datetime.utcfromtimestamp(expires_at), "created_at": now}
+            for jti, expires_at in entries.items()
+        ]
+        ids = db.scalars(
+            sqlite_insert(RevokedToken).on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+            .returning(RevokedToken.id),
+            rows
+        ).all()
+        if ids:
+            changes.mark_changed(db, RevokedToken, ids, "created")
+        db.commit()
+        with self._lock:
+            for jti, expires_at in entries.items():
+                self._add(jti, expires_at)
+        return len(ids)
+
+    def claim(self, db: Session, jti: str, expires_at: float) -> bool:
+        """Revoke a single-use token; False if it was already used."""
+        return self.revoke(db, {jti: expires_at}) == 1
+
+    def on_changes(self, changed: changes.Changes) -> None:
+        ids = changed.get(RevokedToken.__tablename__)
+        if ids and self._loaded:
+            self._load(ids=list(ids))
+
+def _epoch(value: datetime) -> float:
+    return (value - datetime(1970, 1, 1)).total_seconds()
+
+revocations = RevocationStore()
+changes.subscribe(revocations.on_changes)
+
+registry.register(GaugeFunc("fsp_revoked_tokens", "Revoked token and session IDs held in memory.", lambda: len(revocations)))
@@ -0,0 +1,210 @@
+import html
+import json
+import os
+import re
+from datetime import date
+from typing import Callable, Dict, List, Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from ..database import SessionLocal
+from ..schemas import (
+    NewsResponse, EventResponse, TeamMemberResponse, LeadershipMemberResponse,
+    DocumentCategoryResponse
+)
+from . import changes, projections
+
+# Pre-rendered HTML for the public SPA routes. Each snapshot is the built
+# index.html with the page's content rendered into #root (for crawlers and
+# first paint) and the same data the API returns embedded as
+# window.__INITIAL_DATA__. Snapshots are rendered on first request, kept in
+# memory, and only the pages that depend on a committed change are dropped.
+
+SITE_TITLE = "ФСП Чувашии"
+
+# Static pages and the tables their content comes from.
+PAGE_TABLES = {
+    "/": {"news", "events"},
+    "/news": {"news"},
+    "/events": {"events"},
+    "/team": {"team_members"},
+    "/leadership": {"leadership_members"},
+    "/documents": {"documents", "document_categories"},
+}
+# Pages whose content depends on today's date and must be re-rendered daily.
+DATED_PAGES = {"/", "/events"}
+NEWS_DETAIL = re.compile(r"^/news/(\d+)$")
+
+Page = Tuple[str, str, str, object]  # title, description, body html, initial data
+
+def _e(value) -> str:
+    return html.escape(str(value)) if value is not None else ""
+
+def _excerpt(text: Optional[str], length: int = 200) -> str:
+    text = " ".join((text or "").split())
+    return text if len(text) <= length else text[:length].rstrip() + "…"
+
+def _dump(items, schema) -> list:
+    return [schema.model_validate(item).model_dump(mode="json") for item in items]
+
+def _news_list_html(news: List[dict]) -> str:
+    return "".join(
+        f'<article><h2><a href="/news/{n["id"]}">{_e(n["title"])}</a></h2>'
+        f'<time datetime="{n["published_at"]}">{n["published_at"][:10]}</time>'
+        f'<p>{_e(_excerpt(n["content"]))}</p></article>'
+        for n in news
+    )
+
+def _events_list_html(events: List[dict]) -> str:
+    return "".join(
+        f'<article><h2>{_e(e["title"])}</h2>'
+        f'<time datetime="{e["event_date"]}">{e["event_date"]} {_e(e["event_time"])}</time>'
+        f'<p>{_e(e["location"])}</p><p>{_e(_excerpt(e["description"]))}</p></article>'
+        for e in events
+    )
+
+def _members_html(members: List[dict]) -> str:
+    return "".join(
+        f'<li><strong>{_e(m["full_name"])}</strong> {_e(m.get("position"))} {_e(m.get("city"))}</li>'
+        for m in members
+    )
+
+def _categories_html(categories: List[dict]) -> str:
+    return "".join(
+        f'<section><h2>{_e(c["name"])}</h2><ul>'
+        + "".join(f'<li><a href="/api/documents/{d["id"]}/download">{_e(d["title"])}</a></li>'
+                  for d in c["documents"] if d["is_visible"])
+        + f'</ul>{_categories_html(c["children"])}</section>'
+        for c in categories
+    )
+
+async def _render_home(db: Session) -> Page:
+    from ..routes.home import build_home_payload
+    data = json.loads(await build_home_payload())
+    body = (
+        f'<h1>{_e(data["info"]["full_name"])}</h1><p>{_e(data["info"]["description"])}</p>'
+        f'<section><h2>Ближайшие мероприятия</h2>{_events_list_html(data["upcoming_events"])}</section>'
+        f'<section><h2>Новости</h2>{_news_list_html(data["latest_news"])}</section>'
+    )
+    return SITE_TITLE + " | Федерация спортивного программирования", data["info"]["description"], body, data
+
+async def _render_news(db: Session) -> Page:
+    from ..routes.news import NEWS_PAGE_SIZE
+    news = _dump((await projections.news.aview()).rows[:NEWS_PAGE_SIZE], NewsResponse)
+    return f"Новости | {SITE_TITLE}", "Новости Федерации спортивного программирования по Чувашской Республике", \
+        f"<h1>Новости</h1>{_news_list_html(news)}", news
+
+async def _render_news_item(db: Session, news_id: int) -> Page:
+    from ..routes.news import get_news_item
+    item = (await projections.news.aview()).by_id.get(news_id) or await get_news_item(news_id, db=db)
+    item = NewsResponse.model_validate(item).model_dump(mode="json")
+    body = (
+        f'<article><h1>{_e(item["title"])}</h1>'
+        f'<time datetime="{item["published_at"]}">{item["published_at"][:10]}</time>'
+        + "".join(f"<p>{_e(line)}</p>" for line in item["content"].split("\n") if line.strip())
+        + "</article>"
+    )
+    return f'{item["title"]} | {SITE_TITLE}', _excerpt(item["content"], 160), body, item
+
+async def _render_events(db: Session) -> Page:
+    from ..routes.events import get_events
+    today = date.today()
+    events = _dump(await get_events(month=today.month, year=today.year, db=db), EventResponse)
+    return f"Мероприятия | {SITE_TITLE}", "Календарь соревнований и мероприятий ФСП Чувашии", \
+        f"<h1>Календарь мероприятий</h1>{_events_list_html(events)}", events
+
+async def _render_team(db: Session) -> Page:
+    members = _dump((await projections.team.aview()).rows, TeamMemberResponse)
+    return f"Сборная | {SITE_TITLE}", "Сборная Чувашской Республики по спортивному программированию", \
+        f"<h1>Сборная</h1><ul>{_members_html(members)}</ul>", members
+
+async def _render_leadership(db: Session) -> Page:
+    members = _dump((await projections.leadership.aview()).rows, LeadershipMemberResponse)
+    return f"Руководство | {SITE_TITLE}", "Руководство Федерации спортивного программирования по Чувашской Республике", \
+        f"<h1>Руководство</h1><ul>{_members_html(members)}</ul>", members
+
+async def _render_documents(db: Session) -> Page:
+    from ..routes.documents import get_categories
+    categories = _dump(await get_categories(db=db), DocumentCategoryResponse)
+    return f"Документы | {SITE_TITLE}", "Документы Федерации спортивного программирования по Чувашской Республике", \
+        f"<h1>Документы</h1>{_categories_html(categories)}", categories
+
+RENDERERS: Dict[str, Callable] = {
+    "/": _render_home,
+    "/news": _render_news,
+    "/events": _render_events,
+    "/team": _render_team,
+    "/leadership": _render_leadership,
+    "/documents": _render_documents,
+}
+
+class SnapshotStore:
+    def __init__(self):
+        self._template: Optional[str] = None
+        self._pages: Dict[str, Tuple[date, bytes]] = {}
+
+    def configure(self, index_path: str) -> None:
+        """Enable snapshots using the built SPA index.html as the page template."""
+        if os.path.isfile(index_path):
+            with open(index_path, encoding="utf-8") as f:
+                self._template = f.read()
+
+    @property
+    def enabled(self) -> bool:
+        return self._template is not None
+
+    async def get(self, path: str) -> Optional[bytes]:
+        """Snapshot for ``path``, rendering it if missing or stale; None if not a snapshot page."""
+        if not self.enabled:
+            return None
+        path = "/" + path.strip("/")
+        cached = self._pages.get(path)
+        if cached is not None and (path not in DATED_PAGES or cached[0] == date.today()):
+            return cached[1]
+
+        if path in RENDERERS:
+            render = lambda db: RENDERERS[path](db)
+        else:
+            match = NEWS_DETAIL.match(path)
+            if not match:
+                return None
+            render = lambda db: _render_news_item(db, int(match.group(1)))
+
+        db = SessionLocal()
+        try:
+            page = await render(db)
+        except HTTPException:
+            return None
+        finally:
+            db.close()
+        body = self._fill_template(*page)
+        self._pages[path] = (date.today(), body)
+        return body
+
+    async def generate_all(self) -> None:
+        for path in RENDERERS:
+            await self.get(path)
+
+    def invalidate(self, changed: changes.Changes) -> None:
+        for path, tables in PAGE_TABLES.items():
+            if tables & changed.keys():
+                self._pages.pop(path, None)
+        for news_id in changed.get("news", ()):
+            self._pages.pop(f"/news/{news_id}", None)
+
+    def _fill_template(self, title: str, description: str, body: str, data) -> bytes:
+        page = self._template
+        page = re.sub(r"<title>.*?</title>", f"<title>{_e(title)}</title>", page, count=1, flags=re.S)
+        page = re.sub(
+            r'<meta name="description" content="[^"]*"\s*/?>',
+            f'<meta name="description" content="{_e(description)}" />', page, count=1
+        )
+        initial_data = json.dumps(data, ensure_ascii=False).replace("</", "<\\/")
+        page = page.replace(
+            '<div id="root"></div>',
+            f'<div id="root">{body}</div><script>window.__INITIAL_DATA__ = {initial_data};</script>',
+            1
+        )
+        return page.encode("utf-8")
+
+snapshots = SnapshotStore()
+changes.subscribe(snapshots.invalidate)
@@ -0,0 +1,144 @@
+from typing import Optional
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+from ..models.models import (
+    News, Event, TeamMember, LeadershipMember, Document, ContactMessage,
+    ContentCounter, ActivityLog
+)
+
+# Dashboard numbers are kept in content_counters and adjusted in the same
+# transaction as every write that goes through services.crud (and the Telegram
+# sync), so /api/admin/stats never has to count the content tables. The
+# initial backfill is a migration (app.migrations).
+
+COUNTED_MODELS = (News, Event, TeamMember, LeadershipMember, Document, ContactMessage)
+LABEL_COLUMNS = {
+    News: News.title,
+    Event: Event.title,
+    TeamMember: TeamMember.full_name,
+    LeadershipMember: LeadershipMember.full_name,
+    Document: Document.title,
+    ContactMessage: ContactMessage.name,
+}
+# Flag column -> counter column that counts rows where the flag is False.
+FLAG_COUNTERS = {"is_visible": "hidden", "is_read": "unread"}
+ACTIVITY_KEEP = 500
+
+def is_counted(model) -> bool:
+    return model in LABEL_COLUMNS
+
+def tracked_columns(model) -> tuple:
+    """Columns a DELETE must return so counters and activity can be updated."""
+    columns = [LABEL_COLUMNS[model]]
+    columns += [getattr(model, flag) for flag in FLAG_COUNTERS if hasattr(model, flag)]
+    return tuple(columns)
+
+def apply_delta(db: Session, model, **deltas: int) -> None:
+    values = {name: getattr(ContentCounter, name) + delta for name, delta in deltas.items() if delta}
+    if values:
+        db.execute(
+            update(ContentCounter).where(ContentCounter.entity == model.__tablename__).values(**values)
+        )
+
+def on_create(db: Session, model, obj) -> None:
+    deltas = {"total": 1}
+    for flag, counter in FLAG_COUNTERS.items():
+        if hasattr(model, flag) and getattr(obj, flag) is False:
+            deltas[counter] = 1
+    apply_delta(db, model, **deltas)
+    record_activity(db, model, obj.id, "created", getattr(obj, LABEL_COLUMNS[model].key))
+
+def on_create_many(db: Session, model, objs: list) -> None:
+    """on_create for a bulk insert: one counter update and one activity insert."""
+    deltas = {"total": len(objs)}
+    for flag, counter in FLAG_COUNTERS.items():
+        if hasattr(model, flag):
+            deltas[counter] = sum(1 for obj in objs if getattr(obj, flag) is False)
+    apply_delta(db, model, **deltas)
+    label = LABEL_COLUMNS[model].key
+    db.execute(insert(ActivityLog), [
+        {"entity": model.__tablename__, "entity_id": obj.id, "action": "created",
+         "title": (getattr(obj, label) or "")[:500] or None}
+        for obj in objs
+    ])
+    last_id = db.execute(select(func.max(ActivityLog.id))).scalar()
+    if last_id // 100 != (last_id - len(objs)) // 100:
+        db.execute(delete(ActivityLog).where(ActivityLog.id <= last_id - ACTIVITY_KEEP))
+
+def before_update(db: Session, model, obj_id: int, data: dict) -> None:
+    """Adjust flag counters for a pending update, before the row is changed.
+
+    The delta is computed in SQL from the row's current value, so toggling
+    visibility costs one extra statement and no round trip through Python.
+    """
+    values = {}
+    for flag, counter in FLAG_COUNTERS.items():
+        if flag not in data or not hasattr(model, flag):
+            continue
+        column = getattr(model, flag)
+        new_value = bool(data[flag])
+        change = select(
+            case((column == new_value, 0), else_=-1 if new_value else 1)
+        ).where(model.id == obj_id).scalar_subquery()
+        values[counter] = getattr(ContentCounter, counter) + func.coalesce(change, 0)
+    if values:
+        db.execute(
+            update(ContentCounter).where(ContentCounter.entity == model.__tablename__).values(**values)
+        )
+
+def on_update(db: Session, model, obj) -> None:
+    record_activity(db, model, obj.id, "updated", getattr(obj, LABEL_COLUMNS[model].key))
+
+def on_delete(db: Session, model, row) -> None:
+    deltas = {"total": -1}
+    for flag, counter in FLAG_COUNTERS.items():
+        if hasattr(model, flag) and getattr(row, flag) is False:
+            deltas[counter] = -1
+    apply_delta(db, model, **deltas)
+    record_activity(db, model, row.id, "deleted", getattr(row, LABEL_COLUMNS[model].key))
+
+def record_activity(db: Session, model, entity_id: Optional[int], action: str, title: Optional[str]) -> None:
+    entry_id = db.execute(
+        insert(ActivityLog).values(
+            entity=model.__tablename__, entity_id=entity_id, action=action,
+            title=title[:500] if title else title
+        ).returning(ActivityLog.id)
+    ).scalar_one()
+    if entry_id % 100 == 0:
+        db.execute(delete(ActivityLog).where(ActivityLog.id <= entry_id - ACTIVITY_KEEP))
+
+def rebuild_counters(db, commit: bool = True) -> None:
+    """Recount every content table; ``db`` may be a Session or a Connection.
+
+    Used by the backfill migration and periodically to heal drift (e.g. a
+    crash between a commit and its counter update). The DELETE comes first
+    so the counts are read inside the write transaction, where no other
+    write can land between counting and storing.
+    """
+    db.execute(delete(ContentCounter))
+    rows = []
+    for model in COUNTED_MODELS:
+        columns = [func.count(model.id)]
+        counters = ["total"]
+        for flag, counter in FLAG_COUNTERS.items():
+            if hasattr(model, flag):
+                columns.append(func.coalesce(func.sum(case((getattr(model, flag) == False, 1), else_=0)), 0))
+                counters.append(counter)
+        values = dict(zip(counters, db.execute(select(*columns)).one()))
+        rows.append({"entity": model.__tablename__, "hidden": 0, "unread": 0, **values})
+    db.execute(insert(ContentCounter), rows)
+    if commit:
+        db.commit()
+
+def get_stats(db: Session, recent_limit: int = 10) -> dict:
+    counters = {
+        counter.entity: {
+            "total": counter.total,
+            "visible": counter.total - counter.hidden,
+            "hidden": counter.hidden,
+            "unread": counter.unread,
+        }
+        for counter in db.query(ContentCounter).all()
+    }
+    recent = db.query(ActivityLog).order_by(ActivityLog.id.desc()).limit(recent_limit).all()
+    return {"counters": counters, "recent_activity": recent}
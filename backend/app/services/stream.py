@@ -0,0 +1,124 @@
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import AsyncIterator, Dict, List, Optional, Set
+from ..config import get_settings
+from . import changes
+from .metrics import registry, Counter, GaugeFunc
+
+# Live updates over server-sent events (/api/stream). Committed changes to
+# public tables arrive through changes.subscribe, so admin handlers and
+# Telegram sync publish simply by committing, and commits from other workers
+# are replayed here too. Each message is encoded once and the same bytes are
+# queued for every client.
+#
+# A client is a bounded deque plus an asyncio.Event, so an idle connection
+# costs a few hundred bytes. Delivery never waits on a client: if its queue
+# is full (the socket is not draining), the client is dropped after an
+# "overflow" message and EventSource reconnects, refetching state. Idle
+# connections get a comment line every heartbeat so proxies keep them open.
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Tables whose changes are broadcast, by SSE event name.
+STREAM_TABLES = {"news": "news", "events": "events"}
+RETRY_MS = 5000
+
+stream_dropped = registry.register(Counter(
+    "fsp_stream_dropped_total", "SSE clients disconnected for not keeping up."
+))
+
+def encode(event: str, data: dict) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, separators=(',', ':'))}\n\n".encode("utf-8")
+
+HEARTBEAT = b": ping\n\n"
+OVERFLOW = encode("overflow", {"reason": "slow consumer"})
+
+class Client:
+    __slots__ = ("queue", "wakeup", "dropped")
+
+    def __init__(self):
+        self.queue: deque = deque()
+        self.wakeup = asyncio.Event()
+        self.dropped = False
+
+class Broker:
+    def __init__(self):
+        self._clients: Set[Client] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @property
+    def full(self) -> bool:
+        return len(self._clients) >= settings.stream_max_clients
+
+    def publish(self, event: str, data: dict) -> None:
+        """Queue a message for every client; safe to call from any thread."""
+        if self._loop is None or not self._clients:
+            return
+        message = encode(event, data)
+        try:
+            if self._loop is asyncio.get_running_loop():
+                self._fanout(message)
+                return
+        except RuntimeError:
+            pass
+        self._loop.call_soon_threadsafe(self._fanout, message)
+
+    def on_changes(self, changed: changes.Changes) -> None:
+        for table, event in STREAM_TABLES.items():
+            rows = changed.get(table)
+            if rows is None:
+                continue
+            by_action: Dict[str, List[int]] = {}
+            for row_id, action in rows.items():
+                by_action.setdefault(action, []).append(row_id)
+            for action, ids in by_action.items():
+                self.publish(event, {"action": action, "ids": ids})
+            if not rows:
+                self.publish(event, {"action": "updated", "ids": []})
+
+    def _fanout(self, message: bytes) -> None:
+        limit = settings.stream_queue_size
+        for client in list(self._clients):
+            if len(client.queue) >= limit:
+                client.dropped = True
+                client.queue.clear()
+                self._clients.discard(client)
+                stream_dropped.inc()
+            else:
+                client.queue.append(message)
+            client.wakeup.set()
+
+    async def listen(self) -> AsyncIterator[bytes]:
+        """Byte chunks for one SSE connection; ends when the client is dropped."""
+        self._loop = asyncio.get_running_loop()
+        client = Client()
+        self._clients.add(client)
+        try:
+            yield f"retry: {RETRY_MS}\n\n".encode() + encode("hello", {})
+            while True:
+                try:
+                    await asyncio.wait_for(client.wakeup.wait(), settings.stream_heartbeat_s)
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT
+                    continue
+                client.wakeup.clear()
+                if client.queue:
+                    chunk = b"".join(client.queue)
+                    client.queue.clear()
+                    yield chunk
+                if client.dropped:
+                    yield OVERFLOW
+                    return
+        finally:
+            self._clients.discard(client)
+
+broker = Broker()
+changes.subscribe(broker.on_changes)
+
+registry.register(GaugeFunc("fsp_stream_clients", "Connected SSE clients.", lambda: len(broker)))
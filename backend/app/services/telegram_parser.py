@@ -1,8 +1,13 @@
-import httpx
 from datetime import datetime
 from typing import List, Dict, Optional
+import logging
 import re
 import json
+import time
+from . import changes, stats
+from .metrics import telegram_sync_duration, telegram_sync_runs, telegram_posts_ingested
+
+logger = logging.getLogger(__name__)
 
 class TelegramParser:
     def __init__(self):
@@ -10,6 +15,7 @@ class TelegramParser:
         self.base_url = f"https://t.me/s/{self.channel}"
     
     async def fetch_posts(self, limit: int = 20) -> List[Dict]:
+        import httpx
         posts = []
         try:
             async with httpx.AsyncClient() as client:
@@ -17,7 +23,7 @@ class TelegramParser:
                 if response.status_code == 200:
                     posts = self._parse_html(response.text, limit)
         except Exception as e:
-            print(f"Error fetching Telegram posts: {e}")
+            logger.warning("Error fetching Telegram posts: %s", e)
         return posts
     
     def _parse_html(self, html: str, limit: int) -> List[Dict]:
@@ -114,16 +120,33 @@ class TelegramParser:
 telegram_parser = TelegramParser()
 
 async def sync_telegram_news(db):
+    started = time.perf_counter()
+    try:
+        created = await _sync_posts(db)
+    except Exception:
+        telegram_sync_runs.labels("error").inc()
+        raise
+    finally:
+        telegram_sync_duration.observe(time.perf_counter() - started)
+    telegram_sync_runs.labels("ok" if created is not None else "empty").inc()
+    telegram_posts_ingested.inc(created or 0)
+
+async def _sync_posts(db) -> Optional[int]:
+    """Store new posts; returns how many were created, or None if nothing was fetched."""
     from ..models.models import News
     
     posts = await telegram_parser.fetch_posts(limit=30)
+    if not posts:
+        return None
     
+    created = []
     for post in posts:
         existing = db.query(News).filter(News.telegram_id == post['telegram_id']).first()
         if existing:
             if post['image_url'] and not existing.image_url:
                 existing.image_url = post['image_url']
                 db.add(existing)
+                changes.mark_changed(db, News, [existing.id])
         else:
             news = News(
                 title=post['title'],
@@ -133,5 +156,12 @@ async def sync_telegram_news(db):
                 published_at=post['published_at']
             )
             db.add(news)
+            created.append(news)
     
+    if created:
+        db.flush()
+        changes.mark_changed(db, News, [news.id for news in created], "created")
+        stats.apply_delta(db, News, total=len(created))
+        stats.record_activity(db, News, None, "telegram_sync", f"Telegram: {len(created)}")
     db.commit()
+    return len(created)
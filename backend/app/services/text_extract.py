@@ -0,0 +1,124 @@
+import os
+import zipfile
+from typing import List, NamedTuple, Optional
+from xml.etree import ElementTree
+
+# Text, page count and thumbnail extraction for uploaded documents. Runs in
+# the extraction process pool (services.extraction), so this module imports
+# nothing from the app and keeps heavy libraries optional: DOCX is read with
+# the standard library, PDF needs PyMuPDF (text, pages, thumbnail) or pypdf
+# (text and pages only).
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+try:
+    import pypdf
+except ImportError:
+    pypdf = None
+
+MAX_TEXT_CHARS = 2_000_000
+THUMBNAIL_WIDTH = 320
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+EP_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/extended-properties}"
+
+class Extracted(NamedTuple):
+    status: str  # "done" or "unsupported"
+    text: str = ""
+    page_count: Optional[int] = None
+    thumbnail_path: Optional[str] = None
+    detail: Optional[str] = None
+
+class _Text:
+    """Collects text up to MAX_TEXT_CHARS."""
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.size = 0
+
+    def add(self, value: str) -> bool:
+        if self.size >= MAX_TEXT_CHARS:
+            return False
+        value = value[:MAX_TEXT_CHARS - self.size]
+        self.parts.append(value)
+        self.size += len(value)
+        return True
+
+    def result(self) -> str:
+        return "".join(self.parts).strip()
+
+def _docx(path: str, thumbnail_base: str) -> Extracted:
+    text = _Text()
+    with zipfile.ZipFile(path) as archive:
+        with archive.open("word/document.xml") as body:
+            for _, element in ElementTree.iterparse(body):
+                if element.tag == W_NS + "t" and element.text:
+                    text.add(element.text)
+                elif element.tag in (W_NS + "tab", W_NS + "br"):
+                    text.add(" ")
+                elif element.tag == W_NS + "p":
+                    if not text.add("\n"):
+                        break
+                    element.clear()
+
+        page_count = None
+        names = set(archive.namelist())
+        if "docProps/app.xml" in names:
+            pages = ElementTree.fromstring(archive.read("docProps/app.xml")).find(EP_NS + "Pages")
+            if pages is not None and (pages.text or "").isdigit():
+                page_count = int(pages.text)
+
+        # Word stores a first-page preview only when "save thumbnail" is on.
+        thumbnail_path = None
+        for name in names:
+            ext = os.path.splitext(name)[1].lower()
+            if name.startswith("docProps/thumbnail") and ext in (".png", ".jpeg", ".jpg"):
+                thumbnail_path = thumbnail_base + ext
+                with open(thumbnail_path, "wb") as out:
+                    out.write(archive.read(name))
+                break
+    return Extracted("done", text.result(), page_count, thumbnail_path)
+
+def _pdf(path: str, thumbnail_base: str) -> Extracted:
+    text = _Text()
+    if fitz is not None:
+        with fitz.open(path) as pdf:
+            for page in pdf:
+                if not text.add(page.get_text() + "\n"):
+                    break
+            thumbnail_path = None
+            if pdf.page_count:
+                first = pdf[0]
+                scale = THUMBNAIL_WIDTH / max(first.rect.width, 1)
+                thumbnail_path = thumbnail_base + ".png"
+                first.get_pixmap(matrix=fitz.Matrix(scale, scale)).save(thumbnail_path)
+            return Extracted("done", text.result(), pdf.page_count, thumbnail_path)
+    if pypdf is not None:
+        reader = pypdf.PdfReader(path)
+        for page in reader.pages:
+            if not text.add((page.extract_text() or "") + "\n"):
+                break
+        return Extracted("done", text.result(), len(reader.pages))
+    return Extracted("unsupported", detail="No PDF library installed (pymupdf or pypdf)")
+
+EXTRACTORS = {".docx": _docx, ".pdf": _pdf}
+
+def supported(filename: str) -> bool:
+    """Whether extract() can read this file type with the libraries installed here."""
+    ext = os.path.splitext(filename)[1].lower()
+    if ext == ".pdf":
+        return fitz is not None or pypdf is not None
+    return ext in EXTRACTORS
+
+def extract(path: str, filename: str, thumbnail_base: str) -> Extracted:
+    """Extract ``path``; the thumbnail, if any, is written to ``thumbnail_base`` + extension.
+
+    Raises on unreadable files; the caller records the failure.
+    """
+    extractor = EXTRACTORS.get(os.path.splitext(filename or path)[1].lower())
+    if extractor is None:
+        return Extracted("unsupported", detail="Unsupported file type")
+    return extractor(path, thumbnail_base)
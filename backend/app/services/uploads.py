@@ -0,0 +1,128 @@
+import os
+import threading
+import time
+import uuid
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from typing import BinaryIO, Dict, List, Optional, Tuple
+from . import files
+
+# Bulk document uploads: plain files and ZIP archives are staged into the
+# upload directory one entry at a time (bounded memory), then the handler
+# inserts every row in one transaction. Archive folders become category
+# paths below the target category.
+#
+# Progress is kept per process in UploadProgressRegistry and covers the
+# staging phase (the request body itself has been received by then); with
+# several workers, poll the worker that accepted the upload.
+
+MAX_ARCHIVE_ENTRIES = 1000
+MAX_ARCHIVE_BYTES = 1024 ** 3
+PROGRESS_TTL_S = 3600
+# Names that archivers add and nobody means to upload.
+IGNORED_PARTS = {"__MACOSX", "Thumbs.db", "desktop.ini"}
+# ZIP flag bit 11: names are UTF-8. Without it, Windows archivers use the
+# OEM code page, which for Russian systems is cp866.
+UTF8_FLAG = 0x800
+
+@dataclass
+class UploadProgress:
+    upload_id: str
+    status: str = "processing"
+    files_total: int = 0
+    files_done: int = 0
+    bytes_written: int = 0
+    detail: Optional[str] = None
+    updated_at: float = field(default_factory=time.monotonic)
+
+class UploadProgressRegistry:
+    def __init__(self):
+        self._uploads: Dict[str, UploadProgress] = {}
+        self._lock = threading.Lock()
+
+    def start(self, upload_id: Optional[str] = None) -> UploadProgress:
+        progress = UploadProgress(upload_id or uuid.uuid4().hex)
+        now = time.monotonic()
+        with self._lock:
+            for key in [k for k, p in self._uploads.items() if now - p.updated_at > PROGRESS_TTL_S]:
+                del self._uploads[key]
+            self._uploads[progress.upload_id] = progress
+        return progress
+
+    def get(self, upload_id: str) -> Optional[UploadProgress]:
+        return self._uploads.get(upload_id)
+
+upload_progress = UploadProgressRegistry()
+
+@dataclass
+class StagedFile:
+    folders: Tuple[str, ...]
+    filename: str
+    path: str
+    stored: files.StoredFile
+
+def _disk_path(upload_dir: str, filename: str) -> str:
+    return os.path.join(upload_dir, f"{uuid.uuid4()}{os.path.splitext(filename)[1]}")
+
+def _entry_name(info: zipfile.ZipInfo) -> str:
+    if info.flag_bits & UTF8_FLAG:
+        return info.filename
+    try:
+        return info.filename.encode("cp437").decode("cp866")
+    except UnicodeError:
+        return info.filename
+
+def _done(progress: UploadProgress, staged: StagedFile) -> None:
+    progress.files_done += 1
+    progress.bytes_written += staged.stored.size
+    progress.updated_at = time.monotonic()
+
+def stage_file(source: BinaryIO, filename: str, upload_dir: str, progress: UploadProgress) -> StagedFile:
+    path = _disk_path(upload_dir, filename)
+    staged = StagedFile((), filename, path, files.save_blocking(source, path))
+    _done(progress, staged)
+    return staged
+
+def stage_archive(source: BinaryIO, upload_dir: str, progress: UploadProgress, staged: List[StagedFile]) -> List[str]:
+    """Extract a ZIP into ``staged``; returns the entry names that were skipped.
+
+    Raises ValueError for unreadable archives or ones over the entry/size
+    limits. Entries already staged are left in ``staged`` for the caller to
+    clean up.
+    """
+    skipped = []
+    try:
+        archive = zipfile.ZipFile(source)
+    except zipfile.BadZipFile:
+        raise ValueError("Not a valid ZIP archive")
+    with archive:
+        entries = []
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            parts = PurePosixPath(_entry_name(info).replace("\\", "/")).parts
+            if any(part in IGNORED_PARTS or part.startswith(".") or part == ".." for part in parts):
+                skipped.append(info.filename)
+                continue
+            entries.append((info, parts))
+        if len(entries) > MAX_ARCHIVE_ENTRIES:
+            raise ValueError(f"Archive has more than {MAX_ARCHIVE_ENTRIES} files")
+        if sum(info.file_size for info, _ in entries) > MAX_ARCHIVE_BYTES:
+            raise ValueError("Archive is too large when extracted")
+        progress.files_total += len(entries)
+        for info, parts in entries:
+            path = _disk_path(upload_dir, parts[-1])
+            try:
+                with archive.open(info) as member:
+                    stored = files.save_blocking(member, path)
+            except (zipfile.BadZipFile, zipfile.LargeZipFile, NotImplementedError, RuntimeError) as e:
+                files.cleanup.submit([path])
+                raise ValueError(f"Cannot extract {info.filename}: {e}")
+            entry = StagedFile(tuple(parts[:-1]), parts[-1], path, stored)
+            staged.append(entry)
+            _done(progress, entry)
+    return skipped
+
+def is_archive(filename: Optional[str], content_type: Optional[str]) -> bool:
+    return (filename or "").lower().endswith(".zip") or content_type in ("application/zip", "application/x-zip-compressed")
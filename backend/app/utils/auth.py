@@ -1,54 +1,109 @@
+import hmac
+import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from ..config import get_settings
 from ..database import get_db
 from ..models.models import Admin
+from ..services.revocation import revocations
 
 settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
+# passlib/bcrypt and python-jose (which pulls in cryptography) are imported on
+# first use rather than at startup; password hashing is only needed at login.
+
+@lru_cache()
+def get_pwd_context():
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
+
+# Access tokens are short-lived; a refresh token (rotated on every use) gets
+# a new one. Every token has a ``jti`` and the ``sid`` of the login it came
+# from, so a single token or a whole session can be revoked
+# (services.revocation) without rotating SESSION_SECRET.
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+ACCESS = "access"
+REFRESH = "refresh"
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None, token_type: str = ACCESS) -> str:
+    from jose import jwt
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex, "typ": token_type})
+    to_encode.setdefault("sid", uuid.uuid4().hex)
     encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
     return encoded_jwt
 
-def verify_token(token: str) -> Optional[dict]:
+def create_token_pair(username: str, sid: Optional[str] = None) -> dict:
+    """Access and refresh token for one login session (a new one unless ``sid`` is given)."""
+    claims = {"sub": username, "sid": sid or uuid.uuid4().hex}
+    return {
+        "access_token": create_access_token(claims),
+        "refresh_token": create_access_token(
+            claims, timedelta(days=settings.refresh_token_expire_days), token_type=REFRESH
+        ),
+        "token_type": "bearer",
+        "expires_in": settings.access_token_expire_minutes * 60,
+    }
+
+def verify_token(token: str, token_type: str = ACCESS) -> Optional[dict]:
+    """Claims of a valid, unrevoked token of ``token_type``; None otherwise."""
+    from jose import JWTError, jwt
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        return payload
     except JWTError:
         return None
+    # Tokens issued before revocation support have no jti and are refused.
+    if payload.get("typ") != token_type or not payload.get("jti"):
+        return None
+    if revocations.is_revoked(payload["jti"], payload.get("sid")):
+        return None
+    return payload
 
-async def get_current_admin(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> Admin:
-    token = credentials.credentials
-    payload = verify_token(token)
+async def get_token_payload(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    payload = verify_token(credentials.credentials)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+    return payload
+
+async def require_metrics_access(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
+    db: Session = Depends(get_db)
+) -> None:
+    """The configured METRICS_TOKEN or an admin access token."""
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    token = credentials.credentials
+    if settings.metrics_token and hmac.compare_digest(token.encode(), settings.metrics_token.encode()):
+        return
+    await get_current_admin(await get_token_payload(credentials), db)
+
+async def get_current_admin(
+    payload: dict = Depends(get_token_payload),
+    db: Session = Depends(get_db)
+) -> Admin:
     username: str = payload.get("sub")
     if username is None:
         raise HTTPException(
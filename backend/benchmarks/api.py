@@ -0,0 +1,402 @@
+"""API regression benchmark: every public and admin route on a large dataset.
+
+Run from the backend directory:
+
+    python -m benchmarks.api [--scale 1.0] [--requests 200] [--concurrency 16]
+                             [--only news] [--save-baseline] [--json]
+
+A temporary database is seeded with synthetic content (at scale 1.0:
+100k news, 10k events, a document category tree 5 levels deep, 5k contact
+messages), then each scenario is driven by ``--concurrency`` httpx clients
+against the in-process ASGI app (no network, no lifespan tasks). Per
+scenario it reports throughput, p50/p95/p99 latency and the SQL query count
+taken from the Server-Timing header.
+
+Results are compared with ``benchmarks/baseline.json`` when it was recorded
+with the same dataset and load settings; the exit status is 1 if any
+scenario regressed beyond ``--tolerance``. ``--save-baseline`` replaces the
+stored baseline with this run.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(BACKEND_DIR, "benchmarks", "baseline.json")
+
+SERVER_TIMING_QUERIES = re.compile(r'db;[^,]*desc="(\d+) queries"')
+
+# Dataset
+
+@dataclass
+class Dataset:
+    news: int = 100_000
+    events: int = 10_000
+    category_depth: int = 5
+    category_fanout: int = 3
+    documents_per_category: int = 4
+    team: int = 300
+    leadership: int = 30
+    messages: int = 5_000
+
+    def scaled(self, scale: float) -> "Dataset":
+        return Dataset(
+            news=max(int(self.news * scale), 10),
+            events=max(int(self.events * scale), 10),
+            category_depth=self.category_depth,
+            category_fanout=self.category_fanout,
+            documents_per_category=self.documents_per_category,
+            team=max(int(self.team * scale), 5),
+            leadership=max(int(self.leadership * scale), 5),
+            messages=max(int(self.messages * scale), 10),
+        )
+
+WORDS = ("соревнование", "программирование", "команда", "финал", "олимпиада", "хакатон",
+         "алгоритм", "регион", "Чебоксары", "участник", "задача", "победитель", "этап")
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+def seed(conn, dataset: Dataset, rng: random.Random) -> None:
+    """Bulk-insert synthetic content through the ORM models' tables."""
+    from sqlalchemy import insert
+    from app.models.models import (
+        News, Event, DocumentCategory, Document, TeamMember, LeadershipMember, ContactMessage
+    )
+    from app.services import stats
+
+    now = datetime.utcnow()
+    today = date.today()
+    conn.execute(insert(News), [
+        dict(title=_text(rng, 6), content=_text(rng, 120), image_url=None, telegram_id=None,
+             published_at=now - timedelta(minutes=i * 7), is_visible=rng.random() > 0.05, created_at=now)
+        for i in range(dataset.news)
+    ])
+    conn.execute(insert(Event), [
+        dict(title=_text(rng, 5), description=_text(rng, 40),
+             event_date=today + timedelta(days=rng.randint(-1500, 365)), event_time=f"{rng.randint(8, 19)}:00",
+             location=_text(rng, 3), event_type=rng.choice(("Соревнование", "Хакатон", "Мастер-класс")),
+             is_visible=rng.random() > 0.05, created_at=now)
+        for _ in range(dataset.events)
+    ])
+
+    parents = [None]
+    category_ids = []
+    for depth in range(dataset.category_depth):
+        rows = [
+            dict(name=f"Раздел {depth}.{n}", parent_id=parent, order=n, created_at=now)
+            for parent in parents for n in range(dataset.category_fanout if parent is not None else 2)
+        ]
+        parents = list(conn.execute(insert(DocumentCategory).returning(DocumentCategory.id), rows).scalars())
+        category_ids.extend(parents)
+    conn.execute(insert(Document), [
+        dict(title=_text(rng, 4), filename=f"doc_{category_id}_{n}.pdf",
+             file_path=f"uploads/documents/doc_{category_id}_{n}.pdf", file_size=rng.randint(10_000, 5_000_000),
+             category_id=category_id, order=n, is_visible=rng.random() > 0.1, created_at=now)
+        for category_id in category_ids for n in range(dataset.documents_per_category)
+    ])
+
+    conn.execute(insert(TeamMember), [
+        dict(full_name=_text(rng, 3), position="Юниор", city=rng.choice(("Чебоксары", "Новочебоксарск")),
+             category=rng.choice(("Основной состав", "Резерв")),
+             discipline=rng.choice(("Продуктовое программирование", "Алгоритмическое программирование")),
+             photo_url=None, order=i, is_visible=True, created_at=now)
+        for i in range(dataset.team)
+    ])
+    conn.execute(insert(LeadershipMember), [
+        dict(full_name=_text(rng, 3), position=_text(rng, 2), description=_text(rng, 20),
+             photo_url=None, order=i, is_visible=True, created_at=now)
+        for i in range(dataset.leadership)
+    ])
+    conn.execute(insert(ContactMessage), [
+        dict(name=_text(rng, 2), email=f"user{i}@example.com", subject=_text(rng, 4),
+             message=_text(rng, 50), is_read=rng.random() > 0.3, created_at=now - timedelta(hours=i))
+        for i in range(dataset.messages)
+    ])
+    stats.rebuild_counters(conn, commit=False)
+
+# Scenarios
+
+@dataclass
+class Context:
+    ids: Dict[str, List[int]]
+    rng: random.Random
+    headers: Dict[str, str]
+    created: Dict[str, List[int]] = field(default_factory=dict)
+
+    def pick(self, table: str) -> int:
+        return self.rng.choice(self.ids[table])
+
+    def take(self, key: str) -> int:
+        return self.created[key].pop()
+
+@dataclass
+class Scenario:
+    name: str
+    build: Callable[[Context], tuple]  # -> (method, url, request kwargs)
+    admin: bool = False
+    requests: Optional[int] = None  # overrides --requests for expensive routes
+    collect: Optional[str] = None  # remember created row ids under this key
+    consumes: Optional[str] = None  # runs at most once per remembered id
+
+def _get(url: str):
+    return lambda ctx: ("GET", url, {})
+
+def _scenarios() -> List[Scenario]:
+    year = date.today().year
+    return [
+        # Public
+        Scenario("health", _get("/api/health")),
+        Scenario("home", _get("/api/home")),
+        Scenario("info", _get("/api/info")),
+        Scenario("news list", _get("/api/news")),
+        Scenario("news list deep page", lambda ctx: ("GET", f"/api/news?skip={ctx.rng.randint(0, len(ctx.ids['news']) - 20)}", {})),
+        Scenario("news item", lambda ctx: ("GET", f"/api/news/{ctx.pick('news')}", {})),
+        Scenario("events list", _get("/api/events")),
+        Scenario("events by month", lambda ctx: ("GET", f"/api/events?year={year}&month={ctx.rng.randint(1, 12)}", {})),
+        Scenario("events upcoming", _get("/api/events/upcoming")),
+        Scenario("events calendar", lambda ctx: ("GET", f"/api/events/calendar?year={year}&month={ctx.rng.randint(1, 12)}", {})),
+        Scenario("event item", lambda ctx: ("GET", f"/api/events/{ctx.pick('events')}", {})),
+        Scenario("document tree", _get("/api/documents/categories"), requests=20),
+        Scenario("document category", lambda ctx: ("GET", f"/api/documents/categories/{ctx.pick('document_categories')}", {})),
+        Scenario("documents list", lambda ctx: ("GET", f"/api/documents?category_id={ctx.pick('document_categories')}", {})),
+        Scenario("team list", _get("/api/team")),
+        Scenario("team member", lambda ctx: ("GET", f"/api/team/{ctx.pick('team_members')}", {})),
+        Scenario("leadership list", _get("/api/leadership")),
+        Scenario("leadership member", lambda ctx: ("GET", f"/api/leadership/{ctx.pick('leadership_members')}", {})),
+        Scenario("contact submit", lambda ctx: ("POST", "/api/contact", {"json": {
+            "name": "Бенчмарк", "email": "bench@example.com", "subject": "Тест", "message": _text(ctx.rng, 30)
+        }}), collect="contact_messages"),
+        Scenario("login", lambda ctx: ("POST", "/api/auth/login", {"json": {"username": "bench", "password": "bench"}}), requests=20),
+
+        # Admin
+        Scenario("auth me", _get("/api/auth/me"), admin=True),
+        Scenario("admin stats", _get("/api/admin/stats"), admin=True),
+        Scenario("news list with hidden", _get("/api/news?include_hidden=true"), admin=True),
+        Scenario("news create", lambda ctx: ("POST", "/api/news", {"json": {"title": _text(ctx.rng, 5), "content": _text(ctx.rng, 80)}}),
+                 admin=True, collect="news"),
+        Scenario("news update", lambda ctx: ("PUT", f"/api/news/{ctx.pick('news')}", {"json": {"title": _text(ctx.rng, 5)}}), admin=True),
+        Scenario("news batch", lambda ctx: ("POST", "/api/news/batch", {"json": {"operations": [
+            {"id": ctx.pick("news"), "action": "show"} for _ in range(20)
+        ]}}), admin=True),
+        Scenario("news delete", lambda ctx: ("DELETE", f"/api/news/{ctx.take('news')}", {}), admin=True, consumes="news"),
+        Scenario("news export ndjson", _get("/api/news/export?format=ndjson"), admin=True, requests=3),
+        Scenario("news export csv", _get("/api/news/export?format=csv"), admin=True, requests=3),
+        Scenario("event create", lambda ctx: ("POST", "/api/events", {"json": {
+            "title": _text(ctx.rng, 4), "event_date": str(date.today() + timedelta(days=ctx.rng.randint(1, 300)))
+        }}), admin=True, collect="events"),
+        Scenario("event update", lambda ctx: ("PUT", f"/api/events/{ctx.pick('events')}", {"json": {"location": _text(ctx.rng, 3)}}), admin=True),
+        Scenario("events batch", lambda ctx: ("POST", "/api/events/batch", {"json": {"operations": [
+            {"id": ctx.pick("events"), "action": "show"} for _ in range(20)
+        ]}}), admin=True),
+        Scenario("event delete", lambda ctx: ("DELETE", f"/api/events/{ctx.take('events')}", {}), admin=True, consumes="events"),
+        Scenario("category create", lambda ctx: ("POST", "/api/documents/categories", {"json": {
+            "name": _text(ctx.rng, 2), "parent_id": ctx.pick("document_categories")
+        }}), admin=True, collect="document_categories"),
+        Scenario("category update", lambda ctx: ("PUT", f"/api/documents/categories/{ctx.pick('document_categories')}", {"json": {"order": ctx.rng.randint(0, 9)}}), admin=True),
+        Scenario("category delete", lambda ctx: ("DELETE", f"/api/documents/categories/{ctx.take('document_categories')}", {}), admin=True, consumes="document_categories"),
+        Scenario("document upload", lambda ctx: ("POST", "/api/documents", {
+            "data": {"title": _text(ctx.rng, 3), "category_id": str(ctx.pick("document_categories"))},
+            "files": {"file": ("bench.pdf", b"%PDF-1.4 benchmark\n" * 64, "application/pdf")},
+        }), admin=True, collect="documents"),
+        Scenario("document download", lambda ctx: ("GET", f"/api/documents/{ctx.rng.choice(ctx.created['documents'])}/download", {})),
+        Scenario("documents batch", lambda ctx: ("POST", "/api/documents/batch", {"json": {"operations": [
+            {"id": ctx.pick("documents"), "action": "show"} for _ in range(20)
+        ]}}), admin=True),
+        Scenario("document delete", lambda ctx: ("DELETE", f"/api/documents/{ctx.take('documents')}", {}), admin=True, consumes="documents"),
+        Scenario("team create", lambda ctx: ("POST", "/api/team", {"json": {"full_name": _text(ctx.rng, 3), "category": "Резерв"}}),
+                 admin=True, collect="team_members"),
+        Scenario("team update", lambda ctx: ("PUT", f"/api/team/{ctx.pick('team_members')}", {"json": {"city": "Чебоксары"}}), admin=True),
+        Scenario("team batch", lambda ctx: ("POST", "/api/team/batch", {"json": {"operations": [
+            {"id": member_id, "action": "reorder", "order": n} for n, member_id in enumerate(ctx.rng.sample(ctx.ids["team_members"], 5))
+        ]}}), admin=True),
+        Scenario("team delete", lambda ctx: ("DELETE", f"/api/team/{ctx.take('team_members')}", {}), admin=True, consumes="team_members"),
+        Scenario("leadership create", lambda ctx: ("POST", "/api/leadership", {"json": {"full_name": _text(ctx.rng, 3), "position": "Член Федерации"}}),
+                 admin=True, collect="leadership_members"),
+        Scenario("leadership update", lambda ctx: ("PUT", f"/api/leadership/{ctx.pick('leadership_members')}", {"json": {"order": ctx.rng.randint(0, 9)}}), admin=True),
+        Scenario("leadership batch", lambda ctx: ("POST", "/api/leadership/batch", {"json": {"operations": [
+            {"id": ctx.pick("leadership_members"), "action": "show"} for _ in range(5)
+        ]}}), admin=True),
+        Scenario("leadership delete", lambda ctx: ("DELETE", f"/api/leadership/{ctx.take('leadership_members')}", {}), admin=True, consumes="leadership_members"),
+        Scenario("contact list", _get("/api/contact?unread_only=true"), admin=True),
+        Scenario("contact read", lambda ctx: ("PUT", f"/api/contact/{ctx.pick('contact_messages')}/read", {}), admin=True),
+        Scenario("contact batch", lambda ctx: ("POST", "/api/contact/batch", {"json": {"operations": [
+            {"id": ctx.pick("contact_messages"), "action": "unread"} for _ in range(20)
+        ]}}), admin=True),
+        Scenario("contact delete", lambda ctx: ("DELETE", f"/api/contact/{ctx.take('contact_messages')}", {}), admin=True, consumes="contact_messages"),
+        Scenario("contact export", _get("/api/contact/export?format=csv"), admin=True, requests=3),
+    ]
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    index = min(int(round(pct / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+async def run_scenario(client: httpx.AsyncClient, scenario: Scenario, ctx: Context,
+                       total: int, concurrency: int) -> dict:
+    latencies: List[float] = []
+    queries: List[int] = []
+    errors = 0
+    remaining = total
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            method, url, kwargs = scenario.build(ctx)
+            if scenario.admin:
+                kwargs = {**kwargs, "headers": ctx.headers}
+            started = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+                continue
+            match = SERVER_TIMING_QUERIES.search(response.headers.get("server-timing", ""))
+            if match:
+                queries.append(int(match.group(1)))
+            if scenario.collect:
+                ctx.created.setdefault(scenario.collect, []).append(response.json()["id"])
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, total))))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": total,
+        "errors": errors,
+        "rps": total / elapsed,
+        "p50_ms": _percentile(latencies, 50),
+        "p95_ms": _percentile(latencies, 95),
+        "p99_ms": _percentile(latencies, 99),
+        "queries": statistics.mean(queries) if queries else None,
+    }
+
+async def run_all(app, ctx: Context, scenarios: List[Scenario], requests: int, concurrency: int) -> Dict[str, dict]:
+    transport = httpx.ASGITransport(app=app)
+    results = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300) as client:
+        for scenario in scenarios:
+            total = scenario.requests or requests
+            if scenario.consumes:
+                total = min(total, len(ctx.created.get(scenario.consumes, ())))
+                if not total:
+                    continue
+            results[scenario.name] = await run_scenario(client, scenario, ctx, total, concurrency)
+    return results
+
+# Baseline comparison
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """Human-readable regressions of ``results`` against ``baseline``."""
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if result["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {before['p95_ms']:.1f} -> {result['p95_ms']:.1f} ms")
+        if result["rps"] < before["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {before['rps']:.0f} -> {result['rps']:.0f} req/s")
+        if result["queries"] is not None and before["queries"] is not None and result["queries"] > before["queries"] + 0.5:
+            regressions.append(f"{name}: queries {before['queries']:.1f} -> {result['queries']:.1f}")
+        if result["errors"] > before["errors"]:
+            regressions.append(f"{name}: errors {before['errors']} -> {result['errors']}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="dataset size relative to the default")
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--only", help="run only scenarios whose name contains this text")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    dataset = Dataset().scaled(args.scale)
+    config = {"dataset": dataset.__dict__, "requests": args.requests, "concurrency": args.concurrency}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["SQLITE_DATABASE_URL"] = f"sqlite:///{tmp_dir}/bench.db"
+        os.environ["UPLOAD_DIR"] = os.path.join(tmp_dir, "uploads")
+        os.chdir(BACKEND_DIR)
+        sys.path.insert(0, BACKEND_DIR)
+        import main as app_main
+        from sqlalchemy import select
+        from app.database import engine, init_db
+        from app.models.models import (
+            News, Event, DocumentCategory, Document, TeamMember, LeadershipMember, ContactMessage
+        )
+
+        rng = random.Random(args.seed)
+        init_db()
+        seed_started = time.perf_counter()
+        with engine.begin() as conn:
+            seed(conn, dataset, rng)
+            ids = {
+                model.__tablename__: list(conn.execute(select(model.id)).scalars())
+                for model in (News, Event, DocumentCategory, Document, TeamMember, LeadershipMember, ContactMessage)
+            }
+        seed_s = time.perf_counter() - seed_started
+
+        async def login() -> Dict[str, str]:
+            transport = httpx.ASGITransport(app=app_main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                response = await client.post("/api/auth/register", json={"username": "bench", "password": "bench"})
+                return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        ctx = Context(ids=ids, rng=rng, headers=asyncio.run(login()))
+        scenarios = [s for s in _scenarios() if not args.only or args.only in s.name]
+        results = asyncio.run(run_all(app_main.app, ctx, scenarios, args.requests, args.concurrency))
+
+    baseline = None
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            stored = json.load(f)
+        if stored.get("config") == config:
+            baseline = stored["results"]
+    regressions = compare(results, baseline, args.tolerance) if baseline else []
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump({"config": config, "results": results}, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+
+    if args.json:
+        print(json.dumps({"config": config, "seed_s": seed_s, "results": results, "regressions": regressions},
+                         indent=2, ensure_ascii=False))
+    else:
+        print(f"seeded {dataset.news} news, {dataset.events} events, {len(ids['document_categories'])} categories "
+              f"in {seed_s:.1f}s\n")
+        print(f"{'scenario':<24} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8} {'errors':>6}")
+        for name, r in results.items():
+            queries = f"{r['queries']:.1f}" if r["queries"] is not None else "-"
+            print(f"{name:<24} {r['rps']:>8.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} "
+                  f"{queries:>8} {r['errors']:>6}")
+        if baseline is None:
+            print("\nno comparable baseline" + (" (saved this run)" if args.save_baseline else ""))
+        elif regressions:
+            print("\nregressions against baseline:")
+            for line in regressions:
+                print(f"  {line}")
+        else:
+            print("\nno regressions against baseline")
+    if regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
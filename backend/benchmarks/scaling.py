@@ -0,0 +1,110 @@
+"""Multi-worker scaling benchmark: throughput of public GETs by worker count.
+
+Run from the backend directory:
+
+    python -m benchmarks.scaling [--workers 1 2 4] [--clients 64] [--duration 10] [--json]
+
+For each worker count uvicorn is started with ``--workers N`` against one
+seeded temporary database and a fresh coordination database, then
+``--clients`` concurrent httpx clients request the public read endpoints for
+``--duration`` seconds. Scaling efficiency is requests/s relative to the
+single-worker run divided by the worker count.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from .startup import BACKEND_DIR, _free_port
+
+PATHS = ["/api/home", "/api/news", "/api/events", "/api/team", "/api/leadership", "/api/documents/categories"]
+
+def _start(workers: int, tmp_dir: str, port: int, timeout: float = 60.0) -> subprocess.Popen:
+    env = dict(os.environ)
+    env["SQLITE_DATABASE_URL"] = f"sqlite:///{tmp_dir}/scaling.db"
+    env["COORDINATION_URL"] = f"sqlite:///{tmp_dir}/coordination-{workers}.db"
+    env["WEB_CONCURRENCY"] = str(workers)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/api/health", timeout=1).status_code == 200:
+                return process
+        except httpx.TransportError:
+            pass
+        if process.poll() is not None:
+            raise RuntimeError("server exited before answering")
+        time.sleep(0.05)
+    process.terminate()
+    raise TimeoutError(f"no response within {timeout}s")
+
+async def _load(base_url: str, clients: int, duration: float) -> dict:
+    done = 0
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def client_loop(client: httpx.AsyncClient, offset: int):
+        nonlocal done, errors
+        i = offset
+        while time.perf_counter() < deadline:
+            try:
+                response = await client.get(PATHS[i % len(PATHS)])
+                if response.status_code == 200:
+                    done += 1
+                else:
+                    errors += 1
+            except httpx.TransportError:
+                errors += 1
+            i += 1
+
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(client_loop(client, n) for n in range(clients)))
+        elapsed = time.perf_counter() - started
+    return {"requests": done, "errors": errors, "rps": done / elapsed}
+
+def run(workers: int, tmp_dir: str, clients: int, duration: float) -> dict:
+    port = _free_port()
+    process = _start(workers, tmp_dir, port)
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        asyncio.run(_load(base_url, clients, min(duration, 2.0)))  # warm caches in every worker
+        return {"workers": workers, **asyncio.run(_load(base_url, clients, duration))}
+    finally:
+        process.terminate()
+        process.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results = [run(workers, tmp_dir, args.clients, args.duration) for workers in args.workers]
+    baseline = next((r["rps"] for r in results if r["workers"] == 1), results[0]["rps"] / results[0]["workers"])
+    for result in results:
+        result["efficiency"] = result["rps"] / baseline / result["workers"]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'workers':>7} {'req/s':>10} {'errors':>7} {'efficiency':>10}")
+    for r in results:
+        print(f"{r['workers']:>7} {r['rps']:>10.1f} {r['errors']:>7} {r['efficiency']:>9.0%}")
+
+if __name__ == "__main__":
+    main()
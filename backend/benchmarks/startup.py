@@ -0,0 +1,108 @@
+"""Cold-start benchmark: import profile and time-to-first-request.
+
+Run from the backend directory:
+
+    python -m benchmarks.startup [--runs 5] [--top 15] [--json]
+
+Each run starts uvicorn in a fresh process against an empty temporary
+database and polls /api/health until it answers, so the timing covers
+interpreter start, imports, lifespan startup (schema + seed) and the first
+request. ``python -X importtime`` is used for the per-module breakdown.
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def _env(tmp_dir: str) -> dict:
+    env = dict(os.environ)
+    env["SQLITE_DATABASE_URL"] = f"sqlite:///{tmp_dir}/startup.db"
+    return env
+
+def import_profile(top: int) -> list:
+    """Slowest modules by cumulative import time when importing main."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import main"],
+            cwd=BACKEND_DIR, env=_env(tmp_dir), capture_output=True, text=True, check=True
+        )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append({
+            "module": module.strip(),
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+    rows.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+    return rows[:top]
+
+def time_to_first_request(timeout: float = 60.0) -> float:
+    port = _free_port()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        started = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+            cwd=BACKEND_DIR, env=_env(tmp_dir), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            while time.perf_counter() - started < timeout:
+                try:
+                    if httpx.get(f"http://127.0.0.1:{port}/api/health", timeout=1).status_code == 200:
+                        return time.perf_counter() - started
+                except httpx.TransportError:
+                    pass
+                if process.poll() is not None:
+                    raise RuntimeError("server exited before answering")
+                time.sleep(0.01)
+            raise TimeoutError(f"no response within {timeout}s")
+        finally:
+            process.terminate()
+            process.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    imports = import_profile(args.top)
+    timings = [time_to_first_request() for _ in range(args.runs)]
+    result = {
+        "time_to_first_request_s": {
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "max": max(timings),
+            "runs": timings,
+        },
+        "slowest_imports": imports,
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    print(f"time to first request over {args.runs} runs: "
+          f"min {min(timings):.3f}s, median {statistics.median(timings):.3f}s, max {max(timings):.3f}s")
+    print("\nslowest imports (cumulative):")
+    for row in imports:
+        print(f"  {row['cumulative_ms']:9.1f} ms  {row['module']}")
+
+if __name__ == "__main__":
+    main()
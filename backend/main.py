@@ -1,47 +1,142 @@
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, PlainTextResponse, HTMLResponse
 from contextlib import asynccontextmanager
 import os
+import time
 import asyncio
+import logging
 
-from app.database import init_db, SessionLocal
-from app.routes import auth, news, events, documents, team, leadership, contact
-from app.seed_data import seed_initial_data
+from app.database import init_db, SessionLocal, start_query_stats
+from app.routes import auth, news, events, documents, team, leadership, contact, admin, home, stream
 from app.config import get_settings
+from app.services.log import setup_logging, bind_request_id, new_request_id, sampled, request_id, REQUEST_ID_HEADER
 from app.services.telegram_parser import sync_telegram_news
+from app.services.snapshots import snapshots
+from app.services.coordination import coordinator
+from app.services.profiler import profiler
+from app.services.files import cleanup as file_cleanup
+from app.services.extraction import pipeline as extraction_pipeline
+from app.services.stats import rebuild_counters
+from app.services.metrics import registry, http_request_duration, http_requests_in_flight
+from app.utils.auth import require_metrics_access
 
 settings = get_settings()
+setup_logging()
+logger = logging.getLogger("app")
 
 FRONTEND_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "frontend", "dist")
 
+TELEGRAM_SYNC_INTERVAL = 3600
+# With several workers only the holder of this lease syncs; it is renewed
+# every LEASE_RENEW_S, so another worker takes over within LEASE_TTL_S if
+# the leader dies.
+TELEGRAM_LEASE = "telegram_sync"
+LEASE_RENEW_S = 60
+LEASE_TTL_S = 180
+
 async def sync_telegram_task():
+    last_sync = None
     while True:
         try:
-            db = SessionLocal()
-            await sync_telegram_news(db)
-            db.close()
-            print("Telegram news synchronized")
+            is_leader = await asyncio.to_thread(coordinator.try_acquire_lease, TELEGRAM_LEASE, LEASE_TTL_S)
         except Exception as e:
-            print(f"Error syncing telegram: {e}")
-        await asyncio.sleep(3600)
+            logger.warning("Lease error: %s", e)
+            is_leader = False
+        if is_leader and (last_sync is None or time.monotonic() - last_sync >= TELEGRAM_SYNC_INTERVAL):
+            last_sync = time.monotonic()
+            token = bind_request_id(f"telegram-sync-{int(time.time())}")
+            try:
+                db = SessionLocal()
+                await sync_telegram_news(db)
+                db.close()
+                logger.info("Telegram news synchronized")
+            except Exception:
+                logger.exception("Error syncing telegram")
+            finally:
+                request_id.reset(token)
+        elif not is_leader:
+            last_sync = None
+        await asyncio.sleep(LEASE_RENEW_S if coordinator.multi_worker else TELEGRAM_SYNC_INTERVAL)
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    init_db()
+DOCUMENT_SCRUB_LEASE = "document_scrub"
+
+async def scrub_documents_task():
+    """Periodic report-only integrity scrub of uploaded documents (leader only)."""
+    interval = settings.document_scrub_interval_s
+    while True:
+        try:
+            if await asyncio.to_thread(coordinator.try_acquire_lease, DOCUMENT_SCRUB_LEASE, interval * 1.5):
+                token = bind_request_id(f"document-scrub-{int(time.time())}")
+                try:
+                    report = await asyncio.to_thread(admin.run_document_scrub)
+                    logger.info("Document scrub finished", extra={
+                        "scanned_files": report.scanned_files, "indexed": report.indexed,
+                        "orphans": report.orphan_count, "missing": report.missing_count,
+                        "mismatched": report.mismatch_count, "duration_ms": report.duration_ms
+                    })
+                finally:
+                    request_id.reset(token)
+        except Exception:
+            logger.exception("Document scrub error")
+        await asyncio.sleep(interval)
+
+COUNTER_RECONCILE_LEASE = "counter_reconcile"
+
+def reconcile_counters() -> None:
     db = SessionLocal()
     try:
-        seed_initial_data(db)
-        await sync_telegram_news(db)
-    except Exception as e:
-        print(f"Startup error: {e}")
+        rebuild_counters(db)
     finally:
         db.close()
-    
-    task = asyncio.create_task(sync_telegram_task())
+
+async def reconcile_counters_task():
+    """Recount the dashboard counters at startup and then periodically (leader only)."""
+    interval = settings.counter_reconcile_interval_s
+    while True:
+        try:
+            if await asyncio.to_thread(coordinator.try_acquire_lease, COUNTER_RECONCILE_LEASE, interval * 1.5):
+                token = bind_request_id(f"counter-reconcile-{int(time.time())}")
+                try:
+                    await asyncio.to_thread(reconcile_counters)
+                    logger.info("Dashboard counters reconciled")
+                finally:
+                    request_id.reset(token)
+        except Exception:
+            logger.exception("Counter reconcile error")
+        await asyncio.sleep(interval)
+
+async def deferred_startup():
+    """Work that must not delay the first request: snapshots, then Telegram sync."""
+    if snapshots.enabled:
+        try:
+            await snapshots.generate_all()
+        except Exception:
+            logger.exception("Snapshot generation error")
+    await sync_telegram_task()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # A failed migration stops startup rather than serving a half-migrated schema.
+    await asyncio.to_thread(init_db)
+
+    tasks = [
+        asyncio.create_task(deferred_startup()),
+        asyncio.create_task(file_cleanup.run_retries()),
+        asyncio.create_task(extraction_pipeline.run()),
+    ]
+    if settings.document_scrub_interval_s > 0:
+        tasks.append(asyncio.create_task(scrub_documents_task()))
+    if settings.counter_reconcile_interval_s > 0:
+        tasks.append(asyncio.create_task(reconcile_counters_task()))
+    if coordinator.multi_worker:
+        tasks.append(asyncio.create_task(coordinator.run_invalidation_listener()))
     yield
-    task.cancel()
+    for task in tasks:
+        task.cancel()
+    if coordinator.multi_worker:
+        await asyncio.to_thread(coordinator.release_lease, TELEGRAM_LEASE)
 
 app = FastAPI(
     title="FSP Chuvashia API",
@@ -58,6 +153,60 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def profiling_middleware(request: Request, call_next):
+    if not profiler.should_profile(request.headers):
+        return await call_next(request)
+    session = profiler.start()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        info = await asyncio.to_thread(profiler.stop, session, request.method, request.url.path, status_code)
+    response.headers["X-Profile-Id"] = info["id"]
+    return response
+
+@app.middleware("http")
+async def metrics_middleware(request: Request, call_next):
+    http_requests_in_flight.inc()
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        http_requests_in_flight.dec()
+        route = request.scope.get("route")
+        http_request_duration.labels(
+            request.method, getattr(route, "path", "unmatched"), status_code
+        ).observe(time.perf_counter() - started)
+
+@app.middleware("http")
+async def query_stats_middleware(request: Request, call_next):
+    stats = start_query_stats()
+    started = time.perf_counter()
+    response = await call_next(request)
+    total_ms = (time.perf_counter() - started) * 1000
+    response.headers["Server-Timing"] = f"{stats.server_timing()}, total;dur={total_ms:.1f}"
+    if response.status_code >= 500 or sampled(settings.log_request_sample_rate):
+        logger.info("request", extra={
+            "method": request.method, "path": request.url.path, "status": response.status_code,
+            "duration_ms": round(total_ms, 1), "db_queries": stats.count
+        })
+    return response
+
+@app.middleware("http")
+async def request_id_middleware(request: Request, call_next):
+    token = bind_request_id(new_request_id(request.headers.get(REQUEST_ID_HEADER)))
+    try:
+        response = await call_next(request)
+        response.headers[REQUEST_ID_HEADER] = request_id.get()
+        return response
+    finally:
+        request_id.reset(token)
+
 app.include_router(auth.router, prefix="/api")
 app.include_router(news.router, prefix="/api")
 app.include_router(events.router, prefix="/api")
@@ -65,6 +214,9 @@ app.include_router(documents.router, prefix="/api")
 app.include_router(team.router, prefix="/api")
 app.include_router(leadership.router, prefix="/api")
 app.include_router(contact.router, prefix="/api")
+app.include_router(admin.router, prefix="/api")
+app.include_router(home.router, prefix="/api")
+app.include_router(stream.router, prefix="/api")
 
 os.makedirs(settings.upload_dir, exist_ok=True)
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
@@ -74,69 +226,12 @@ app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 async def health_check():
     return {"status": "healthy", "message": "FSP Chuvashia API is running"}
 
-@app.get("/api/info")
-async def get_federation_info():
-    return {
-        "full_name": "Региональная физкультурно-спортивная общественная организация «Федерация спортивного программирования по Чувашской Республике»",
-        "short_name": "РФСОО «ФСП по Чувашской Республике»",
-        "informal_names": [
-            "Федерация спортивного программирования по Чувашской Республике",
-            "ФСП по Чувашской Республике",
-            "ФСП Чувашии"
-        ],
-        "description": "Спортивное программирование – это инновационный вид спорта, где участникам необходимо реализовать качественную программу или алгоритм в условиях ограниченного времени.",
-        "disciplines": [
-            {
-                "name": "Программирование алгоритмическое",
-                "description": "Решение группы задач путем написания наиболее оптимальных программных алгоритмов в условиях ограниченного времени.",
-                "icon": "algorithm"
-            },
-            {
-                "name": "Программирование продуктовое (хакатон)",
-                "description": "Создание программных продуктов (приложений, сайтов, сервисов), отвечающих заданным требованиям и выполняющих определенные прикладные задачи.",
-                "icon": "product"
-            },
-            {
-                "name": "Программирование систем информационной безопасности",
-                "description": "Комплекс соревнований в области кибербезопасности, включающий в себя поиск и устранение системных уязвимостей, отработку кибератак и защиты от них.",
-                "icon": "security"
-            },
-            {
-                "name": "Программирование робототехники",
-                "description": "Написание кода и поведенческих алгоритмов для автономных роботов, соревнующихся по определенным правилам.",
-                "icon": "robotics"
-            },
-            {
-                "name": "Программирование БАС",
-                "description": "Написание кода для автономного полета дрона или роя дронов, а также выполнения им поставленных задач в условиях соревновательного полигона.",
-                "icon": "drone"
-            }
-        ],
-        "history": [
-            {
-                "date": "19 октября 2021",
-                "event": "Дата основания Федерации спортивного программирования России"
-            },
-            {
-                "date": "12 апреля 2022",
-                "event": "Спортивное программирование было официально признано видом спорта"
-            },
-            {
-                "date": "28 декабря 2022",
-                "event": "Создано Региональное отделение ФСП России в Чувашии"
-            },
-            {
-                "date": "03 июля 2025",
-                "event": "ФСП Чувашии получило статус юридического лица"
-            }
-        ],
-        "contacts": {
-            "telegram": "https://t.me/fspchuv",
-            "email": "chuvashia@fsp-russia.ru"
-        }
-    }
+@app.get("/api/metrics", response_class=PlainTextResponse, dependencies=[Depends(require_metrics_access)])
+async def metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
 
 if os.path.exists(FRONTEND_DIR):
+    snapshots.configure(os.path.join(FRONTEND_DIR, "index.html"))
     app.mount("/assets", StaticFiles(directory=os.path.join(FRONTEND_DIR, "assets")), name="static_assets")
     
     @app.get("/logo.png")
@@ -148,8 +243,17 @@ if os.path.exists(FRONTEND_DIR):
         file_path = os.path.join(FRONTEND_DIR, full_path)
         if os.path.isfile(file_path):
             return FileResponse(file_path)
+        snapshot = await snapshots.get(full_path)
+        if snapshot is not None:
+            return HTMLResponse(snapshot)
         return FileResponse(os.path.join(FRONTEND_DIR, "index.html"))
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Leave logging to setup_logging(): uvicorn's loggers propagate to the JSON
+    # queue handler, and the sampled request log replaces the access log.
+    options = dict(host="0.0.0.0", port=8000, log_config=None, access_log=False)
+    if settings.workers > 1:
+        uvicorn.run("main:app", workers=settings.workers, **options)
+    else:
+        uvicorn.run(app, **options)
@@ -0,0 +1,33 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# The app reads its settings at import time, so point it at a throwaway
+# database and upload directory before anything from it is imported.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_tmp_dir = tempfile.mkdtemp(prefix="fsp-tests-")
+os.environ["SQLITE_DATABASE_URL"] = f"sqlite:///{_tmp_dir}/test.db"
+os.environ["UPLOAD_DIR"] = os.path.join(_tmp_dir, "uploads")
+os.chdir(BACKEND_DIR)
+sys.path.insert(0, BACKEND_DIR)
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+    import main
+    from app.database import init_db
+    init_db()
+    # No lifespan: background tasks (Telegram sync, extraction) stay off.
+    return TestClient(main.app)
+
+@pytest.fixture(scope="session")
+def admin_headers(client):
+    response = client.post("/api/auth/register", json={"username": "admin", "password": "secret"})
+    if response.status_code != 200:
+        response = client.post("/api/auth/login", json={"username": "admin", "password": "secret"})
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    # Loads the revocation list, so it does not count towards the first request.
+    assert client.get("/api/auth/me", headers=headers).status_code == 200
+    return headers
@@ -0,0 +1,108 @@
+"""Upgrading databases created before the migration runner existed.
+
+BASELINE_SCHEMA is what the old startup hook (Base.metadata.create_all)
+produced: no schema_version table, none of the later columns or indexes.
+Every migration has to apply on top of it.
+"""
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from app.migrations import MIGRATIONS, run_migrations
+
+BASELINE_SCHEMA = """
+CREATE TABLE admins (
+    id INTEGER NOT NULL, username VARCHAR(100), password_hash VARCHAR(255), created_at DATETIME,
+    PRIMARY KEY (id)
+);
+CREATE INDEX ix_admins_id ON admins (id);
+CREATE UNIQUE INDEX ix_admins_username ON admins (username);
+CREATE TABLE news (
+    id INTEGER NOT NULL, title VARCHAR(500), content TEXT, image_url VARCHAR(1000),
+    telegram_id VARCHAR(100), published_at DATETIME, is_visible BOOLEAN, created_at DATETIME,
+    PRIMARY KEY (id), UNIQUE (telegram_id)
+);
+CREATE INDEX ix_news_id ON news (id);
+CREATE TABLE events (
+    id INTEGER NOT NULL, title VARCHAR(500), description TEXT, event_date DATE, event_time VARCHAR(10),
+    location VARCHAR(500), event_type VARCHAR(100), is_visible BOOLEAN, created_at DATETIME,
+    PRIMARY KEY (id)
+);
+CREATE INDEX ix_events_id ON events (id);
+CREATE INDEX ix_events_event_date ON events (event_date);
+CREATE TABLE document_categories (
+    id INTEGER NOT NULL, name VARCHAR(200), parent_id INTEGER, "order" INTEGER, created_at DATETIME,
+    PRIMARY KEY (id), FOREIGN KEY(parent_id) REFERENCES document_categories (id)
+);
+CREATE INDEX ix_document_categories_id ON document_categories (id);
+CREATE TABLE documents (
+    id INTEGER NOT NULL, title VARCHAR(500), filename VARCHAR(500), file_path VARCHAR(1000),
+    file_size INTEGER, category_id INTEGER, "order" INTEGER, is_visible BOOLEAN, created_at DATETIME,
+    PRIMARY KEY (id), FOREIGN KEY(category_id) REFERENCES document_categories (id)
+);
+CREATE INDEX ix_documents_id ON documents (id);
+CREATE TABLE team_members (
+    id INTEGER NOT NULL, full_name VARCHAR(300), position VARCHAR(200), city VARCHAR(200),
+    category VARCHAR(100), discipline VARCHAR(200), photo_url VARCHAR(1000), "order" INTEGER,
+    is_visible BOOLEAN, created_at DATETIME,
+    PRIMARY KEY (id)
+);
+CREATE INDEX ix_team_members_id ON team_members (id);
+CREATE TABLE leadership_members (
+    id INTEGER NOT NULL, full_name VARCHAR(300), position VARCHAR(300), description TEXT,
+    photo_url VARCHAR(1000), "order" INTEGER, is_visible BOOLEAN, created_at DATETIME,
+    PRIMARY KEY (id)
+);
+CREATE INDEX ix_leadership_members_id ON leadership_members (id);
+CREATE TABLE contact_messages (
+    id INTEGER NOT NULL, name VARCHAR(200), email VARCHAR(200), subject VARCHAR(500), message TEXT,
+    is_read BOOLEAN, created_at DATETIME,
+    PRIMARY KEY (id)
+);
+CREATE INDEX ix_contact_messages_id ON contact_messages (id);
+CREATE TABLE content_counters (
+    entity VARCHAR(50) NOT NULL, total INTEGER, hidden INTEGER, unread INTEGER,
+    PRIMARY KEY (entity)
+);
+CREATE TABLE activity_log (
+    id INTEGER NOT NULL, entity VARCHAR(50), entity_id INTEGER, action VARCHAR(50), title VARCHAR(500),
+    created_at DATETIME,
+    PRIMARY KEY (id)
+);
+CREATE INDEX ix_activity_log_id ON activity_log (id);
+CREATE TABLE app_state (
+    "key" VARCHAR(100) NOT NULL, value VARCHAR(500), updated_at DATETIME,
+    PRIMARY KEY ("key")
+);
+"""
+
+@pytest.fixture
+def baseline_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/baseline.db")
+    with engine.begin() as conn:
+        for statement in BASELINE_SCHEMA.split(";"):
+            if statement.strip():
+                conn.exec_driver_sql(statement)
+    yield engine
+    engine.dispose()
+
+def _indexes(engine, table):
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+@pytest.mark.parametrize("seeded", [False, True])
+def test_upgrade_baseline_database(baseline_engine, seeded):
+    if seeded:
+        with baseline_engine.begin() as conn:
+            conn.execute(text("INSERT INTO app_state (key, value) VALUES ('initial_data_seeded', '1')"))
+            conn.execute(text("INSERT INTO events (title, event_date, is_visible) VALUES ('Старт', '2030-05-01', 1)"))
+
+    assert run_migrations(baseline_engine) == [migration.version for migration in MIGRATIONS]
+
+    assert "ix_news_published_at" in _indexes(baseline_engine, "news")
+    assert {"ix_events_event_date", "ix_events_recurrence"} <= _indexes(baseline_engine, "events")
+    assert {"ix_documents_category_id", "ix_documents_text_status"} <= _indexes(baseline_engine, "documents")
+    assert {"ix_team_members_category", "ix_team_members_discipline"} <= _indexes(baseline_engine, "team_members")
+    with baseline_engine.connect() as conn:
+        counters = dict(conn.execute(text("SELECT entity, total FROM content_counters")).all())
+    if seeded:
+        assert counters["events"] == 1
+    assert run_migrations(baseline_engine) == []
@@ -0,0 +1,112 @@
+"""Statements issued by each admin write endpoint, and by the category tree.
+
+Writes go through services.crud: one INSERT/UPDATE ... RETURNING or DELETE by
+primary key, never a follow-up SELECT or refresh. Counted content tables also
+update their dashboard counter and append to the activity log in the same
+transaction. Every request starts with the admin lookup in get_current_admin.
+"""
+import pytest
+from sqlalchemy import event
+
+from app.database import engine
+
+@pytest.fixture
+def statements():
+    recorded = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(" ".join(statement.split()[:3]))
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield recorded
+    event.remove(engine, "before_cursor_execute", record)
+
+def _expect(recorded, *prefixes):
+    assert len(recorded) == len(prefixes), recorded
+    for statement, prefix in zip(recorded, prefixes):
+        assert statement.startswith(prefix), recorded
+
+AUTH = "SELECT admins.id"
+COUNTER = "UPDATE content_counters"
+ACTIVITY = "INSERT INTO activity_log"
+
+RESOURCES = [
+    ("news", "news", {"title": "Новость", "content": "Текст"}),
+    ("events", "events", {"title": "Соревнование", "event_date": "2030-05-01"}),
+    ("team", "team_members", {"full_name": "Иванов Иван", "category": "adult"}),
+    ("leadership", "leadership_members", {"full_name": "Петров Пётр", "position": "Председатель"}),
+]
+
+@pytest.mark.parametrize("path, table, payload", RESOURCES)
+def test_create(client, admin_headers, statements, path, table, payload):
+    response = client.post(f"/api/{path}", json=payload, headers=admin_headers)
+    assert response.status_code == 200
+    _expect(statements, AUTH, f"INSERT INTO {table}", COUNTER, ACTIVITY)
+
+@pytest.mark.parametrize("path, table, payload", RESOURCES)
+def test_update(client, admin_headers, statements, path, table, payload):
+    item_id = client.post(f"/api/{path}", json=payload, headers=admin_headers).json()["id"]
+    statements.clear()
+    response = client.put(f"/api/{path}/{item_id}", json={"full_name" if "full_name" in payload else "title": "Изменено"},
+                          headers=admin_headers)
+    assert response.status_code == 200
+    _expect(statements, AUTH, f"UPDATE {table}", ACTIVITY)
+
+@pytest.mark.parametrize("path, table, payload", RESOURCES)
+def test_update_visibility(client, admin_headers, statements, path, table, payload):
+    item_id = client.post(f"/api/{path}", json=payload, headers=admin_headers).json()["id"]
+    statements.clear()
+    response = client.put(f"/api/{path}/{item_id}", json={"is_visible": False}, headers=admin_headers)
+    assert response.status_code == 200
+    # The visible counter moves before the row changes, from the row's current state.
+    _expect(statements, AUTH, COUNTER, f"UPDATE {table}", ACTIVITY)
+
+@pytest.mark.parametrize("path, table, payload", RESOURCES)
+def test_delete(client, admin_headers, statements, path, table, payload):
+    item_id = client.post(f"/api/{path}", json=payload, headers=admin_headers).json()["id"]
+    statements.clear()
+    response = client.delete(f"/api/{path}/{item_id}", headers=admin_headers)
+    assert response.status_code == 200
+    _expect(statements, AUTH, f"DELETE FROM {table}", COUNTER, ACTIVITY)
+
+def test_delete_missing(client, admin_headers, statements):
+    response = client.delete("/api/news/999999", headers=admin_headers)
+    assert response.status_code == 404
+    _expect(statements, AUTH, "DELETE FROM news")
+
+def test_category_write(client, admin_headers, statements):
+    response = client.post("/api/documents/categories", json={"name": "Положения"}, headers=admin_headers)
+    assert response.status_code == 200
+    # The two SELECTs load the new category's (empty) documents and children for the response.
+    _expect(statements, AUTH, "INSERT INTO document_categories", "SELECT", "SELECT")
+    category_id = response.json()["id"]
+
+    statements.clear()
+    assert client.put(f"/api/documents/categories/{category_id}", json={"name": "Регламенты"},
+                      headers=admin_headers).status_code == 200
+    _expect(statements, AUTH, "UPDATE document_categories", "SELECT", "SELECT")
+
+    statements.clear()
+    assert client.delete(f"/api/documents/categories/{category_id}", headers=admin_headers).status_code == 200
+    # Emptiness checks for documents and subcategories, then the delete.
+    _expect(statements, AUTH, "SELECT", "SELECT", "DELETE FROM document_categories")
+
+def test_category_tree(client, admin_headers, statements):
+    root = client.post("/api/documents/categories", json={"name": "Корень", "order": -1}, headers=admin_headers).json()
+    child = client.post("/api/documents/categories", json={"name": "Раздел", "parent_id": root["id"]},
+                        headers=admin_headers).json()
+    leaf = client.post("/api/documents/categories", json={"name": "Подраздел", "parent_id": child["id"]},
+                       headers=admin_headers).json()
+    uploaded = client.post("/api/documents", data={"title": "Устав", "category_id": str(leaf["id"])},
+                           files={"file": ("ustav.txt", b"text", "text/plain")}, headers=admin_headers)
+    assert uploaded.status_code == 200
+    client.get("/api/documents/categories")  # loads the documents projection
+
+    statements.clear()
+    response = client.get("/api/documents/categories")
+    assert response.status_code == 200
+    _expect(statements, "SELECT document_categories.id")
+    tree = next(node for node in response.json() if node["id"] == root["id"])
+    assert [node["id"] for node in tree["children"]] == [child["id"]]
+    assert [node["id"] for node in tree["children"][0]["children"]] == [leaf["id"]]
+    assert [doc["id"] for doc in tree["children"][0]["children"][0]["documents"]] == [uploaded.json()["id"]]
@@ -6,7 +6,7 @@ import {
   MessageSquare, LogOut, Menu, X, Sun, Moon, ChevronRight
 } from 'lucide-react'
 import { useTheme } from '../context/ThemeContext'
-import { authAPI } from '../utils/api'
+import { authAPI, clearTokens } from '../utils/api'
 import { cn } from '../utils/cn'
 import logoImage from '@assets/лого_1764723945323.png'
 
@@ -47,15 +47,20 @@ export default function AdminLayout() {
       await authAPI.me()
       setIsAuthenticated(true)
     } catch (error) {
-      localStorage.removeItem('admin_token')
+      clearTokens()
       navigate('/admin/login')
     } finally {
       setLoading(false)
     }
   }
 
-  const handleLogout = () => {
-    localStorage.removeItem('admin_token')
+  const handleLogout = async () => {
+    try {
+      await authAPI.logout()
+    } catch (error) {
+      // the session is dropped locally either way
+    }
+    clearTokens()
     navigate('/admin/login')
   }
 
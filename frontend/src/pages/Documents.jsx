@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react'
 import { motion, AnimatePresence } from 'framer-motion'
-import { FileText, Download, Folder, FolderOpen, ChevronDown, File } from 'lucide-react'
+import { FileText, Download, Folder, FolderOpen, ChevronDown, File, Search } from 'lucide-react'
 import { documentsAPI } from '../utils/api'
 import SectionTitle from '../components/SectionTitle'
 
@@ -103,6 +103,14 @@ function CategoryItem({ category, level = 0 }) {
                   </a>
                 </motion.div>
               ))}
+
+              <a
+                href={`/api/documents/categories/${category.id}/archive`}
+                className="inline-flex items-center gap-2 py-2 text-sm text-dark-500 hover:text-primary-500 transition-colors"
+              >
+                <Download className="w-4 h-4" />
+                Скачать всё (ZIP)
+              </a>
             </div>
           </motion.div>
         )}
@@ -111,9 +119,77 @@ function CategoryItem({ category, level = 0 }) {
   )
 }
 
+function SearchResults({ results }) {
+  if (results.length === 0) {
+    return (
+      <p className="text-center py-12 text-dark-600 dark:text-dark-400">
+        Ничего не найдено
+      </p>
+    )
+  }
+
+  return (
+    <div className="space-y-3">
+      {results.map((doc) => (
+        <a
+          key={doc.id}
+          href={`/api/documents/${doc.id}/download`}
+          className="flex items-start gap-4 p-4 rounded-xl bg-white dark:bg-dark-800/50 border border-dark-200/50 dark:border-dark-700/50 hover:border-primary-500/50 transition-all group"
+        >
+          {doc.thumbnail_path ? (
+            <img
+              src={`/api/documents/${doc.id}/thumbnail`}
+              alt=""
+              loading="lazy"
+              className="w-12 h-16 object-cover rounded border border-dark-200 dark:border-dark-700 flex-shrink-0"
+            />
+          ) : (
+            <div className="w-10 h-10 rounded-lg bg-dark-100 dark:bg-dark-700 flex items-center justify-center flex-shrink-0">
+              <File className="w-5 h-5 text-dark-500 dark:text-dark-400" />
+            </div>
+          )}
+          <div className="flex-grow min-w-0">
+            <p className="font-medium text-dark-900 dark:text-white group-hover:text-primary-600 dark:group-hover:text-primary-400 transition-colors">
+              {doc.title}
+            </p>
+            {doc.snippet && (
+              <p className="text-sm text-dark-600 dark:text-dark-400 mt-1 line-clamp-2">{doc.snippet}</p>
+            )}
+            <p className="text-xs text-dark-500 mt-1">
+              {doc.filename}
+              {doc.page_count && ` • ${doc.page_count} стр.`}
+              {doc.file_size && ` • ${formatFileSize(doc.file_size)}`}
+            </p>
+          </div>
+          <Download className="w-5 h-5 text-dark-400 group-hover:text-primary-500 transition-colors flex-shrink-0" />
+        </a>
+      ))}
+    </div>
+  )
+}
+
 export default function Documents() {
   const [categories, setCategories] = useState([])
   const [loading, setLoading] = useState(true)
+  const [query, setQuery] = useState('')
+  const [results, setResults] = useState(null)
+
+  useEffect(() => {
+    const q = query.trim()
+    if (q.length < 2) {
+      setResults(null)
+      return
+    }
+    const timer = setTimeout(async () => {
+      try {
+        const response = await documentsAPI.search(q)
+        setResults(response.data)
+      } catch (error) {
+        console.error('Error searching documents:', error)
+      }
+    }, 300)
+    return () => clearTimeout(timer)
+  }, [query])
 
   useEffect(() => {
     const fetchCategories = async () => {
@@ -152,7 +228,20 @@ export default function Documents() {
 
       <section className="section-padding bg-white dark:bg-dark-950">
         <div className="container-custom max-w-4xl">
-          {loading ? (
+          <div className="relative mb-8">
+            <Search className="absolute left-4 top-1/2 -translate-y-1/2 w-5 h-5 text-dark-400" />
+            <input
+              type="search"
+              value={query}
+              onChange={(e) => setQuery(e.target.value)}
+              placeholder="Поиск по названию и тексту документов"
+              className="w-full pl-12 pr-4 py-3 rounded-xl bg-dark-50 dark:bg-dark-800/50 border border-dark-200 dark:border-dark-700 focus:border-primary-500 focus:outline-none text-dark-900 dark:text-white"
+            />
+          </div>
+
+          {results ? (
+            <SearchResults results={results} />
+          ) : loading ? (
             <div className="flex justify-center py-20">
               <div className="w-12 h-12 border-4 border-primary-500/20 border-t-primary-500 rounded-full animate-spin" />
             </div>
@@ -1,7 +1,7 @@
 import { useState, useEffect } from 'react'
 import { motion } from 'framer-motion'
 import { Calendar, MapPin, Clock, ChevronLeft, ChevronRight, CalendarDays } from 'lucide-react'
-import { eventsAPI } from '../utils/api'
+import { eventsAPI, subscribeUpdates } from '../utils/api'
 import { format, startOfMonth, endOfMonth, eachDayOfInterval, isSameDay, addMonths, subMonths, isToday } from 'date-fns'
 import { ru } from 'date-fns/locale'
 import { cn } from '../utils/cn'
@@ -12,6 +12,9 @@ export default function Events() {
   const [loading, setLoading] = useState(true)
   const [currentMonth, setCurrentMonth] = useState(new Date())
   const [selectedDate, setSelectedDate] = useState(null)
+  const [version, setVersion] = useState(0)
+
+  useEffect(() => subscribeUpdates({ events: () => setVersion((v) => v + 1) }), [])
 
   useEffect(() => {
     const fetchEvents = async () => {
@@ -28,7 +31,7 @@ export default function Events() {
       }
     }
     fetchEvents()
-  }, [currentMonth])
+  }, [currentMonth, version])
 
   const monthStart = startOfMonth(currentMonth)
   const monthEnd = endOfMonth(currentMonth)
@@ -68,6 +71,13 @@ export default function Events() {
             <p className="text-dark-600 dark:text-dark-400 max-w-2xl mx-auto text-lg -mt-8">
               Соревнования, турниры и события федерации спортивного программирования
             </p>
+            <a
+              href="/api/events.ics"
+              className="inline-flex items-center gap-2 mt-6 text-primary-500 hover:text-primary-600 font-medium"
+            >
+              <CalendarDays className="w-5 h-5" />
+              Подписаться на календарь
+            </a>
           </motion.div>
         </div>
       </section>
@@ -199,7 +209,7 @@ export default function Events() {
                   <div className="space-y-4">
                     {selectedEvents.map((event, index) => (
                       <motion.div
-                        key={event.id}
+                        key={`${event.id}-${event.event_date}`}
                         initial={{ opacity: 0, x: 20 }}
                         animate={{ opacity: 1, x: 0 }}
                         transition={{ delay: index * 0.05 }}
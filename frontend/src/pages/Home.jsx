@@ -5,7 +5,7 @@ import {
   ArrowRight, Calendar, ChevronRight, Newspaper,
   Cpu, Database, Shield, Cog, Rocket
 } from 'lucide-react'
-import { infoAPI, eventsAPI, newsAPI } from '../utils/api'
+import { homeAPI, subscribeUpdates } from '../utils/api'
 import { format } from 'date-fns'
 import { ru } from 'date-fns/locale'
 import SectionTitle from '../components/SectionTitle'
@@ -65,18 +65,20 @@ export default function Home() {
   const [events, setEvents] = useState([])
   const [news, setNews] = useState([])
   const [loading, setLoading] = useState(true)
+  const [version, setVersion] = useState(0)
+
+  useEffect(() => {
+    const refresh = () => setVersion((v) => v + 1)
+    return subscribeUpdates({ news: refresh, events: refresh })
+  }, [])
 
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [infoRes, eventsRes, newsRes] = await Promise.all([
-          infoAPI.get(),
-          eventsAPI.getUpcoming(3),
-          newsAPI.getAll({ limit: 4 })
-        ])
-        setInfo(infoRes.data)
-        setEvents(eventsRes.data)
-        setNews(newsRes.data)
+        const response = await homeAPI.get()
+        setInfo(response.data.info)
+        setEvents(response.data.upcoming_events)
+        setNews(response.data.latest_news)
       } catch (error) {
         console.error('Error fetching data:', error)
       } finally {
@@ -84,7 +86,7 @@ export default function Home() {
       }
     }
     fetchData()
-  }, [])
+  }, [version])
 
   const scrollToAbout = () => {
     document.getElementById('disciplines')?.scrollIntoView({ behavior: 'smooth' })
@@ -317,7 +319,7 @@ export default function Home() {
             <div className="grid md:grid-cols-3 gap-6">
               {events.map((event, index) => (
                 <motion.div
-                  key={event.id}
+                  key={`${event.id}-${event.event_date}`}
                   initial={{ opacity: 0, y: 20 }}
                   whileInView={{ opacity: 1, y: 0 }}
                   viewport={{ once: true }}
@@ -2,7 +2,7 @@ import { useState, useEffect } from 'react'
 import { Link } from 'react-router-dom'
 import { motion } from 'framer-motion'
 import { Newspaper, Calendar, ArrowRight, ExternalLink } from 'lucide-react'
-import { newsAPI } from '../utils/api'
+import { newsAPI, subscribeUpdates } from '../utils/api'
 import { format } from 'date-fns'
 import { ru } from 'date-fns/locale'
 import SectionTitle from '../components/SectionTitle'
@@ -18,6 +18,8 @@ export default function News() {
     fetchNews()
   }, [])
 
+  useEffect(() => subscribeUpdates({ news: () => fetchNews() }), [])
+
   const fetchNews = async (loadMore = false) => {
     try {
       const skip = loadMore ? news.length : 0
@@ -113,14 +113,14 @@ function CollapsibleTeamSection({ title, discipline, members, isMainRoster, defa
 }
 
 export default function Team() {
-  const [members, setMembers] = useState([])
+  const [groups, setGroups] = useState([])
   const [loading, setLoading] = useState(true)
 
   useEffect(() => {
     const fetchMembers = async () => {
       try {
-        const response = await teamAPI.getAll()
-        setMembers(response.data)
+        const response = await teamAPI.getGrouped()
+        setGroups(response.data.groups)
       } catch (error) {
         console.error('Error fetching team:', error)
       } finally {
@@ -130,13 +130,6 @@ export default function Team() {
     fetchMembers()
   }, [])
 
-  const groupedMembers = members.reduce((acc, member) => {
-    const key = `${member.category} | ${member.discipline}`
-    if (!acc[key]) acc[key] = []
-    acc[key].push(member)
-    return acc
-  }, {})
-
   const hasJuniors = (groupMembers) => {
     return groupMembers.some(m => m.position?.toLowerCase().includes('юниор'))
   }
@@ -171,8 +164,7 @@ export default function Team() {
             </div>
           ) : (
             <div className="space-y-6 max-w-5xl mx-auto">
-              {Object.entries(groupedMembers).map(([group, groupMembers], groupIndex) => {
-                const [category, discipline] = group.split(' | ')
+              {groups.map(({ category, discipline, members: groupMembers }, groupIndex) => {
                 const isMainRoster = category.includes('Основной')
                 const isJuniorTeam = hasJuniors(groupMembers)
                 
@@ -182,7 +174,7 @@ export default function Team() {
 
                 return (
                   <CollapsibleTeamSection
-                    key={group}
+                    key={`${category} | ${discipline}`}
                     title={displayTitle}
                     discipline={discipline}
                     members={groupMembers}
@@ -192,7 +184,7 @@ export default function Team() {
                 )
               })}
 
-              {members.length === 0 && (
+              {groups.length === 0 && (
                 <div className="text-center py-20">
                   <Users className="w-16 h-16 text-dark-300 dark:text-dark-600 mx-auto mb-4" />
                   <p className="text-dark-500 dark:text-dark-400">
@@ -5,7 +5,7 @@ import {
   Newspaper, Calendar, FileText, Users, Crown, MessageSquare,
   TrendingUp, ArrowRight, Clock
 } from 'lucide-react'
-import { newsAPI, eventsAPI, teamAPI, leadershipAPI, contactAPI } from '../../utils/api'
+import { adminAPI } from '../../utils/api'
 
 export default function AdminDashboard() {
   const [stats, setStats] = useState({
@@ -13,6 +13,7 @@ export default function AdminDashboard() {
     events: 0,
     team: 0,
     leadership: 0,
+    documents: 0,
     messages: 0,
     unreadMessages: 0
   })
@@ -24,21 +25,18 @@ export default function AdminDashboard() {
 
   const fetchStats = async () => {
     try {
-      const [newsRes, eventsRes, teamRes, leadershipRes, messagesRes] = await Promise.all([
-        newsAPI.getAll({ limit: 1000, include_hidden: true }),
-        eventsAPI.getAll({ limit: 1000, include_hidden: true }),
-        teamAPI.getAll({ include_hidden: true }),
-        leadershipAPI.getAll({ include_hidden: true }),
-        contactAPI.getAll({ limit: 1000 })
-      ])
+      const response = await adminAPI.stats()
+      const counters = response.data.counters
+      const total = (entity) => counters[entity]?.total ?? 0
 
       setStats({
-        news: newsRes.data.length,
-        events: eventsRes.data.length,
-        team: teamRes.data.length,
-        leadership: leadershipRes.data.length,
-        messages: messagesRes.data.length,
-        unreadMessages: messagesRes.data.filter(m => !m.is_read).length
+        news: total('news'),
+        events: total('events'),
+        team: total('team_members'),
+        leadership: total('leadership_members'),
+        documents: total('documents'),
+        messages: total('contact_messages'),
+        unreadMessages: counters.contact_messages?.unread ?? 0
       })
     } catch (error) {
       console.error('Error fetching stats:', error)
@@ -60,7 +58,7 @@ export default function AdminDashboard() {
       href: '/admin/messages',
       color: 'from-rose-500 to-red-500'
     },
-    { name: 'Документы', value: '-', icon: FileText, href: '/admin/documents', color: 'from-amber-500 to-orange-500' },
+    { name: 'Документы', value: stats.documents, icon: FileText, href: '/admin/documents', color: 'from-amber-500 to-orange-500' },
   ]
 
   return (
@@ -39,10 +39,11 @@ export default function AdminEvents() {
         event_time: item.event_time || '',
         location: item.location || '',
         event_type: item.event_type || '',
+        recurrence: item.recurrence || '',
         is_visible: item.is_visible
       })
     } else {
-      reset({ title: '', description: '', event_date: '', event_time: '', location: '', event_type: '', is_visible: true })
+      reset({ title: '', description: '', event_date: '', event_time: '', location: '', event_type: '', recurrence: '', is_visible: true })
     }
     setShowModal(true)
   }
@@ -136,6 +137,7 @@ export default function AdminEvents() {
               </div>
               <div><label className="block text-sm font-medium mb-2">Место проведения</label><input {...register('location')} className="input-field" placeholder="Город, место" /></div>
               <div><label className="block text-sm font-medium mb-2">Тип мероприятия</label><input {...register('event_type')} className="input-field" placeholder="Соревнование, мастер-класс..." /></div>
+              <div><label className="block text-sm font-medium mb-2">Повторение</label><input {...register('recurrence')} className="input-field" placeholder="FREQ=WEEKLY;BYDAY=MO,TH" /><p className="text-xs text-dark-500 mt-1">Правило RRULE: DAILY, WEEKLY (BYDAY), MONTHLY, YEARLY; INTERVAL, COUNT или UNTIL=ГГГГММДД</p></div>
               <label className="flex items-center gap-3 cursor-pointer"><input type="checkbox" {...register('is_visible')} className="w-5 h-5 rounded border-dark-300 text-primary-500 focus:ring-primary-500" /><span className="text-sm">Показывать на сайте</span></label>
               <div className="flex gap-3 pt-4"><button type="button" onClick={closeModal} className="btn-secondary flex-1">Отмена</button><button type="submit" disabled={isSubmitting} className="btn-primary flex-1">{isSubmitting ? <Loader2 className="w-5 h-5 animate-spin" /> : 'Сохранить'}</button></div>
             </form>
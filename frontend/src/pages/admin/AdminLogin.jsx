@@ -3,7 +3,7 @@ import { useNavigate } from 'react-router-dom'
 import { motion } from 'framer-motion'
 import { useForm } from 'react-hook-form'
 import { Lock, User, AlertCircle, Loader2, ArrowLeft } from 'lucide-react'
-import { authAPI } from '../../utils/api'
+import { authAPI, storeTokens, clearTokens } from '../../utils/api'
 import { cn } from '../../utils/cn'
 import logoImage from '@assets/лого_1764723945323.png'
 
@@ -25,7 +25,7 @@ export default function AdminLogin() {
     if (token) {
       authAPI.me()
         .then(() => navigate('/admin'))
-        .catch(() => localStorage.removeItem('admin_token'))
+        .catch(clearTokens)
         .finally(() => setCheckingAuth(false))
     } else {
       setCheckingAuth(false)
@@ -41,7 +41,7 @@ export default function AdminLogin() {
         ? await authAPI.login(data)
         : await authAPI.register(data)
       
-      localStorage.setItem('admin_token', response.data.access_token)
+      storeTokens(response.data)
       navigate('/admin')
     } catch (err) {
       const message = err.response?.data?.detail || 'Произошла ошибка'
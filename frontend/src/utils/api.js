@@ -15,11 +15,51 @@ api.interceptors.request.use((config) => {
   return config
 })
 
+export const storeTokens = ({ access_token, refresh_token }) => {
+  localStorage.setItem('admin_token', access_token)
+  if (refresh_token) {
+    localStorage.setItem('admin_refresh_token', refresh_token)
+  }
+}
+
+export const clearTokens = () => {
+  localStorage.removeItem('admin_token')
+  localStorage.removeItem('admin_refresh_token')
+}
+
+// Access tokens are short-lived: on a 401 the refresh token is exchanged once
+// (concurrent failures share the same request) and the original request is
+// retried. Refresh tokens are single-use, so the new pair replaces the old.
+let refreshing = null
+
+const refreshTokens = () => {
+  if (!refreshing) {
+    const refresh_token = localStorage.getItem('admin_refresh_token')
+    refreshing = (refresh_token
+      ? axios.post('/api/auth/refresh', { refresh_token }).then((response) => storeTokens(response.data))
+      : Promise.reject(new Error('No refresh token'))
+    ).finally(() => { refreshing = null })
+  }
+  return refreshing
+}
+
+const NO_REFRESH = ['/auth/login', '/auth/register', '/auth/refresh']
+
 api.interceptors.response.use(
   (response) => response,
-  (error) => {
+  async (error) => {
+    const config = error.config
     if (error.response?.status === 401) {
-      localStorage.removeItem('admin_token')
+      if (config && !config._retried && !NO_REFRESH.includes(config.url)) {
+        config._retried = true
+        try {
+          await refreshTokens()
+          return api(config)
+        } catch {
+          // fall through to the login page
+        }
+      }
+      clearTokens()
       window.location.href = '/admin/login'
     }
     return Promise.reject(error)
@@ -29,6 +69,8 @@ api.interceptors.response.use(
 export const authAPI = {
   login: (data) => api.post('/auth/login', data),
   register: (data) => api.post('/auth/register', data),
+  refresh: (refresh_token) => api.post('/auth/refresh', { refresh_token }),
+  logout: () => api.post('/auth/logout'),
   me: () => api.get('/auth/me'),
 }
 
@@ -38,15 +80,19 @@ export const newsAPI = {
   create: (data) => api.post('/news', data),
   update: (id, data) => api.put(`/news/${id}`, data),
   delete: (id) => api.delete(`/news/${id}`),
+  batch: (operations) => api.post('/news/batch', { operations }),
+  export: (params) => api.get('/news/export', { params, responseType: 'blob' }),
 }
 
 export const eventsAPI = {
   getAll: (params) => api.get('/events', { params }),
   getUpcoming: (limit = 5) => api.get('/events/upcoming', { params: { limit } }),
+  getCalendar: (params) => api.get('/events/calendar', { params }),
   getOne: (id) => api.get(`/events/${id}`),
   create: (data) => api.post('/events', data),
   update: (id, data) => api.put(`/events/${id}`, data),
   delete: (id) => api.delete(`/events/${id}`),
+  batch: (operations) => api.post('/events/batch', { operations }),
 }
 
 export const documentsAPI = {
@@ -56,18 +102,27 @@ export const documentsAPI = {
   updateCategory: (id, data) => api.put(`/documents/categories/${id}`, data),
   deleteCategory: (id) => api.delete(`/documents/categories/${id}`),
   getAll: (params) => api.get('/documents', { params }),
+  search: (q) => api.get('/documents/search', { params: { q } }),
   upload: (formData) => api.post('/documents', formData, {
     headers: { 'Content-Type': 'multipart/form-data' }
   }),
+  bulkUpload: (formData, onUploadProgress) => api.post('/documents/bulk', formData, {
+    headers: { 'Content-Type': 'multipart/form-data' },
+    onUploadProgress,
+  }),
+  uploadProgress: (uploadId) => api.get(`/documents/uploads/${uploadId}`),
   delete: (id) => api.delete(`/documents/${id}`),
+  batch: (operations) => api.post('/documents/batch', { operations }),
 }
 
 export const teamAPI = {
   getAll: (params) => api.get('/team', { params }),
+  getGrouped: (params) => api.get('/team/grouped', { params }),
   getOne: (id) => api.get(`/team/${id}`),
   create: (data) => api.post('/team', data),
   update: (id, data) => api.put(`/team/${id}`, data),
   delete: (id) => api.delete(`/team/${id}`),
+  batch: (operations) => api.post('/team/batch', { operations }),
 }
 
 export const leadershipAPI = {
@@ -76,6 +131,7 @@ export const leadershipAPI = {
   create: (data) => api.post('/leadership', data),
   update: (id, data) => api.put(`/leadership/${id}`, data),
   delete: (id) => api.delete(`/leadership/${id}`),
+  batch: (operations) => api.post('/leadership/batch', { operations }),
 }
 
 export const contactAPI = {
@@ -83,10 +139,30 @@ export const contactAPI = {
   getAll: (params) => api.get('/contact', { params }),
   markRead: (id) => api.put(`/contact/${id}/read`),
   delete: (id) => api.delete(`/contact/${id}`),
+  batch: (operations) => api.post('/contact/batch', { operations }),
+  export: (params) => api.get('/contact/export', { params, responseType: 'blob' }),
+}
+
+export const adminAPI = {
+  stats: () => api.get('/admin/stats'),
 }
 
 export const infoAPI = {
   get: () => api.get('/info'),
 }
 
+export const homeAPI = {
+  get: () => api.get('/home'),
+}
+
+// Live updates over SSE: handlers by event name ('news', 'events'), each
+// called with { action, ids }. Returns a function that closes the stream.
+export function subscribeUpdates(handlers) {
+  const source = new EventSource('/api/stream')
+  Object.entries(handlers).forEach(([type, handler]) => {
+    source.addEventListener(type, (event) => handler(JSON.parse(event.data)))
+  })
+  return () => source.close()
+}
+
 export default api